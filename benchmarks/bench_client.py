@@ -0,0 +1,112 @@
+"""
+Throughput of a NotionClient shared by many threads, against a local stand-in of the API
+
+Usage
+-----
+    python benchmarks/bench_client.py                      # 1 to 32 threads, no rate limit
+    python benchmarks/bench_client.py --rate-limit 100     # throughput levels off at the rate limit
+    python benchmarks/bench_client.py --slow 0.02 --hedge-percentile 0.95  # p99 with hedged reads
+
+The stand-in answers every request after `--latency` seconds, so throughput should grow
+linearly with threads (threads / latency) until it reaches the rate limit of the client.
+With `--slow`, that fraction of responses takes ten times longer, which hedging should hide from p99.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from notion_extensions.base.client import NotionClient  # noqa: E402
+
+
+def _handler(latency: float, slow: float) -> type:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep connections alive
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:
+            time.sleep(latency * 10 if random.random() < slow else latency)
+            body = json.dumps({"object": "block", "id": self.path.rsplit("/", 1)[-1]}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+    return Handler
+
+
+def run(client: NotionClient, threads: int, requests_per_thread: int) -> Tuple[float, float]:
+    """
+    Return requests per second of `threads` threads sharing client, and p99 seconds of a request
+    """
+    latencies: List[float] = []
+
+    def work() -> None:
+        for i in range(requests_per_thread):
+            start = time.perf_counter()
+            client.get_block(block_id=f"{threading.get_ident():016x}{i:016x}")  # not coalesced
+            latencies.append(time.perf_counter() - start)
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    rate = threads * requests_per_thread / (time.perf_counter() - start)
+    latencies.sort()
+    return rate, latencies[int(0.99 * (len(latencies) - 1))]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds of each response, default=0.05")
+    parser.add_argument("--rate-limit", type=float, default=None)
+    parser.add_argument("--slow", type=float, default=0.0, help="fraction of slow responses, default=0")
+    parser.add_argument("--hedge-percentile", type=float, default=None)
+    parser.add_argument("--requests", type=int, default=20, help="requests per thread, default=20")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    args = parser.parse_args(argv)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _handler(args.latency, args.slow))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    try:
+        with NotionClient(
+            key="secret",
+            base_url=base_url,
+            rate_limit=args.rate_limit,
+            hedge_percentile=args.hedge_percentile,
+        ) as client:
+            for threads in args.threads:
+                if client.limiter is not None:
+                    client.limiter.acquire(client.limiter.burst)  # measure the steady state
+                rate, p99 = run(client, threads, args.requests)
+                ideal = threads / args.latency
+                if args.rate_limit is not None:
+                    ideal = min(ideal, args.rate_limit)
+                print(
+                    f"threads={threads:<4} {rate:>8.1f} req/s  ({rate / ideal:.0%} of {ideal:.0f} req/s)"
+                    f"  p99={p99 * 1e3:.0f} ms"
+                )
+            if client.hedger is not None:
+                print(f"hedger: {client.hedger.stats}")
+    finally:
+        server.shutdown()
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""
+Benchmarks for the import time of `notion_extensions`
+
+Usage
+-----
+    python benchmarks/bench_import.py          # run and compare with the stored baseline
+    python benchmarks/bench_import.py --save   # run and overwrite the stored baseline
+
+Every statement is run in a fresh interpreter, as a cold start of a CLI or serverless function,
+and the median time of the statement itself (the interpreter startup is excluded) is reported.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline_import.json")
+
+STATEMENTS: Dict[str, str] = {
+    "package": "import notion_extensions",
+    "client": "from notion_extensions import NotionClient",
+    "block": "from notion_extensions.base.props.block import Paragraph",
+    "compact": "from notion_extensions.base.props.compact import Paragraph",
+    "all": "from notion_extensions.base.props.block import *",
+}
+
+_TEMPLATE = """
+import time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+
+def measure(statement: str, repeat: int) -> float:
+    """
+    Return the median seconds of `repeat` cold imports
+    """
+    times = []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", _TEMPLATE.format(statement=statement)],
+            cwd=ROOT,
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        times.append(float(out.stdout))
+    return statistics.median(times)
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--save", action="store_true", help="store results as the new baseline")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.5,
+        help="allowed relative slowdown against the baseline, default=0.5",
+    )
+    args = parser.parse_args(argv)
+
+    results: Dict[str, float] = {}
+    for name, statement in STATEMENTS.items():
+        results[name] = measure(statement, args.repeat)
+        print(f"{name:<10} {results[name] * 1e3:>8.2f} ms  {statement}")
+
+    if args.save:
+        stored: Dict[str, Any] = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": results,
+        }
+        with open(args.baseline, "w") as f:
+            json.dump(stored, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("no baseline, run with --save to create it")
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)["results"]
+    regressions = [
+        f"{name}: {seconds / baseline[name]:.2f}x slower than baseline"
+        for name, seconds in results.items()
+        if name in baseline and seconds > baseline[name] * (1 + args.threshold)
+    ]
+    for message in regressions:
+        print(f"REGRESSION {message}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,277 @@
+"""
+Benchmarks for construction, mutation and serialization of `props`
+
+Usage
+-----
+    python benchmarks/bench_props.py                  # run and compare with the stored baseline
+    python benchmarks/bench_props.py --save           # run and overwrite the stored baseline
+    python benchmarks/bench_props.py --profile full   # 10k-100k scale, no baseline is stored by default
+
+Every case is measured at two sizes. Besides the absolute time, the scaling exponent
+`log(t2 / t1) / log(n2 / n1)` is reported (1.0 is linear, 2.0 is quadratic),
+so a change in `BaseProps` that turns a linear path into a quadratic one is caught
+even on a machine that is faster or slower than the one the baseline was taken on.
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import sys
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from notion_extensions.base.props.block import (  # noqa: E402
+    Children,
+    Paragraph,
+    Table,
+    TableRow,
+)
+from notion_extensions.base.props import compact  # noqa: E402
+from notion_extensions.base.props.common import RichText, Text  # noqa: E402
+from notion_extensions.base.utils import dumps  # noqa: E402
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline_props.json")
+
+# sizes for (construction, mutation) cases
+# mutation cases are kept small because appending to `Children` / `RichText` is quadratic today
+PROFILES: Dict[str, Dict[str, Tuple[int, int]]] = {
+    "quick": {
+        "construct": (1_000, 4_000),
+        "mutate": (50, 100),
+    },
+    "full": {
+        "construct": (10_000, 100_000),
+        "mutate": (200, 400),
+    },
+}
+
+
+class Case(NamedTuple):
+    name: str
+    kind: str  # "construct" or "mutate"
+    setup: Callable[[int], Any]
+    run: Callable[[Any], Any]
+
+
+# Setup helpers
+def _texts(n: int) -> List[Text]:
+    return [Text(f"text {i}", bold=i % 2 == 0) for i in range(n)]
+
+
+def _paragraphs(n: int) -> List[Paragraph]:
+    return [Paragraph(t) for t in _texts(n)]
+
+
+def _table_rows(n: int) -> List[TableRow]:
+    return [
+        TableRow(RichText(Text(f"{i}")), RichText(Text("name")), RichText(Text("value")))
+        for i in range(n)
+    ]
+
+
+def _compact_texts(n: int) -> List[compact.Text]:
+    return [compact.Text(f"text {i}", bold=i % 2 == 0) for i in range(n)]
+
+
+def _compact_children(n: int) -> compact.Children:
+    return compact.Children(*(compact.Paragraph(t) for t in _compact_texts(n)))
+
+
+# Cases
+def _run_text_setters(texts: List[Text]) -> None:
+    for t in texts:
+        t.bold = True
+        t.color = "red"
+        t.text = "changed"
+
+
+def _run_rich_text_append(texts: List[Text]) -> None:
+    rich_text = RichText()
+    for t in texts:
+        rich_text.append(t)
+
+
+def _run_children_append(paragraphs: List[Paragraph]) -> None:
+    children = Children()
+    for p in paragraphs:
+        children.append(p)
+
+
+def _run_children_extend(paragraphs: List[Paragraph]) -> None:
+    children = Children()
+    for i in range(0, len(paragraphs), 10):
+        children.extend(paragraphs[i : i + 10])
+
+
+def _run_paragraph_append(texts: List[Text]) -> None:
+    paragraph = Paragraph()
+    for t in texts:
+        paragraph.append(t)
+
+
+CASES: List[Case] = [
+    Case("text.construct", "construct", lambda n: n, lambda n: [Text(f"text {i}") for i in range(n)]),
+    Case("rich_text.construct", "construct", _texts, lambda texts: RichText(*texts)),
+    Case("paragraph.construct", "construct", _texts, lambda texts: [Paragraph(t) for t in texts]),
+    Case("children.construct", "construct", _paragraphs, lambda ps: Children(*ps)),
+    Case("table_row.construct", "construct", _texts, lambda texts: [TableRow(RichText(t)) for t in texts]),
+    Case("table.construct", "construct", _table_rows, lambda rows: Table(3, *rows)),
+    Case(
+        "table.from_rows",
+        "construct",
+        lambda n: [[f"{i}", "name", "value"] for i in range(n)],
+        Table.from_rows,
+    ),
+    Case("text.setters", "construct", _texts, _run_text_setters),
+    Case("serialize.rich_text", "construct", lambda n: RichText(*_texts(n)), json.dumps),
+    Case("serialize.children", "construct", lambda n: Children(*_paragraphs(n)), json.dumps),
+    Case(
+        "serialize.children.omit_defaults",
+        "construct",
+        lambda n: Children(*_paragraphs(n)),
+        lambda children: dumps(children, omit_defaults=True),
+    ),
+    Case(
+        "serialize.rich_text.merge_texts",
+        "construct",
+        lambda n: RichText(*_texts(n)),
+        lambda rich_text: dumps(rich_text, merge_texts=True),
+    ),
+    Case("rich_text.construct.merge", "construct", _texts, lambda texts: RichText(*texts, merge=True)),
+    Case("compact.paragraph.construct", "construct", _compact_texts, lambda ts: [compact.Paragraph(t) for t in ts]),
+    Case("compact.serialize.children", "construct", _compact_children, dumps),
+    Case(
+        "compact.serialize.children.omit_defaults",
+        "construct",
+        _compact_children,
+        lambda children: dumps(children, omit_defaults=True),
+    ),
+    Case("rich_text.append", "mutate", _texts, _run_rich_text_append),
+    Case("paragraph.append", "mutate", _texts, _run_paragraph_append),
+    Case("children.append", "mutate", _paragraphs, _run_children_append),
+    Case("children.extend", "mutate", _paragraphs, _run_children_extend),
+]
+
+
+# Runner
+def measure(case: Case, n: int, repeat: int) -> float:
+    """
+    Return the best wall time of `repeat` runs, setup is excluded from timing
+    """
+    best = math.inf
+    for _ in range(repeat):
+        state = case.setup(n)
+        start = time.perf_counter()
+        case.run(state)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(profile: str, repeat: int, only: str = "") -> Dict[str, Dict[str, float]]:
+    results: Dict[str, Dict[str, float]] = {}
+    for case in CASES:
+        if only and only not in case.name:
+            continue
+        n1, n2 = PROFILES[profile][case.kind]
+        t1 = measure(case, n1, repeat)
+        t2 = measure(case, n2, repeat)
+        exponent = math.log(max(t2, 1e-9) / max(t1, 1e-9)) / math.log(n2 / n1)
+        results[case.name] = {
+            "n": n2,
+            "seconds": t2,
+            "exponent": exponent,
+        }
+        print(f"{case.name:<40} n={n2:<7} {t2 * 1e3:>10.2f} ms  exponent={exponent:.2f}")
+    return results
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    threshold: float,
+    exponent_threshold: float,
+) -> List[str]:
+    """
+    Compare results with baseline
+
+    Returns
+    -------
+    list of str
+        messages describing regressions, empty if there are none
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None or base["n"] != result["n"]:
+            continue
+        ratio = result["seconds"] / base["seconds"]
+        if ratio > 1 + threshold:
+            regressions.append(f"{name}: {ratio:.2f}x slower than baseline")
+        if result["exponent"] > base["exponent"] + exponent_threshold:
+            regressions.append(
+                f"{name}: scaling exponent {result['exponent']:.2f} "
+                f"(baseline {base['exponent']:.2f})"
+            )
+    return regressions
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="quick")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", default="", help="run only cases whose name contains this string")
+    parser.add_argument("--save", action="store_true", help="store results as the new baseline")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="allowed relative slowdown against the baseline, default=0.25",
+    )
+    parser.add_argument(
+        "--exponent-threshold",
+        type=float,
+        default=0.3,
+        help="allowed increase of the scaling exponent against the baseline, default=0.3",
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.profile, args.repeat, args.only)
+
+    stored: Dict[str, Any] = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            stored = json.load(f)
+
+    if args.save:
+        previous = stored.get(args.profile, {}).get("results", {})
+        stored[args.profile] = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": {**previous, **results},  # keep cases which were not run
+        }
+        with open(args.baseline, "w") as f:
+            json.dump(stored, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"baseline saved to {args.baseline}")
+        return 0
+
+    if args.profile not in stored:
+        print(f"no baseline for profile `{args.profile}`, run with --save to create it")
+        return 0
+    regressions = compare(
+        results,
+        stored[args.profile]["results"],
+        threshold=args.threshold,
+        exponent_threshold=args.exponent_threshold,
+    )
+    for message in regressions:
+        print(f"REGRESSION {message}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,50 @@
-from .base import NotionClient, props, utils
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .base import (
+        BlockWriter,
+        BulkResult,
+        ClientPool,
+        NotionClient,
+        RateLimiter,
+        SharedRateLimiter,
+        TitleIndex,
+        UserDirectory,
+        props,
+        transfer,
+        utils,
+        validation,
+    )
 
 __version__ = "0.1.0"
 
 __all__ = [
     "props",
+    "transfer",
     "utils",
+    "validation",
+    "BlockWriter",
+    "BulkResult",
+    "ClientPool",
     "NotionClient",
+    "RateLimiter",
+    "SharedRateLimiter",
+    "TitleIndex",
+    "UserDirectory",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # attributes are imported from `base` at their first access (PEP 562),
+    # so `import notion_extensions` does not import the client nor `requests`
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from . import base
+
+    value = getattr(base, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *__all__})
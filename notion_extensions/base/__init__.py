@@ -1,8 +1,46 @@
-from .client import NotionClient
-from . import props, utils
-
-__all__ = [
-    "NotionClient",
-    "props",
-    "utils",
-]
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from . import props, transfer, utils, validation
+    from .bulk import BulkResult
+    from .client import NotionClient
+    from .index import TitleIndex
+    from .pool import ClientPool
+    from .ratelimit import RateLimiter, SharedRateLimiter
+    from .users import UserDirectory
+    from .writer import BlockWriter
+
+# Name to the module defining it (None for a submodule itself),
+# modules are imported at the first access of their names (PEP 562)
+_LAZY: Dict[str, Optional[str]] = {
+    "BlockWriter": "writer",
+    "BulkResult": "bulk",
+    "ClientPool": "pool",
+    "NotionClient": "client",
+    "RateLimiter": "ratelimit",
+    "SharedRateLimiter": "ratelimit",
+    "TitleIndex": "index",
+    "UserDirectory": "users",
+    "props": None,
+    "transfer": None,
+    "utils": None,
+    "validation": None,
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = _LAZY[name]
+    if module is None:
+        return importlib.import_module(f".{name}", __name__)
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value  # later accesses do not reach __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY})
@@ -0,0 +1,80 @@
+from contextvars import copy_context
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+__all__ = [
+    "BulkResult",
+    "run_bulk",
+]
+
+
+class BulkResult(NamedTuple):
+    """
+    BulkResult
+    Result of a request for one ID of a bulk operation
+
+    Attributes
+    ----------
+    id : str
+        ID or URL as it was given
+    status_code : int, optional
+        Status code of the response, None if the request was not completed
+    response : Dict[str, Any]
+        Response of dictionary, empty if the request was not completed
+    error : str, optional
+        Description of the failure, None if the request succeeded
+    """
+
+    id: str
+    status_code: Optional[int]
+    response: Dict[str, Any]
+    error: Optional[str]
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _call(func: Callable[[str], Tuple[int, Dict[str, Any]]], id_: str) -> BulkResult:
+    try:
+        status_code, response = func(id_)
+    except Exception as e:  # e.g. connection errors, reported per ID
+        return BulkResult(id_, None, {}, f"{type(e).__name__}: {e}")
+    if status_code != 200:
+        return BulkResult(id_, status_code, response, response.get("message", "request failed"))
+    return BulkResult(id_, status_code, response, None)
+
+
+def run_bulk(
+    func: Callable[[str], Tuple[int, Dict[str, Any]]],
+    ids: Iterable[str],
+    workers: int = 4,
+) -> List[BulkResult]:
+    """
+    Call func for each ID concurrently, and collect the result of each ID
+
+    Parameters
+    ----------
+    func : Callable[[str], Tuple[int, Dict[str, Any]]]
+        Function which sends a request for an ID, and returns status_code and response
+    ids : iterable of str
+        IDs or URLs
+    workers : int, default=4
+        Number of concurrent requests
+
+    Returns
+    -------
+    list of BulkResult
+        Result of each ID, in the order of ids
+
+    Raises
+    ------
+    ValueError
+        if workers is not positive
+    """
+    if workers <= 0:
+        raise ValueError(f"workers must be more than 0, but {workers} is given")
+    from concurrent.futures import ThreadPoolExecutor  # deferred, as it is slow to import
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:  # workers run in the context (lane) of the caller
+        futures = [executor.submit(copy_context().run, _call, func, id_) for id_ in ids]
+        return [future.result() for future in futures]
@@ -1,15 +1,27 @@
-import json
 import os
 import sys
+import threading
+import time
 import warnings
-from typing import Any, Dict, Final, Optional, Tuple, Union
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Final, Iterable, Iterator, List, Optional, Tuple, Union
 
-import requests
+from notion_extensions.base.props import compact
 from notion_extensions.base.props.block import Children
 from notion_extensions.base.props.common import Cover, Icon, RichText
 
+from .bulk import BulkResult, run_bulk
+from .concurrency import AdaptiveLimit
+from .hedge import Hedger
 from .props.page import Title
-
+from .ratelimit import RateLimiter
+from .scheduler import DEFAULT_LANE, PriorityScheduler, current_lane, lane
+from .singleflight import SingleFlight
+from .utils import dumps, parse_id
+from .validation import assert_valid
+
+if TYPE_CHECKING:
+    import requests
 if sys.version_info >= (3, 8):
     from typing import Literal
 else:
@@ -23,6 +35,8 @@ PAGE_COVER = Dict[str, Any]
 # Type Hint
 UrlLike = str
 
+API_URL = "https://api.notion.com/v1"
+
 
 class NotionClient:
     """
@@ -34,6 +48,28 @@ class NotionClient:
         API key of Notion
     version : str
         Notion version used for authorization
+    omit_defaults : bool
+        Whether fields equal to the API defaults are omitted from request bodies
+    merge_texts : bool
+        Whether adjacent rich text objects with the same styles are merged in request bodies
+    validate : bool
+        Whether request bodies are validated locally before they are sent
+    limiter : RateLimiter, optional
+        Token bucket which throttles requests
+    max_retries : int
+        Number of retries of a request which is rejected with 429 (rate limited)
+    base_url : str
+        URL of the API, which endpoints are joined to
+    single_flight : SingleFlight, optional
+        Coalescer of concurrent identical GET requests
+    hedger : Hedger, optional
+        Hedger of slow GET requests
+    concurrency : AdaptiveLimit, optional
+        Limit of concurrent requests adjusted to 429 responses and latency
+    scheduler : PriorityScheduler, optional
+        Scheduler which shares the rate limit between priority lanes
+    metrics : Dict[str, Dict[str, Any]]
+        Counters of the components of the client
 
     Methods
     -------
@@ -43,9 +79,36 @@ class NotionClient:
         Get a block with block_id.
     get_child_blocks(block_id: str, start_cursor: Optional[str])
         Get child blocks with block_id
+    priority(lane: str)
+        Send requests in a priority lane
+    close()
+        Close connections of all threads
+
+    .. note:: A client is safe to share between threads.
+              Settings are fixed at construction or replaced atomically,
+              the rate limiter and the ID parser cache are locked,
+              and each thread checks out its own `requests.Session`
+              so connections are reused without being shared between threads
     """
 
-    def __init__(self, *, key: Optional[str] = None, name: str = "NOTION_KEY"):
+    def __init__(
+        self,
+        *,
+        key: Optional[str] = None,
+        name: str = "NOTION_KEY",
+        omit_defaults: bool = False,
+        merge_texts: bool = False,
+        validate: bool = False,
+        rate_limit: Optional[Union[float, RateLimiter]] = None,
+        max_retries: int = 0,
+        base_url: str = API_URL,
+        coalesce_reads: bool = True,
+        hedge_percentile: Optional[float] = None,
+        hedge_budget: float = 0.1,
+        hedge_min_delay: float = 0.05,
+        adaptive_concurrency: bool = False,
+        priorities: Optional[Dict[str, float]] = None,
+    ):
         """
         Parameters
         ----------
@@ -55,6 +118,47 @@ class NotionClient:
             Name of the environment variable which has API key of Notion.
             If key is not given, name is used for getting API key.
             `name='NOTION_KEY'` as default.
+        omit_defaults : bool, default=False
+            If True, styles of rich text which are equal to the API defaults
+            (all-false annotations, `link: null`) are not sent.
+            Other fields, e.g. `checked: false` of an update, are always sent
+        merge_texts : bool, default=False
+            If True, adjacent rich text objects with the same annotations and link
+            are merged into one before request bodies are sent
+        validate : bool, default=False
+            If True, bodies of requests which create blocks, pages or databases are checked
+            against the structural limits of the API before they are sent
+        rate_limit : float or RateLimiter, optional
+            If given, requests are throttled to this number per second by a token bucket
+            which is shared by all the threads using this client.
+            The API allows an average of 3 requests per second.
+            A `SharedRateLimiter` shares the bucket with clients of other processes on the host
+        max_retries : int, default=0
+            Number of retries of a request which is rejected with 429 (rate limited).
+            The client waits for `Retry-After` seconds before retrying
+        base_url : str, default='https://api.notion.com/v1'
+            URL of the API, e.g. of a proxy or a stand-in server for testing
+        coalesce_reads : bool, default=True
+            If True, concurrent identical GET requests (same endpoint, ID and cursor)
+            share one request and its response, counted by `single_flight`
+        hedge_percentile : float, optional
+            If given, e.g. 0.95, a GET request which has not returned within this percentile
+            of recent latencies is sent again, and the first response is used.
+            Hedges are counted by `hedger`
+        hedge_budget : float, default=0.1
+            Maximum fraction of GET requests which are hedged. As hedges are throttled
+            by `rate_limit` too, it is also the fraction of the rate limit spent on hedges
+        hedge_min_delay : float, default=0.05
+            Minimum seconds before a GET request is hedged, however fast recent requests were
+        adaptive_concurrency : bool, default=False
+            If True, requests in flight are limited by `concurrency`, which halves the limit
+            on 429 responses or inflated latency and raises it otherwise (AIMD),
+            and bulk operations run up to its `max_limit` workers
+        priorities : Dict[str, float], optional
+            Weights of priority lanes sharing `rate_limit` by weighted fair queuing,
+            `{"interactive": 8, "normal": 4, "bulk": 1}` if not given.
+            Requests are sent in lane 'normal', bulk operations in lane 'bulk',
+            and others in the lane set by `priority`
         """
         if key is None:
             key = os.environ.get(name)
@@ -70,6 +174,25 @@ class NotionClient:
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.key}",
         }
+        self.__omit_defaults: bool = omit_defaults
+        self.__merge_texts: bool = merge_texts
+        self.__validate: bool = validate
+        self.__limiter: Optional[RateLimiter] = (
+            RateLimiter(rate_limit) if isinstance(rate_limit, (int, float)) else rate_limit
+        )
+        self.__max_retries: int = max_retries
+        self.__base_url: Final[str] = base_url.rstrip("/")
+        self.__local = threading.local()  # session of each thread
+        self.__sessions: List[Any] = []  # sessions of all threads, closed by close()
+        self.__sessions_lock = threading.Lock()
+        self.__single_flight: Optional[SingleFlight] = SingleFlight() if coalesce_reads else None
+        self.__hedger: Optional[Hedger] = None
+        if hedge_percentile is not None:
+            self.__hedger = Hedger(hedge_percentile, hedge_budget, min_delay=hedge_min_delay)
+        self.__concurrency: Optional[AdaptiveLimit] = AdaptiveLimit() if adaptive_concurrency else None
+        self.__scheduler: Optional[PriorityScheduler] = (
+            PriorityScheduler(self.__limiter, priorities) if self.__limiter is not None else None
+        )
 
     # Properties
     @property
@@ -93,6 +216,106 @@ class NotionClient:
         """
         return self.__headers
 
+    @property
+    def omit_defaults(self) -> bool:
+        """
+        Whether fields equal to the API defaults are omitted from request bodies
+        """
+        return self.__omit_defaults
+
+    @omit_defaults.setter
+    def omit_defaults(self, value: bool) -> None:
+        self.__omit_defaults = value
+
+    @property
+    def merge_texts(self) -> bool:
+        """
+        Whether adjacent rich text objects with the same styles are merged in request bodies
+        """
+        return self.__merge_texts
+
+    @merge_texts.setter
+    def merge_texts(self, value: bool) -> None:
+        self.__merge_texts = value
+
+    @property
+    def validate(self) -> bool:
+        """
+        Whether request bodies are validated locally before they are sent
+        """
+        return self.__validate
+
+    @validate.setter
+    def validate(self, value: bool) -> None:
+        self.__validate = value
+
+    @property
+    def limiter(self) -> Optional[RateLimiter]:
+        """
+        Token bucket which throttles requests, None if requests are not throttled
+        """
+        return self.__limiter
+
+    @property
+    def max_retries(self) -> int:
+        """
+        Number of retries of a request which is rejected with 429 (rate limited)
+        """
+        return self.__max_retries
+
+    @property
+    def single_flight(self) -> Optional[SingleFlight]:
+        """
+        Coalescer of concurrent identical GET requests, with counters of requests executed and saved.
+        None if `coalesce_reads` is False
+        """
+        return self.__single_flight
+
+    @property
+    def hedger(self) -> Optional[Hedger]:
+        """
+        Hedger of slow GET requests, with counters of hedges. None if `hedge_percentile` is not given
+        """
+        return self.__hedger
+
+    @property
+    def concurrency(self) -> Optional[AdaptiveLimit]:
+        """
+        Limit of concurrent requests adjusted by AIMD, None if `adaptive_concurrency` is False
+        """
+        return self.__concurrency
+
+    @property
+    def scheduler(self) -> Optional[PriorityScheduler]:
+        """
+        Scheduler which shares the rate limit between priority lanes, None if `rate_limit` is not given
+        """
+        return self.__scheduler
+
+    @property
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Counters of the components of the client which are enabled,
+        e.g. `single_flight`, `hedger`, `concurrency` (with its current `limit`) and `scheduler` (per lane)
+        """
+        metrics: Dict[str, Dict[str, Any]] = {}
+        if self.__single_flight is not None:
+            metrics["single_flight"] = self.__single_flight.stats
+        if self.__hedger is not None:
+            metrics["hedger"] = self.__hedger.stats
+        if self.__concurrency is not None:
+            metrics["concurrency"] = self.__concurrency.stats
+        if self.__scheduler is not None:
+            metrics["scheduler"] = self.__scheduler.stats
+        return metrics
+
+    @property
+    def base_url(self) -> str:
+        """
+        URL of the API, which endpoints are joined to
+        """
+        return self.__base_url
+
     # Special Methods
     def __str__(self) -> str:
         mask = "*" * len(self.key)
@@ -102,7 +325,148 @@ class NotionClient:
         mask = "*" * len(self.key)
         return f"NotionClient\n::   key   :: {mask}\n:: version :: {self.version}\n"
 
+    def __enter__(self) -> "NotionClient":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @contextmanager
+    def priority(self, name: str) -> Iterator[None]:
+        """
+        Send requests in the block in a priority lane, including requests of bulk operations
+        and threads started by them. Lanes take effect when `rate_limit` is given
+
+        Parameters
+        ----------
+        name : str
+            Name of the lane, e.g. 'interactive', 'normal' or 'bulk'
+
+        Raises
+        ------
+        ValueError
+            if the lane is unknown
+
+        Examples
+        --------
+        >>> with client.priority("interactive"):
+        ...     status_code, page = client.get_page(page_id=page_id)
+        """
+        if self.__scheduler is not None and name not in self.__scheduler.weights:
+            raise ValueError(f"lane must be one of {sorted(self.__scheduler.weights)}, but `{name}` is given")
+        with lane(name):
+            yield
+
+    def close(self) -> None:
+        """
+        Close connections of all threads.
+        The client can still be used, new connections are opened by the next requests
+        """
+        with self.__sessions_lock:
+            sessions, self.__sessions = self.__sessions, []
+            self.__local = threading.local()
+        if self.__hedger is not None:
+            self.__hedger.close()
+        for session in sessions:
+            session.close()
+
     # Private Methods
+    def _session(self) -> "requests.Session":
+        """
+        Return the session of the calling thread, which keeps connections alive between requests.
+        `requests.Session` is not safe to share between threads, so each thread has its own
+        """
+        session = getattr(self.__local, "session", None)
+        if session is None:
+            import requests  # deferred until the first request, as it is slow to import
+
+            session = requests.Session()
+            session.headers.update(self.headers)
+            with self.__sessions_lock:
+                self.__local.session = session
+                self.__sessions.append(session)
+        return session
+
+    def _request(self, method: str, url: str, **kwargs: Any) -> "requests.Response":
+        """
+        Send a request to the API, every endpoint goes through this method
+
+        Parameters
+        ----------
+        method : str
+            HTTP method
+        url : str
+            URL of the endpoint
+        **kwargs
+            Passed to `requests.Session.request`, e.g. `data` and `params`
+
+        Returns
+        -------
+        requests.Response
+
+        .. note:: If `coalesce_reads` is True, concurrent GET requests of the same URL and params
+                  share one request and its response.
+                  If `hedge_percentile` is given, slow GET requests are sent again
+        """
+        if method != "GET":
+            return self._send(method, url, **kwargs)
+
+        def send() -> "requests.Response":
+            if self.__hedger is not None:  # reads are idempotent, safe to send twice
+                return self.__hedger.call(lambda: self._send(method, url, **kwargs))
+            return self._send(method, url, **kwargs)
+
+        if self.__single_flight is not None:
+            params = kwargs.get("params") or {}
+            key = (url, tuple(sorted(params.items())))
+            res, _ = self.__single_flight.do(key, send)
+            return res
+        return send()
+
+    def _send(self, method: str, url: str, **kwargs: Any) -> "requests.Response":
+        """
+        Send a request with the session of the calling thread,
+        throttled by the rate limiter (in the priority lane of the caller) and the adaptive concurrency,
+        and retried on 429
+        """
+        session = self._session()
+        concurrency = self.__concurrency
+        for attempt in range(self.max_retries + 1):
+            if self.__scheduler is not None:  # before a slot, so waiting bulk requests hold no slots
+                self.__scheduler.acquire(current_lane() or DEFAULT_LANE)
+            token = concurrency.acquire() if concurrency is not None else None
+            try:
+                start = time.monotonic()
+                res = session.request(method, url, **kwargs)
+            except BaseException:
+                if concurrency is not None:
+                    concurrency.release(token)  # type: ignore
+                raise
+            if concurrency is not None:
+                concurrency.release(token, time.monotonic() - start, res.status_code == 429)  # type: ignore
+            if res.status_code != 429 or attempt == self.max_retries:
+                break
+            time.sleep(float(res.headers.get("Retry-After", 1)))
+        return res
+
+    def _run_bulk(self, func: Any, ids: Iterable[Any], workers: Optional[int]) -> List[BulkResult]:
+        """
+        Run a bulk operation in lane 'bulk' (if it is one of `priorities`), unless the caller set a lane
+        """
+        name = current_lane()
+        if name is None:
+            name = "bulk" if self.__scheduler is None or "bulk" in self.__scheduler.weights else DEFAULT_LANE
+        with lane(name):
+            return run_bulk(func, ids, self._workers(workers))
+
+    def _workers(self, workers: Optional[int]) -> int:
+        """
+        Number of workers of a bulk operation, the upper bound of the adaptive concurrency if not given
+        """
+        if workers is not None:
+            return workers
+        return self.__concurrency.max_limit if self.__concurrency is not None else 4
+
     def _parse_id(
         self, urllike: UrlLike, type_: Literal["page", "database", "block"] = "page"
     ) -> str:
@@ -114,18 +478,14 @@ class NotionClient:
         Returns
         -------
         str
-            ID from URL format
-        """
-        id_ = urllike.split("/")[-1]  # retrieve the last string
-        if type_ in ("page"):
-            id_ = id_.split("-")[-1]  # remove string like title
-        elif type_ in ("database"):
-            id_ = id_.split("?")[0]  # remove body of url
-        elif type_ in ("block"):
-            id_ = id_.split("#")[-1]  # remove page link
-        else:
-            raise ValueError("type_ must be `page` or `database` or `block`")
-        return id_
+            Canonical ID, lowercase UUID with dashes, from ID or URL format
+
+        Raises
+        ------
+        ValueError
+            if no ID is found
+        """
+        return parse_id(urllike, type_)
 
     # Databases
     def get_database(
@@ -147,9 +507,7 @@ class NotionClient:
             This returns status_code and response of dictionary
         """
         database_id = self._parse_id(database_id, type_="database")
-        res = requests.get(
-            f"https://api.notion.com/v1/databases/{database_id}", headers=self.headers
-        )
+        res = self._request("GET", f"{self.base_url}/databases/{database_id}")
         return res.status_code, res.json()
 
     def create_database(
@@ -186,14 +544,124 @@ class NotionClient:
             body.update(title)
         if icon is not None:
             body.update(icon)
+        if self.validate:
+            assert_valid(body)
+
+        res = self._request(
+            "POST",
+            f"{self.base_url}/databases/",
+            data=dumps(body, omit_defaults=self.omit_defaults, merge_texts=self.merge_texts),
+        )
+        return res.status_code, res.json()
+
+    def query_database(
+        self,
+        *,
+        database_id: Union[str, UrlLike],
+        filter: Optional[Dict[str, Any]] = None,
+        sorts: Optional[List[Dict[str, Any]]] = None,
+        start_cursor: Optional[str] = None,
+        page_size: int = 100,
+    ) -> Tuple[int, Dict[str, Any]]:
+        """
+        Get pages of a database which match filter, in the order of sorts
+
+        Parameters
+        ----------
+        database_id : str or UrlLike
+            ID or URL of the database
+        filter : Dict, optional
+            Filter object of the API
+        sorts : list of Dict, optional
+            Sort objects of the API
+        start_cursor : str, optional
+            If supplied, this endpoint will return a page of results starting after the cursor provided.
+            If not supplied, this endpoint will return the first page of results
+        page_size : int, default=100
+            The number of items from the full list desired in the response. Maximum: 100
 
-        res = requests.post(
-            "https://api.notion.com/v1/databases/",
-            headers=self.headers,
-            data=json.dumps(body),
+        Returns
+        -------
+        Tuple[int, Dict[str, Any]]
+            This returns status_code and response of dictionary
+
+        Raises
+        ------
+        ValueError
+            if page_size is 0 or less than 0
+        """
+        if page_size <= 0:  # 1 <= page_size <= 100
+            raise ValueError("page_size must be more than 0")
+        elif page_size > 100:  # 1 <= page_size <= 100
+            page_size = 100
+            warnings.warn(
+                "page_size must be up to 100, page_size is set to 100", UserWarning
+            )
+
+        database_id = self._parse_id(database_id, type_="database")
+        body: Dict[str, Any] = {"page_size": page_size}
+        if filter is not None:
+            body["filter"] = filter
+        if sorts is not None:
+            body["sorts"] = sorts
+        if start_cursor is not None:
+            body["start_cursor"] = start_cursor
+
+        res = self._request(
+            "POST",
+            f"{self.base_url}/databases/{database_id}/query",
+            data=dumps(body),
         )
         return res.status_code, res.json()
 
+    def iter_database_query(
+        self,
+        *,
+        database_id: Union[str, UrlLike],
+        filter: Optional[Dict[str, Any]] = None,
+        sorts: Optional[List[Dict[str, Any]]] = None,
+        page_size: int = 100,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all pages of a database which match filter, following cursors of `query_database`
+
+        Parameters
+        ----------
+        database_id : str or UrlLike
+            ID or URL of the database
+        filter : Dict, optional
+            Filter object of the API
+        sorts : list of Dict, optional
+            Sort objects of the API
+        page_size : int, default=100
+            The number of pages fetched in a request. Maximum: 100
+
+        Yields
+        ------
+        Dict[str, Any]
+            Page object
+
+        Raises
+        ------
+        ValueError
+            if a request fails
+        """
+        start_cursor = None
+        while True:
+            status_code, res = self.query_database(
+                database_id=database_id,
+                filter=filter,
+                sorts=sorts,
+                start_cursor=start_cursor,
+                page_size=page_size,
+            )
+            if status_code != 200:
+                raise ValueError(f"failed to query the database ({status_code}): {res.get('message')}")
+            yield from res["results"]
+            if not res.get("has_more"):
+                return
+            start_cursor = res["next_cursor"]
+
     # Pages
     def get_page(
         self,
@@ -214,9 +682,7 @@ class NotionClient:
             This returns status_code and response of dictionary
         """
         page_id = self._parse_id(page_id)
-        res = requests.get(
-            f"https://api.notion.com/v1/pages/{page_id}", headers=self.headers
-        )
+        res = self._request("GET", f"{self.base_url}/pages/{page_id}")
         return res.status_code, res.json()
 
     def create_page(
@@ -225,7 +691,7 @@ class NotionClient:
         parent_id: Union[str, UrlLike],
         parent_type: Literal["database", "page"],
         properties: Title,
-        children: Optional[Children] = None,
+        children: Optional[Union[Children, compact.Children]] = None,
         icon: Optional[Icon] = None,
         cover: Optional[Cover] = None,
     ) -> Tuple[int, Dict[str, Any]]:  # create a page
@@ -241,7 +707,7 @@ class NotionClient:
             using Title class is recommended
         parent_id : str or UrlLike, optional
             ID of the parent database or page, or URL of the parent database or page
-        children : List of BlockObject, optional
+        children : Children or compact.Children, optional
             Page content for the new page as an array of block objects
         icon : Icon, optional
             Icon of a page
@@ -274,12 +740,14 @@ class NotionClient:
             body.update(icon)
         if cover is not None:  # Add cover
             body.update(cover)
+        if self.validate:
+            assert_valid(body)
 
         # create a page
-        res = requests.post(
-            "https://api.notion.com/v1/pages/",
-            headers=self.headers,
-            data=json.dumps(body),
+        res = self._request(
+            "POST",
+            f"{self.base_url}/pages/",
+            data=dumps(body, omit_defaults=self.omit_defaults, merge_texts=self.merge_texts),
         )
 
         return res.status_code, res.json()
@@ -330,10 +798,10 @@ class NotionClient:
             body.update(cover)
 
         # update page
-        res = requests.patch(
-            f"https://api.notion.com/v1/pages/{page_id}",
-            headers=self.headers,
-            data=json.dumps(body),
+        res = self._request(
+            "PATCH",
+            f"{self.base_url}/pages/{page_id}",
+            data=dumps(body, omit_defaults=self.omit_defaults, merge_texts=self.merge_texts),
         )
 
         return res.status_code, res.json()
@@ -364,14 +832,190 @@ class NotionClient:
             "archived": True,
         }
         # delete a page
-        res = requests.patch(
-            f"https://api.notion.com/v1/pages/{page_id}",
-            headers=self.headers,
-            data=json.dumps(body),
+        res = self._request(
+            "PATCH",
+            f"{self.base_url}/pages/{page_id}",
+            data=dumps(body, omit_defaults=self.omit_defaults, merge_texts=self.merge_texts),
         )
 
         return res.status_code, res.json()
 
+    def archive_pages(
+        self,
+        *,
+        page_ids: Iterable[Union[str, UrlLike]],
+        workers: Optional[int] = None,
+    ) -> List[BulkResult]:
+        """
+        Archive (delete) many pages concurrently.
+        Requests are throttled by `rate_limit` of this client if it is given
+
+        Parameters
+        ----------
+        page_ids : iterable of str or UrlLike
+            Identifiers for Notion pages. ID or URL
+        workers : int, optional
+            Number of concurrent requests, 4 if not given.
+            With `adaptive_concurrency`, requests in flight are limited by `concurrency`
+            and up to its `max_limit` workers are used if not given
+
+        Returns
+        -------
+        list of BulkResult
+            Result of each page, in the order of page_ids
+        """
+        return self._run_bulk(lambda page_id: self.delete_page(page_id=page_id), page_ids, workers)
+
+    def get_page_property(
+        self,
+        *,
+        page_id: Union[str, UrlLike],
+        property_id: str,
+        start_cursor: Optional[str] = None,
+        page_size: int = 100,
+    ) -> Tuple[int, Dict[str, Any]]:
+        """
+        Get a property item of a page.
+        Values of title, rich_text, relation, people and rollup properties are paginated,
+        and the response is a list of property items. Other values are a property item
+
+        Parameters
+        ----------
+        page_id : str or UrlLike
+            Identifier for a Notion page. ID or URL
+        property_id : str
+            ID of the property, e.g. `id` of a property of the page object
+        start_cursor : str, optional
+            If supplied, this endpoint will return a page of results starting after the cursor provided.
+            If not supplied, this endpoint will return the first page of results
+        page_size : int, default=100
+            The number of items from the full list desired in the response. Maximum: 100
+
+        Returns
+        -------
+        Tuple[int, Dict[str, Any]]
+            This returns status_code and response of dictionary
+
+        Raises
+        ------
+        ValueError
+            if page_size is 0 or less than 0
+        """
+        if page_size <= 0:  # 1 <= page_size <= 100
+            raise ValueError("page_size must be more than 0")
+        elif page_size > 100:  # 1 <= page_size <= 100
+            page_size = 100
+            warnings.warn(
+                "page_size must be up to 100, page_size is set to 100", UserWarning
+            )
+        page_id = self._parse_id(page_id, type_="page")  # parse ID from URL
+
+        params: Dict[str, Any] = {"page_size": page_size}
+        if start_cursor is not None:
+            params["start_cursor"] = start_cursor
+
+        res = self._request("GET", f"{self.base_url}/pages/{page_id}/properties/{property_id}", params=params)
+        return res.status_code, res.json()
+
+    def iter_page_property(
+        self,
+        *,
+        page_id: Union[str, UrlLike],
+        property_id: str,
+        page_size: int = 100,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all property items of a property of a page, following cursors.
+        Page objects hold up to 25 references of relation, people and rollup values,
+        this yields all of them
+
+        Parameters
+        ----------
+        page_id : str or UrlLike
+            Identifier for a Notion page. ID or URL
+        property_id : str
+            ID of the property
+        page_size : int, default=100
+            The number of items fetched in a request. Maximum: 100
+
+        Yields
+        ------
+        Dict[str, Any]
+            Property item object, only one for a value which is not paginated
+
+        Raises
+        ------
+        ValueError
+            if a request fails
+        """
+        start_cursor = None
+        while True:
+            status_code, res = self.get_page_property(
+                page_id=page_id, property_id=property_id, start_cursor=start_cursor, page_size=page_size
+            )
+            if status_code != 200:
+                raise ValueError(f"failed to get the page property ({status_code}): {res.get('message')}")
+            if res.get("object") != "list":
+                yield res
+                return
+            yield from res["results"]
+            if not res.get("has_more"):
+                return
+            start_cursor = res["next_cursor"]
+
+    def _get_page_property_items(self, page_id: Union[str, UrlLike], property_id: str) -> Tuple[int, Dict[str, Any]]:
+        """
+        Get all property items of a property of a page as one list, for `get_page_properties`
+        """
+        items: List[Dict[str, Any]] = []
+        start_cursor = None
+        while True:
+            status_code, res = self.get_page_property(
+                page_id=page_id, property_id=property_id, start_cursor=start_cursor
+            )
+            if status_code != 200 or res.get("object") != "list":
+                return status_code, res
+            items.extend(res["results"])
+            if not res.get("has_more"):
+                return status_code, {**res, "results": items, "next_cursor": None}
+            start_cursor = res["next_cursor"]
+
+    def get_page_properties(
+        self,
+        *,
+        page_ids: Iterable[Union[str, UrlLike]],
+        property_id: str,
+        workers: Optional[int] = None,
+    ) -> List[BulkResult]:
+        """
+        Get all property items of a property of many pages concurrently.
+        The pages of each property value are requested in order, and pages run concurrently.
+        Requests are throttled by `rate_limit` of this client if it is given
+
+        Parameters
+        ----------
+        page_ids : iterable of str or UrlLike
+            Identifiers for Notion pages. ID or URL
+        property_id : str
+            ID of the property, shared by the pages, e.g. pages of a database
+        workers : int, optional
+            Number of concurrent requests, 4 if not given.
+            With `adaptive_concurrency`, requests in flight are limited by `concurrency`
+            and up to its `max_limit` workers are used if not given
+
+        Returns
+        -------
+        list of BulkResult
+            Result of each page, in the order of page_ids.
+            A paginated value is a list of all property items in `response["results"]`
+
+        Examples
+        --------
+        >>> results = client.get_page_properties(page_ids=page_ids, property_id=relation_id)
+        >>> related = {r.id: [item["relation"]["id"] for item in r.response["results"]] for r in results if r.ok}
+        """
+        return self._run_bulk(lambda page_id: self._get_page_property_items(page_id, property_id), page_ids, workers)
+
     # Blocks
     def get_block(
         self,
@@ -392,9 +1036,7 @@ class NotionClient:
             This returns status_code and response of dictionary
         """
         block_id = self._parse_id(block_id, type_="block")
-        res = requests.get(
-            f"https://api.notion.com/v1/blocks/{block_id}", headers=self.headers
-        )
+        res = self._request("GET", f"{self.base_url}/blocks/{block_id}")
         return res.status_code, res.json()
 
     def update_block(
@@ -442,10 +1084,10 @@ class NotionClient:
             }
         )
 
-        res = requests.patch(
-            f"https://api.notion.com/v1/blocks/{block_id}",
-            headers=self.headers,
-            data=json.dumps(body),
+        res = self._request(
+            "PATCH",
+            f"{self.base_url}/blocks/{block_id}",
+            data=dumps(body, omit_defaults=self.omit_defaults, merge_texts=self.merge_texts),
         )
         return res.status_code, res.json()
 
@@ -494,18 +1136,56 @@ class NotionClient:
             "page_size": page_size,  # max size of page_size
             "start_cursor": start_cursor,  # start_cursor
         }
-        res = requests.get(
-            f"https://api.notion.com/v1/blocks/{block_id}/children",
-            headers=self.headers,
+        res = self._request(
+            "GET",
+            f"{self.base_url}/blocks/{block_id}/children",
             params=body,
         )
         return res.status_code, res.json()
 
+    def iter_block_children(
+        self,
+        *,
+        block_id: Union[str, UrlLike],
+        page_size: int = 100,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all child blocks of block_id, following cursors of `get_block_children`
+
+        Parameters
+        ----------
+        block_id : str or UrlLike
+            Identifier for a block. ID or URL
+        page_size : int, default=100
+            The number of blocks fetched in a request. Maximum: 100
+
+        Yields
+        ------
+        Dict[str, Any]
+            Block object
+
+        Raises
+        ------
+        ValueError
+            if a request fails
+        """
+        start_cursor = None
+        while True:
+            status_code, res = self.get_block_children(
+                block_id=block_id, start_cursor=start_cursor, page_size=page_size
+            )
+            if status_code != 200:
+                raise ValueError(f"failed to get block children ({status_code}): {res.get('message')}")
+            yield from res["results"]
+            if not res.get("has_more"):
+                return
+            start_cursor = res["next_cursor"]
+
     def append_block_children(
         self,
         *,
         block_id: Union[str, UrlLike],
-        children: Children,
+        children: Union[Children, compact.Children],
     ) -> Tuple[int, Dict[str, Any]]:
         """
         Creates and appends new children blocks to the parent block_id specified.
@@ -515,7 +1195,7 @@ class NotionClient:
         ----------
         block_id : str or UrlLike
             Identifier for a block. ID or URL
-        children : list of Any
+        children : Children or compact.Children
             Child content to append to a container block as an array of block objects
 
         Returns
@@ -525,16 +1205,18 @@ class NotionClient:
 
         Raises
         ------
-        ValueError
-            if page_size is 0 or less than 0
+        ValidationError
+            if `validate` is True and children would be rejected by the API
         """
         # parse block_id from url-like
         block_id = self._parse_id(block_id, type_="block")
+        if self.validate:
+            assert_valid(children)
 
-        res = requests.patch(
-            f"https://api.notion.com/v1/blocks/{block_id}/children",
-            headers=self.headers,
-            data=json.dumps(children),
+        res = self._request(
+            "PATCH",
+            f"{self.base_url}/blocks/{block_id}/children",
+            data=dumps(children, omit_defaults=self.omit_defaults, merge_texts=self.merge_texts),
         )
         return res.status_code, res.json()
 
@@ -556,7 +1238,256 @@ class NotionClient:
             This returns status_code and response of dictionary
         """
         block_id = self._parse_id(block_id, type_="block")
-        res = requests.delete(
-            f"https://api.notion.com/v1/blocks/{block_id}", headers=self.headers
-        )
+        res = self._request("DELETE", f"{self.base_url}/blocks/{block_id}")
+        return res.status_code, res.json()
+
+    def delete_blocks(
+        self,
+        *,
+        block_ids: Optional[Iterable[Union[str, UrlLike]]] = None,
+        parent_id: Optional[Union[str, UrlLike]] = None,
+        workers: Optional[int] = None,
+    ) -> List[BulkResult]:
+        """
+        Delete many blocks concurrently, given by IDs or as all the children of a parent block.
+        Requests are throttled by `rate_limit` of this client if it is given
+
+        Parameters
+        ----------
+        block_ids : iterable of str or UrlLike, optional
+            Identifiers for Notion blocks. ID or URL
+        parent_id : str or UrlLike, optional
+            Identifier for a block or page whose children are all deleted. ID or URL
+        workers : int, optional
+            Number of concurrent requests, 4 if not given.
+            With `adaptive_concurrency`, requests in flight are limited by `concurrency`
+            and up to its `max_limit` workers are used if not given
+
+        Returns
+        -------
+        list of BulkResult
+            Result of each block, in the order of block_ids or children
+
+        Raises
+        ------
+        ValueError
+            if both or neither of block_ids and parent_id are given,
+            or the children of parent_id cannot be retrieved
+        """
+        if (block_ids is None) == (parent_id is None):
+            raise ValueError("either `block_ids` or `parent_id` must be given")
+        if parent_id is not None:  # list all first, deleting while paginating shifts cursors
+            block_ids = [block["id"] for block in self.iter_block_children(block_id=parent_id)]
+        return self._run_bulk(lambda block_id: self.delete_block(block_id=block_id), block_ids, workers)  # type: ignore
+
+    # Users
+    def get_user(
+        self,
+        *,
+        user_id: str,
+    ) -> Tuple[int, Dict[str, Any]]:
+        """
+        Get a user with user_id
+
+        Parameters
+        ----------
+        user_id : str
+            ID of the user
+
+        Returns
+        -------
+        Tuple[int, Dict[str, Any]]
+            This returns status_code and response of dictionary
+        """
+        res = self._request("GET", f"{self.base_url}/users/{user_id}")
+        return res.status_code, res.json()
+
+    def list_users(
+        self,
+        *,
+        start_cursor: Optional[str] = None,
+        page_size: int = 100,
+    ) -> Tuple[int, Dict[str, Any]]:
+        """
+        List users of the workspace, guests are not included
+
+        Parameters
+        ----------
+        start_cursor : str, optional
+            If supplied, this endpoint will return a page of results starting after the cursor provided.
+            If not supplied, this endpoint will return the first page of results
+        page_size : int, default=100
+            The number of items from the full list desired in the response. Maximum: 100
+
+        Returns
+        -------
+        Tuple[int, Dict[str, Any]]
+            This returns status_code and response of dictionary
+
+        Raises
+        ------
+        ValueError
+            if page_size is 0 or less than 0
+        """
+        if page_size <= 0:  # 1 <= page_size <= 100
+            raise ValueError("page_size must be more than 0")
+        elif page_size > 100:  # 1 <= page_size <= 100
+            page_size = 100
+            warnings.warn(
+                "page_size must be up to 100, page_size is set to 100", UserWarning
+            )
+
+        params: Dict[str, Any] = {"page_size": page_size}
+        if start_cursor is not None:
+            params["start_cursor"] = start_cursor
+
+        res = self._request("GET", f"{self.base_url}/users", params=params)
         return res.status_code, res.json()
+
+    def iter_users(
+        self,
+        *,
+        page_size: int = 100,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all users of `list_users`, following cursors
+
+        Parameters
+        ----------
+        page_size : int, default=100
+            The number of users fetched in a request. Maximum: 100
+
+        Yields
+        ------
+        Dict[str, Any]
+            User object
+
+        Raises
+        ------
+        ValueError
+            if a request fails
+        """
+        start_cursor = None
+        while True:
+            status_code, res = self.list_users(start_cursor=start_cursor, page_size=page_size)
+            if status_code != 200:
+                raise ValueError(f"failed to list users ({status_code}): {res.get('message')}")
+            yield from res["results"]
+            if not res.get("has_more"):
+                return
+            start_cursor = res["next_cursor"]
+
+    def get_me(self) -> Tuple[int, Dict[str, Any]]:
+        """
+        Get the bot user of the token of this client
+
+        Returns
+        -------
+        Tuple[int, Dict[str, Any]]
+            This returns status_code and response of dictionary
+        """
+        res = self._request("GET", f"{self.base_url}/users/me")
+        return res.status_code, res.json()
+
+    # Search
+    def search(
+        self,
+        *,
+        query: Optional[str] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, Any]] = None,
+        start_cursor: Optional[str] = None,
+        page_size: int = 100,
+    ) -> Tuple[int, Dict[str, Any]]:
+        """
+        Search pages and databases shared with the integration by title
+
+        Parameters
+        ----------
+        query : str, optional
+            Text to compare against titles. All pages and databases are returned if not given
+        filter : Dict, optional
+            e.g. `{"property": "object", "value": "page"}` to search only pages
+        sort : Dict, optional
+            e.g. `{"direction": "descending", "timestamp": "last_edited_time"}`
+        start_cursor : str, optional
+            If supplied, this endpoint will return a page of results starting after the cursor provided.
+            If not supplied, this endpoint will return the first page of results
+        page_size : int, default=100
+            The number of items from the full list desired in the response. Maximum: 100
+
+        Returns
+        -------
+        Tuple[int, Dict[str, Any]]
+            This returns status_code and response of dictionary
+
+        Raises
+        ------
+        ValueError
+            if page_size is 0 or less than 0
+        """
+        if page_size <= 0:  # 1 <= page_size <= 100
+            raise ValueError("page_size must be more than 0")
+        elif page_size > 100:  # 1 <= page_size <= 100
+            page_size = 100
+            warnings.warn(
+                "page_size must be up to 100, page_size is set to 100", UserWarning
+            )
+
+        body: Dict[str, Any] = {"page_size": page_size}
+        if query is not None:
+            body["query"] = query
+        if filter is not None:
+            body["filter"] = filter
+        if sort is not None:
+            body["sort"] = sort
+        if start_cursor is not None:
+            body["start_cursor"] = start_cursor
+
+        res = self._request("POST", f"{self.base_url}/search", data=dumps(body))
+        return res.status_code, res.json()
+
+    def iter_search(
+        self,
+        *,
+        query: Optional[str] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, Any]] = None,
+        page_size: int = 100,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all results of `search`, following cursors.
+        Next results are requested only when the previous ones are consumed
+
+        Parameters
+        ----------
+        query : str, optional
+            Text to compare against titles. All pages and databases are returned if not given
+        filter : Dict, optional
+            e.g. `{"property": "object", "value": "page"}` to search only pages
+        sort : Dict, optional
+            e.g. `{"direction": "descending", "timestamp": "last_edited_time"}`
+        page_size : int, default=100
+            The number of results fetched in a request. Maximum: 100
+
+        Yields
+        ------
+        Dict[str, Any]
+            Page or database object
+
+        Raises
+        ------
+        ValueError
+            if a request fails
+        """
+        start_cursor = None
+        while True:
+            status_code, res = self.search(
+                query=query, filter=filter, sort=sort, start_cursor=start_cursor, page_size=page_size
+            )
+            if status_code != 200:
+                raise ValueError(f"failed to search ({status_code}): {res.get('message')}")
+            yield from res["results"]
+            if not res.get("has_more"):
+                return
+            start_cursor = res["next_cursor"]
@@ -0,0 +1,180 @@
+import threading
+from typing import Any, Dict, Optional
+
+__all__ = [
+    "AdaptiveLimit",
+]
+
+
+class AdaptiveLimit:
+    """
+    AdaptiveLimit
+    Limit of concurrent requests adjusted by additive-increase/multiplicative-decrease (AIMD)
+
+    Each request takes a slot, and waits while the limit is reached.
+    When a request is throttled (429), or the smoothed latency inflates to `tolerance` times
+    the baseline latency, the limit is multiplied by `decrease`, once per round of requests.
+    Otherwise each request completed while at least half the limit is in use adds `1 / limit`,
+    i.e. a busy limit grows by one per round, so it converges on the highest concurrency
+    the API sustains. An idle limit does not grow
+
+    Attributes
+    ----------
+    limit : float
+        Current limit of concurrent requests
+    in_flight : int
+        Number of requests holding a slot
+    min_limit : int
+        Lower bound of the limit
+    max_limit : int
+        Upper bound of the limit
+    stats : Dict[str, Any]
+        Limit, requests in flight, counters and latencies
+
+    Methods
+    -------
+    acquire()
+        Take a slot, wait until one is available
+    release(token, latency, throttled)
+        Return a slot, and adjust the limit by the outcome of the request
+    """
+
+    def __init__(
+        self,
+        initial: float = 4.0,
+        *,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        decrease: float = 0.5,
+        tolerance: float = 2.0,
+        smoothing: float = 0.1,
+    ):
+        """
+        Parameters
+        ----------
+        initial : float, default=4.0
+            Initial limit
+        min_limit : int, default=1
+            Lower bound of the limit
+        max_limit : int, default=64
+            Upper bound of the limit
+        decrease : float, default=0.5
+            Factor which the limit is multiplied by on congestion, in (0, 1)
+        tolerance : float, default=2.0
+            Ratio of the smoothed latency to the baseline latency regarded as congestion
+        smoothing : float, default=0.1
+            Weight of the latest latency in the smoothed latency, in (0, 1]
+
+        Raises
+        ------
+        ValueError
+            if a bound or factor is out of range
+        """
+        if not 0 < min_limit <= max_limit:
+            raise ValueError(f"limits must be 0 < min_limit <= max_limit, but {min_limit} and {max_limit} are given")
+        if not 0 < decrease < 1:
+            raise ValueError(f"decrease must be in (0, 1), but {decrease} is given")
+        if tolerance <= 1:
+            raise ValueError(f"tolerance must be more than 1, but {tolerance} is given")
+        if not 0 < smoothing <= 1:
+            raise ValueError(f"smoothing must be in (0, 1], but {smoothing} is given")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease = decrease
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self.__limit = float(min(max(initial, min_limit), max_limit))
+        self.__in_flight = 0
+        self.__epoch = 0  # incremented by each decrease
+        self.__baseline: Optional[float] = None  # latency without congestion
+        self.__latency: Optional[float] = None  # smoothed latency
+        self.__counters = {"requests": 0, "throttled": 0, "decreases": 0}
+        self.__cond = threading.Condition()
+
+    def __repr__(self) -> str:
+        return f"AdaptiveLimit(limit={self.limit:.2f}, min_limit={self.min_limit}, max_limit={self.max_limit})"
+
+    @property
+    def limit(self) -> float:
+        return self.__limit
+
+    @property
+    def in_flight(self) -> int:
+        return self.__in_flight
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Limit, requests in flight, counters `requests`, `throttled` (429) and `decreases`,
+        and seconds of the baseline and smoothed latencies
+        """
+        with self.__cond:
+            return {
+                "limit": self.__limit,
+                "in_flight": self.__in_flight,
+                **self.__counters,
+                "baseline_latency": self.__baseline,
+                "latency": self.__latency,
+            }
+
+    def acquire(self) -> int:
+        """
+        acquire()
+            Take a slot, wait until one is available
+
+        Returns
+        -------
+        int
+            Token to pass to `release`
+        """
+        with self.__cond:
+            while self.__in_flight >= int(self.__limit):
+                self.__cond.wait()
+            self.__in_flight += 1
+            return self.__epoch
+
+    def release(self, token: int, latency: Optional[float] = None, throttled: bool = False) -> None:
+        """
+        release(token, latency, throttled)
+            Return a slot, and adjust the limit by the outcome of the request
+
+        Parameters
+        ----------
+        token : int
+            Token returned by `acquire`
+        latency : float, optional
+            Seconds of the request, None if it failed without a response
+        throttled : bool, default=False
+            Whether the request was rejected with 429
+        """
+        with self.__cond:
+            busy = self.__in_flight * 2 >= self.__limit
+            self.__in_flight -= 1
+            self.__counters["requests"] += 1
+            congested = throttled
+            if throttled:
+                self.__counters["throttled"] += 1
+            elif latency is not None:
+                congested = self._observe(latency)
+            if congested:
+                if token == self.__epoch:  # once per round, later requests were sent at the old limit
+                    self.__limit = max(self.min_limit, self.__limit * self.decrease)
+                    self.__epoch += 1
+                    self.__counters["decreases"] += 1
+            elif latency is not None and busy:
+                self.__limit = min(self.max_limit, self.__limit + 1 / self.__limit)
+            self.__cond.notify_all()
+
+    def _observe(self, latency: float) -> bool:
+        """
+        Update the latencies, return whether the smoothed latency is inflated
+        """
+        if self.__baseline is None or latency < self.__baseline:
+            self.__baseline = latency
+        else:  # drifts up slowly, e.g. when the API gets slower for everyone
+            self.__baseline += (latency - self.__baseline) * self.smoothing * 0.1
+        if self.__latency is None:
+            self.__latency = latency
+        else:
+            self.__latency += (latency - self.__latency) * self.smoothing
+        return self.__latency > self.__baseline * self.tolerance
@@ -0,0 +1,219 @@
+import queue
+import threading
+import time
+from collections import deque
+from contextvars import copy_context
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+__all__ = [
+    "Hedger",
+]
+
+
+class Hedger:
+    """
+    Hedger
+    Hedge idempotent requests against slow responses
+
+    A request which has not returned within the `percentile` of recent latencies is sent again,
+    and whichever response comes first is returned (the other one is discarded).
+    Hedges are paid from a budget which earns `budget` of a hedge per request,
+    so hedges are at most that fraction of requests, and of the rate limit when requests are throttled.
+    Requests run on a pool of threads, each of which keeps its own connections
+
+    Attributes
+    ----------
+    percentile : float
+        Percentile of recent latencies after which a request is hedged, e.g. 0.95
+    budget : float
+        Maximum fraction of requests which are hedged
+    delay : float, optional
+        Current seconds after which a request is hedged, None until `min_samples` latencies are observed
+    stats : Dict[str, Any]
+        Counters of requests, hedges and budget
+
+    Methods
+    -------
+    call(func: Callable[[], Any])
+        Call func, and call it again if it is slow
+    reset()
+        Reset the counters
+    close()
+        Stop the threads
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        budget: float = 0.1,
+        *,
+        window: int = 1000,
+        min_samples: int = 20,
+        min_delay: float = 0.05,
+        max_burst: float = 10.0,
+        max_workers: int = 64,
+    ):
+        """
+        Parameters
+        ----------
+        percentile : float, default=0.95
+            Percentile of recent latencies after which a request is hedged, in (0, 1)
+        budget : float, default=0.1
+            Maximum fraction of requests which are hedged, in (0, 1]
+        window : int, default=1000
+            Number of recent latencies kept
+        min_samples : int, default=20
+            Number of latencies observed before requests are hedged
+        min_delay : float, default=0.05
+            Lower bound of seconds after which a request is hedged,
+            so requests which are fast anyway are not hedged for a jitter of a few milliseconds
+        max_burst : float, default=10.0
+            Maximum hedges saved in the budget, i.e. hedges which can be sent in a row
+        max_workers : int, default=64
+            Number of threads which send requests and hedges
+
+        Raises
+        ------
+        ValueError
+            if percentile or budget is out of range
+        """
+        if not 0 < percentile < 1:
+            raise ValueError(f"percentile must be in (0, 1), but {percentile} is given")
+        if not 0 < budget <= 1:
+            raise ValueError(f"budget must be in (0, 1], but {budget} is given")
+        self.percentile = percentile
+        self.budget = budget
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.max_burst = max_burst
+        self.max_workers = max_workers
+        self.__lock = threading.Lock()
+        self.__latencies: Deque[float] = deque(maxlen=window)
+        self.__delay: Optional[float] = None  # cached percentile, None if stale
+        self.__tokens = 0.0  # hedges which can be sent
+        self.__executor: Any = None  # created on the first call
+        self.__counters = {"requests": 0, "hedged": 0, "hedge_wins": 0, "denied": 0}
+
+    def __repr__(self) -> str:
+        return f"Hedger(percentile={self.percentile}, budget={self.budget})"
+
+    @property
+    def delay(self) -> Optional[float]:
+        with self.__lock:
+            return self._delay()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Counters as dictionary, `requests`, `hedged` (hedges sent), `hedge_wins` (hedges answered first),
+        `denied` (hedges not sent for lack of budget), `budget` (hedges which can be sent) and `delay`
+        """
+        with self.__lock:
+            return {**self.__counters, "budget": self.__tokens, "delay": self._delay()}
+
+    def reset(self) -> None:
+        """
+        reset()
+            Reset the counters, observed latencies are kept
+        """
+        with self.__lock:
+            self.__counters = dict.fromkeys(self.__counters, 0)
+
+    def close(self) -> None:
+        """
+        close()
+            Stop the threads after their requests. They are started again by the next call
+        """
+        with self.__lock:
+            executor, self.__executor = self.__executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _delay(self) -> Optional[float]:
+        if self.__delay is None and len(self.__latencies) >= self.min_samples:
+            latencies = sorted(self.__latencies)
+            self.__delay = max(self.min_delay, latencies[int(self.percentile * (len(latencies) - 1))])
+        return self.__delay
+
+    def _observe(self, seconds: float) -> None:
+        with self.__lock:
+            self.__latencies.append(seconds)
+            self.__delay = None
+
+    def _submit(self, func: Callable[[], Any], results: "queue.Queue[Any]", attempt: int) -> None:
+        def run() -> None:
+            start = time.monotonic()
+            try:
+                value = func()
+            except BaseException as e:
+                results.put((attempt, False, e))
+                return
+            self._observe(time.monotonic() - start)
+            results.put((attempt, True, value))
+
+        with self.__lock:
+            if self.__executor is None:
+                from concurrent.futures import ThreadPoolExecutor  # deferred, as it is slow to import
+
+                self.__executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="hedge")
+            executor = self.__executor
+        executor.submit(copy_context().run, run)  # in the lane of the caller
+
+    def _take(self) -> bool:
+        """
+        Take a hedge from the budget, return whether it was taken
+        """
+        with self.__lock:
+            if self.__tokens < 1:
+                self.__counters["denied"] += 1
+                return False
+            self.__tokens -= 1
+            self.__counters["hedged"] += 1
+            return True
+
+    def call(self, func: Callable[[], Any]) -> Any:
+        """
+        call(func: Callable[[], Any])
+            Call func, and call it again if it has not returned within `delay`
+
+        Parameters
+        ----------
+        func : Callable[[], Any]
+            Idempotent function, e.g. which sends a GET request
+
+        Returns
+        -------
+        Any
+            Result of the first call which returns
+
+        Raises
+        ------
+        Exception
+            raised by func, if every call raises
+        """
+        with self.__lock:
+            self.__counters["requests"] += 1
+            self.__tokens = min(self.max_burst, self.__tokens + self.budget)
+            delay = self._delay()
+        results: "queue.Queue[Any]" = queue.Queue()
+        self._submit(func, results, 0)
+        attempts = 1
+        errors: List[BaseException] = []
+        while True:
+            timeout = delay if attempts == 1 and delay is not None else None
+            try:
+                attempt, ok, value = results.get(timeout=timeout)
+            except queue.Empty:  # slow, hedge it
+                if self._take():
+                    self._submit(func, results, 1)
+                    attempts += 1
+                delay = None
+                continue
+            if ok:
+                if attempt == 1:
+                    with self.__lock:
+                        self.__counters["hedge_wins"] += 1
+                return value
+            errors.append(value)
+            if len(errors) == attempts:
+                raise errors[0]
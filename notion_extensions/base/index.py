@@ -0,0 +1,217 @@
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+__all__ = [
+    "TitleIndex",
+    "object_title",
+]
+
+_SORT = {"direction": "descending", "timestamp": "last_edited_time"}
+
+
+def object_title(obj: Dict[str, Any]) -> str:
+    """
+    Return the plain text title of a page or database object
+    """
+    if obj.get("object") == "database":
+        texts = obj.get("title", [])
+    else:
+        texts = next(
+            (prop["title"] for prop in obj.get("properties", {}).values() if prop.get("type") == "title"),
+            [],
+        )
+    return "".join(text.get("plain_text", "") for text in texts)
+
+
+def _normalize(title: str) -> str:
+    return " ".join(title.split()).casefold()
+
+
+class TitleIndex:
+    """
+    TitleIndex
+    Local index from titles to IDs of pages and databases
+
+    The index is filled from search results (or any page and database objects, e.g. of a mirror),
+    and kept fresh by `last_edited_time`: `refresh()` reads search results from the most recently
+    edited one and stops at the first one which is older than the last refresh.
+    Lookups are dictionary lookups of a title, case and whitespace insensitive.
+    The index is safe to share between threads
+
+    Attributes
+    ----------
+    client : NotionClient
+        Client used for searching
+    filter : Dict, optional
+        Filter of the search, e.g. `{"property": "object", "value": "page"}`
+    watermark : str, optional
+        `last_edited_time` of the most recently edited object in the index
+
+    Methods
+    -------
+    refresh(full: bool = False)
+        Add objects edited since the last refresh
+    add(*obj: Dict[str, Any])
+        Add page or database objects
+    find(title: str, refresh: bool = True)
+        Return IDs of objects with the title
+    get(title: str, refresh: bool = True)
+        Return the ID of the most recently edited object with the title
+
+    Examples
+    --------
+    >>> index = TitleIndex(client, filter={"property": "object", "value": "page"})
+    >>> page_id = index.get("Weekly report")
+    """
+
+    def __init__(self, client: Any, *, filter: Optional[Dict[str, Any]] = None):
+        """
+        Parameters
+        ----------
+        client : NotionClient
+            Client used for searching
+        filter : Dict, optional
+            Filter of the search, e.g. `{"property": "object", "value": "page"}`
+        """
+        self.client = client
+        self.filter = filter
+        self.__lock = threading.Lock()
+        self.__refresh_lock = threading.Lock()  # one refresh at a time
+        self.__ids: Dict[str, Set[str]] = {}  # normalized title -> IDs
+        self.__objects: Dict[str, Tuple[str, str]] = {}  # ID -> (normalized title, last_edited_time)
+        self.__watermark: Optional[str] = None
+
+    def __len__(self) -> int:
+        return len(self.__objects)
+
+    def __contains__(self, title: str) -> bool:
+        return _normalize(title) in self.__ids
+
+    @property
+    def watermark(self) -> Optional[str]:
+        return self.__watermark
+
+    def add(self, *obj: Dict[str, Any]) -> None:
+        """
+        add(*obj: Dict[str, Any])
+            Add page or database objects, e.g. search results.
+            An object older than the one already indexed is ignored,
+            and an archived object is removed
+
+        Parameters
+        ----------
+        *obj : Dict[str, Any]
+            Page or database objects
+        """
+        with self.__lock:
+            for o in obj:
+                self._add(o)
+
+    def _add(self, obj: Dict[str, Any]) -> None:
+        id_ = obj["id"]
+        edited = obj.get("last_edited_time", "")
+        current = self.__objects.get(id_)
+        if current is not None:
+            if current[1] > edited:  # ISO 8601 in UTC, ordered as strings
+                return
+            self.__ids[current[0]].discard(id_)
+            if not self.__ids[current[0]]:
+                del self.__ids[current[0]]
+            del self.__objects[id_]
+        if edited and (self.__watermark is None or edited > self.__watermark):
+            self.__watermark = edited
+        if obj.get("archived"):
+            return
+        title = _normalize(object_title(obj))
+        self.__objects[id_] = (title, edited)
+        self.__ids.setdefault(title, set()).add(id_)
+
+    def refresh(self, full: bool = False) -> int:
+        """
+        refresh(full: bool = False)
+            Add objects edited since the last refresh, by search results in descending order
+            of `last_edited_time`
+
+        Parameters
+        ----------
+        full : bool, default=False
+            If True, read all the search results and drop objects which are not found anymore
+
+        Returns
+        -------
+        int
+            Number of search results read
+        """
+        with self.__refresh_lock:
+            watermark = None if full else self.__watermark
+            seen: List[str] = []
+            results = self.client.iter_search(filter=self.filter, sort=_SORT)
+            count = 0
+            for obj in results:
+                # `last_edited_time` is rounded to minutes, objects at the watermark are read again
+                if watermark is not None and obj.get("last_edited_time", "") < watermark:
+                    break
+                self.add(obj)
+                seen.append(obj["id"])
+                count += 1
+            if full:
+                self._retain(seen)
+            return count
+
+    def _retain(self, ids: Iterable[str]) -> None:
+        keep = set(ids)
+        with self.__lock:
+            for id_ in [id_ for id_ in self.__objects if id_ not in keep]:
+                title, _ = self.__objects.pop(id_)
+                self.__ids[title].discard(id_)
+                if not self.__ids[title]:
+                    del self.__ids[title]
+
+    def find(self, title: str, refresh: bool = True) -> List[str]:
+        """
+        find(title: str, refresh: bool = True)
+            Return IDs of objects with the title, most recently edited first
+
+        Parameters
+        ----------
+        title : str
+            Title, compared case and whitespace insensitively
+        refresh : bool, default=True
+            If True and no object has the title, the index is refreshed and looked up again
+
+        Returns
+        -------
+        list of str
+            IDs, empty if no object has the title
+        """
+        key = _normalize(title)
+        ids = self._lookup(key)
+        if not ids and refresh:
+            self.refresh()
+            ids = self._lookup(key)
+        return ids
+
+    def _lookup(self, key: str) -> List[str]:
+        with self.__lock:
+            ids = self.__ids.get(key, ())
+            return sorted(ids, key=lambda id_: self.__objects[id_][1], reverse=True)
+
+    def get(self, title: str, refresh: bool = True) -> Optional[str]:
+        """
+        get(title: str, refresh: bool = True)
+            Return the ID of the most recently edited object with the title
+
+        Parameters
+        ----------
+        title : str
+            Title, compared case and whitespace insensitively
+        refresh : bool, default=True
+            If True and no object has the title, the index is refreshed and looked up again
+
+        Returns
+        -------
+        str, optional
+            ID, None if no object has the title
+        """
+        ids = self.find(title, refresh=refresh)
+        return ids[0] if ids else None
@@ -0,0 +1,210 @@
+import itertools
+import threading
+import zlib
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .bulk import BulkResult, run_bulk
+from .client import NotionClient
+from .ratelimit import RateLimiter
+from .utils import parse_id
+
+__all__ = [
+    "ClientPool",
+]
+
+
+class ClientPool:
+    """
+    ClientPool
+    Clients of several integrations with access to the same workspace, to add up their rate limits
+
+    Each API key has its own client and token bucket, as the API limits each integration separately.
+    Requests go to the client with the most tokens left, so the throughput of bulk operations
+    grows with the number of keys. Requests keyed by a parent object (e.g. appending children
+    to a block) always go to the same client, so they keep their order
+
+    Attributes
+    ----------
+    clients : list of NotionClient
+        Client of each API key
+
+    Methods
+    -------
+    client(sticky: str, optional)
+        Return the client for a request
+    run(func, ids, sticky: bool = False, workers: int, optional)
+        Call func with a client for each ID concurrently
+    archive_pages(page_ids, workers)
+        Archive (delete) many pages
+    delete_blocks(block_ids, workers)
+        Delete many blocks
+    close()
+        Close connections of all clients
+
+    Examples
+    --------
+    >>> with ClientPool(keys=[key1, key2, key3]) as pool:
+    ...     results = pool.archive_pages(page_ids=page_ids)  # up to 9 requests per second
+    ...     pool.client(page_id).append_block_children(block_id=page_id, children=children)
+    """
+
+    def __init__(
+        self,
+        *,
+        keys: Iterable[str],
+        rate_limit: Optional[float] = 3.0,
+        **kwargs: Any,
+    ):
+        """
+        Parameters
+        ----------
+        keys : iterable of str
+            API keys of the integrations
+        rate_limit : float, optional, default=3.0
+            Requests per second of each key. Requests are spread round-robin if None
+        **kwargs
+            Passed to each NotionClient, e.g. `max_retries` and `base_url`
+
+        Raises
+        ------
+        ValueError
+            if no key is given
+        """
+        self.__clients: List[NotionClient] = [
+            NotionClient(key=key, rate_limit=RateLimiter(rate_limit) if rate_limit is not None else None, **kwargs)
+            for key in keys
+        ]
+        if not self.__clients:
+            raise ValueError("at least one key must be given")
+        self.__next = itertools.count()
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__clients)
+
+    def __repr__(self) -> str:
+        return f"ClientPool(clients={len(self)})"
+
+    def __enter__(self) -> "ClientPool":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @property
+    def clients(self) -> List[NotionClient]:
+        return list(self.__clients)
+
+    @property
+    def metrics(self) -> List[Dict[str, Any]]:
+        """
+        `metrics` of each client, with `tokens` left in its bucket
+        """
+        return [
+            {**client.metrics, "tokens": client.limiter.tokens if client.limiter is not None else None}
+            for client in self.__clients
+        ]
+
+    def close(self) -> None:
+        """
+        close()
+            Close connections of all clients
+        """
+        for client in self.__clients:
+            client.close()
+
+    def client(self, sticky: Optional[str] = None) -> NotionClient:
+        """
+        client(sticky: str, optional)
+            Return the client for a request
+
+        Parameters
+        ----------
+        sticky : str, optional
+            ID or URL of the object whose requests must keep their order, e.g. the parent block
+            of appended children. The same object always gets the same client.
+            If None, the client with the most tokens left is returned
+
+        Returns
+        -------
+        NotionClient
+        """
+        clients = self.__clients
+        if sticky is not None:
+            try:
+                sticky = parse_id(sticky, "block")  # an ID and its URL get the same client
+            except ValueError:
+                pass
+            return clients[zlib.crc32(sticky.encode()) % len(clients)]  # stable between processes
+        if clients[0].limiter is None:
+            with self.__lock:
+                return clients[next(self.__next) % len(clients)]
+        return max(clients, key=lambda client: client.limiter.tokens)  # type: ignore
+
+    def run(
+        self,
+        func: Callable[[NotionClient, str], Tuple[int, Dict[str, Any]]],
+        ids: Iterable[str],
+        *,
+        sticky: bool = False,
+        workers: Optional[int] = None,
+    ) -> List[BulkResult]:
+        """
+        run(func, ids, sticky: bool = False, workers: int, optional)
+            Call func with a client for each ID concurrently, and collect the result of each ID
+
+        Parameters
+        ----------
+        func : Callable[[NotionClient, str], Tuple[int, Dict[str, Any]]]
+            Function which sends a request for an ID with the client, and returns status_code and response
+        ids : iterable of str
+            IDs or URLs
+        sticky : bool, default=False
+            If True, the client is chosen by the ID, so requests for the same ID keep their order
+        workers : int, optional
+            Number of concurrent requests, 4 per client if not given
+
+        Returns
+        -------
+        list of BulkResult
+            Result of each ID, in the order of ids
+        """
+        if workers is None:
+            workers = 4 * len(self.__clients)
+        return run_bulk(lambda id_: func(self.client(id_ if sticky else None), id_), ids, workers)
+
+    def archive_pages(self, *, page_ids: Iterable[str], workers: Optional[int] = None) -> List[BulkResult]:
+        """
+        Archive (delete) many pages concurrently with all the clients
+
+        Parameters
+        ----------
+        page_ids : iterable of str or UrlLike
+            Identifiers for Notion pages. ID or URL
+        workers : int, optional
+            Number of concurrent requests, 4 per client if not given
+
+        Returns
+        -------
+        list of BulkResult
+            Result of each page, in the order of page_ids
+        """
+        return self.run(lambda client, page_id: client.delete_page(page_id=page_id), page_ids, workers=workers)
+
+    def delete_blocks(self, *, block_ids: Iterable[str], workers: Optional[int] = None) -> List[BulkResult]:
+        """
+        Delete many blocks concurrently with all the clients
+
+        Parameters
+        ----------
+        block_ids : iterable of str or UrlLike
+            Identifiers for Notion blocks. ID or URL
+        workers : int, optional
+            Number of concurrent requests, 4 per client if not given
+
+        Returns
+        -------
+        list of BulkResult
+            Result of each block, in the order of block_ids
+        """
+        return self.run(lambda client, block_id: client.delete_block(block_id=block_id), block_ids, workers=workers)
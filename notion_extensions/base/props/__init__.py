@@ -1,9 +1,23 @@
-from . import common
-from . import page
-from . import block
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from . import block, common, compact, page
 
 __all__ = [
     "block",
     "common",
+    "compact",
     "page",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # subpackages are imported at their first access (PEP 562)
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return importlib.import_module(f".{name}", __name__)
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *__all__})
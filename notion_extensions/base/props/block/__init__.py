@@ -1,25 +1,87 @@
-from .block import *
-from .bookmark import *
-from .breadcrumb import *
-from .bulleted_list import *
-from .callout import *
-from .children import *
-from .code import *
-from .column import *
-from .divider import *
-from .embed import *
-from .equation import *
-from .file import *
-from .heading import *
-from .image import *
-from .link_to_page import *
-from .numbered_list import *
-from .paragraph import *
-from .pdf import *
-from .quote import *
-from .synced import *
-from .table import *
-from .table_of_contents import *
-from .todo import *
-from .toggle import *
-from .video import *
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .block import *
+    from .bookmark import *
+    from .breadcrumb import *
+    from .bulleted_list import *
+    from .callout import *
+    from .children import *
+    from .code import *
+    from .column import *
+    from .divider import *
+    from .embed import *
+    from .equation import *
+    from .file import *
+    from .heading import *
+    from .image import *
+    from .link_to_page import *
+    from .numbered_list import *
+    from .paragraph import *
+    from .pdf import *
+    from .quote import *
+    from .synced import *
+    from .table import *
+    from .table_of_contents import *
+    from .todo import *
+    from .toggle import *
+    from .video import *
+
+# Name to the module defining it, modules are imported at the first access of their names (PEP 562)
+_LAZY: Dict[str, str] = {
+    "Block": "block",
+    "Bookmark": "bookmark",
+    "BreadCrumb": "breadcrumb",
+    "BulletedListItem": "bulleted_list",
+    "BulletedList": "bulleted_list",
+    "Callout": "callout",
+    "Children": "children",
+    "split_blocks": "children",
+    "Code": "code",
+    "LANGUAGES": "code",
+    "Column": "column",
+    "ColumnList": "column",
+    "Divider": "divider",
+    "Embed": "embed",
+    "EMBED_PLATFORMS": "embed",
+    "Equation": "equation",
+    "File": "file",
+    "Heading1": "heading",
+    "Heading2": "heading",
+    "Heading3": "heading",
+    "Image": "image",
+    "IMAGE_EXT": "image",
+    "LinkToPage": "link_to_page",
+    "NumberedListItem": "numbered_list",
+    "NumberedList": "numbered_list",
+    "Paragraph": "paragraph",
+    "Pdf": "pdf",
+    "Quote": "quote",
+    "OriginalSynced": "synced",
+    "ReferenceSynced": "synced",
+    "TableRow": "table",
+    "Table": "table",
+    "TableOfContents": "table_of_contents",
+    "ToDo": "todo",
+    "ToDoList": "todo",
+    "Toggle": "toggle",
+    "Video": "video",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY.values():  # submodule, e.g. `block.code`
+        return importlib.import_module(f".{name}", __name__)
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value  # later accesses do not reach __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY})
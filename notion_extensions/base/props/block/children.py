@@ -1,12 +1,51 @@
-from typing import Dict, List, Union
+from typing import Any, Dict, Iterable, List, Union
 
+from ...utils.limits import RICH_TEXT_LENGTH, SPLITTABLE_BLOCK_TYPES
 from .block import Block
 
 __all__ = [
     "Children",
+    "split_blocks",
 ]
 
 
+def split_blocks(blocks: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Split blocks whose text has more rich text objects than the API accepts (100)
+    into sibling blocks of the same type. Nested children are kept by the last sibling
+
+    Parameters
+    ----------
+    blocks : iterable of Block
+        Blocks to split
+
+    Returns
+    -------
+    list of Block
+        Blocks within the limit, given blocks are reused if they are small enough
+    """
+    out: List[Dict[str, Any]] = []
+    for block in blocks:
+        if not isinstance(block, dict):  # compact blocks split themselves while serializing
+            out.append(block)
+            continue
+        type_ = block.get("type", "")
+        body = block.get(type_) if type_ in SPLITTABLE_BLOCK_TYPES else None
+        if not isinstance(body, dict):
+            out.append(block)
+            continue
+        texts = body.get("text")
+        if not isinstance(texts, list) or len(texts) <= RICH_TEXT_LENGTH:
+            out.append(block)
+            continue
+        last = (len(texts) - 1) // RICH_TEXT_LENGTH * RICH_TEXT_LENGTH
+        for start in range(0, len(texts), RICH_TEXT_LENGTH):
+            piece = {k: v for k, v in body.items() if k != "children" or start == last}
+            piece["text"] = texts[start : start + RICH_TEXT_LENGTH]
+            out.append({**block, type_: piece})
+    return out
+
+
 class Children(Block):
     """
     Children
@@ -21,6 +60,9 @@ class Children(Block):
         Clear data of title
     json()
         Return this class as dictionary
+
+    .. note:: Blocks whose text has more than 100 rich text objects
+              are split into sibling blocks of the same type
     """
 
     TEMPLATE: Dict[str, List[Block]] = {"children": []}
@@ -30,9 +72,20 @@ class Children(Block):
         *block: Block,
     ):
         super().__init__()
-        self.__blocks = list(block)
+        self.__blocks = split_blocks(block)
         self["children"] = self.__blocks
 
+    @classmethod
+    def _from_list(cls, blocks: List[Dict[str, Any]]) -> "Children":
+        """
+        Return Children which holds `blocks` as it is, without copying nor splitting.
+        For blocks which are built by the library itself and known to be within the limits
+        """
+        children = cls.__new__(cls)
+        dict.__setitem__(children, "children", blocks)
+        children.__blocks = blocks
+        return children
+
     def __add__(self, other: Union[Block, List[Block]]):
         if isinstance(other, list):
             self.extend(other)
@@ -53,7 +106,7 @@ class Children(Block):
         block : Block
             Block you append to Children
         """
-        self.__blocks.append(block)
+        self.__blocks.extend(split_blocks((block,)))
         self["children"] = self.__blocks
 
     def extend(self, blocks: List[Block]) -> None:
@@ -66,7 +119,7 @@ class Children(Block):
         blocks : list of Block
             List of block you append to Children
         """
-        self.__blocks.extend(blocks)
+        self.__blocks.extend(split_blocks(blocks))
         self["children"] = self.__blocks
 
     def insert(self, index: int, block: Block) -> None:
@@ -81,7 +134,9 @@ class Children(Block):
         block : Block
             Block you insert into Children
         """
-        self.__blocks.insert(index, block)
+        if index < 0:  # same position as list.insert
+            index = max(len(self.__blocks) + index, 0)
+        self.__blocks[index:index] = split_blocks((block,))
         self["children"] = self.__blocks
 
     def pop(self, index=None):
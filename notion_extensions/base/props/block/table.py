@@ -1,14 +1,81 @@
-from typing import Dict, List, Union
+import math
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
+from ...utils.limits import CHILDREN_LENGTH, TEXT_CONTENT_LENGTH
 from .block import Block
 from .children import Children
-from ..common import RichText
+from ..common import Annotations, RichText, Text
 
 __all__ = [
     "TableRow",
     "Table",
 ]
 
+_ANNOTATIONS = Annotations()["annotations"]  # shared, read-only
+
+
+def _text_dicts(content: str) -> List[Dict[str, Any]]:
+    """
+    Return rich text objects of plain text, split by the content length limit of the API
+    """
+    return [
+        {
+            "type": "text",
+            "text": {"content": content[start : start + TEXT_CONTENT_LENGTH], "link": None},
+            "annotations": _ANNOTATIONS,
+        }
+        for start in range(0, len(content), TEXT_CONTENT_LENGTH)
+    ]
+
+
+def _cell(value: Any) -> List[Dict[str, Any]]:
+    """
+    Return a cell, array of rich text objects, of a value of columnar data.
+    None and NaN are empty cells, values other than str, Text and RichText are converted by `str()`
+    """
+    if isinstance(value, str):
+        if len(value) <= TEXT_CONTENT_LENGTH:  # fast path of the most common case
+            return [
+                {
+                    "type": "text",
+                    "text": {"content": value, "link": None},
+                    "annotations": _ANNOTATIONS,
+                }
+            ]
+        return _text_dicts(value)
+    if _is_missing(value):
+        return []
+    if isinstance(value, RichText):  # its list of texts, RichText.__getitem__ is typed for an index
+        texts: List[Dict[str, Any]] = dict.__getitem__(value, value.key)
+        return texts
+    if isinstance(value, Text):
+        cell: List[Dict[str, Any]] = [value]  # Text is a rich text object
+        return cell
+    return _text_dicts(str(value))
+
+
+def _is_missing(value: Any) -> bool:
+    """
+    Return True if value is None, NaN, or a missing value of pandas (NA, NaT)
+    """
+    if value is None:
+        return True
+    if isinstance(value, float):
+        return math.isnan(value)
+    return type(value).__name__ in ("NAType", "NaTType")
+
+
+def _to_list(values: Any) -> List[Any]:
+    """
+    Return values as list, NumPy arrays and pandas objects are converted in one pass by `tolist()`
+    """
+    tolist = getattr(values, "tolist", None)
+    if tolist is not None:
+        return tolist()
+    if isinstance(values, str):
+        return [values]
+    return list(values)
+
 
 class TableRow(Block):
     """
@@ -51,6 +118,16 @@ class TableRow(Block):
         for c in cell:
             self["table_row"]["cells"].append(c[c.key])
 
+    @classmethod
+    def _from_cells(cls, cells: List[List[Dict[str, Any]]]) -> "TableRow":
+        """
+        Return TableRow which holds `cells` as it is, without copying
+        """
+        row = cls.__new__(cls)
+        dict.__setitem__(row, "type", "table_row")
+        dict.__setitem__(row, "table_row", {"cells": cells})
+        return row
+
     def __add__(self, other: Union[RichText, List[RichText]]):
         if isinstance(other, list):
             self.extend(other)
@@ -199,6 +276,156 @@ class Table(Block):
         self.__children = Children(*table_row)
         self["table"].update(self.__children)
 
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[Sequence[Any]],
+        *,
+        has_column_header: bool = False,
+        has_row_header: bool = False,
+    ) -> "Table":
+        """
+        from_rows(rows: Iterable[Sequence[Any]], has_column_header: bool = False, has_row_header: bool = False)
+            Build Table from row-major data in one pass.
+            Rows are built as dictionary directly, without the copies of `TableRow` and `Children`
+
+        Parameters
+        ----------
+        rows : iterable of sequence
+            Rows of cells, e.g. list of list, 2-D NumPy array or pandas DataFrame.
+            A cell is str, Text, RichText, or any value converted by `str()`.
+            None and NaN are empty cells
+        has_column_header : bool, default=False
+            Whether or not the table has a column header
+        has_row_header : bool, default=False
+            Whether or not the table has a header row
+
+        Returns
+        -------
+        Table
+
+        Raises
+        ------
+        ValueError
+            if there is no row or rows have different lengths
+        """
+        itertuples = getattr(rows, "itertuples", None)
+        if itertuples is not None:  # pandas DataFrame
+            rows = itertuples(index=False, name=None)
+        cells = [[_cell(value) for value in _to_list(row)] for row in _to_list(rows)]
+        return cls._from_cells(cells, has_column_header=has_column_header, has_row_header=has_row_header)
+
+    @classmethod
+    def from_columns(
+        cls,
+        columns: Union[Sequence[Sequence[Any]], Any],
+        *,
+        has_column_header: bool = False,
+        has_row_header: bool = False,
+    ) -> "Table":
+        """
+        from_columns(columns: Sequence[Sequence[Any]], has_column_header: bool = False, has_row_header: bool = False)
+            Build Table from column-major data in one pass.
+            Each column is converted at once, by `tolist()` for NumPy arrays and pandas Series
+
+        Parameters
+        ----------
+        columns : sequence of sequence or mapping of sequence
+            Columns of cells, e.g. list of list, dict of list, dict of NumPy array or pandas DataFrame.
+            If columns is a mapping and has_column_header is True,
+            its keys are used as the first row of the table
+        has_column_header : bool, default=False
+            Whether or not the table has a column header
+        has_row_header : bool, default=False
+            Whether or not the table has a header row
+
+        Returns
+        -------
+        Table
+
+        Raises
+        ------
+        ValueError
+            if there is no column or columns have different lengths
+        """
+        header: Optional[List[Any]] = None
+        items = getattr(columns, "items", None)
+        if items is not None:  # dict or pandas DataFrame
+            pairs = list(items())
+            columns = [column for _, column in pairs]
+            if has_column_header:
+                header = [name for name, _ in pairs]
+        elif getattr(columns, "ndim", 1) == 2:  # 2-D NumPy array
+            array: Any = columns
+            columns = array.T
+        values = [[_cell(value) for value in _to_list(column)] for column in _to_list(columns)]
+        if len({len(column) for column in values}) > 1:
+            raise ValueError(
+                "columns must have the same length, "
+                f"but lengths {sorted({len(column) for column in values})} are given"
+            )
+        cells = [list(row) for row in zip(*values)]
+        if header is not None:
+            cells.insert(0, [_cell(name) for name in header])
+        return cls._from_cells(cells, has_column_header=has_column_header, has_row_header=has_row_header)
+
+    @classmethod
+    def _from_cells(
+        cls,
+        cells: List[List[List[Dict[str, Any]]]],
+        has_column_header: bool,
+        has_row_header: bool,
+    ) -> "Table":
+        if not cells:
+            raise ValueError("table must have at least 1 table_row")
+        table_width = len(cells[0])
+        for row in cells:  # Validate length of table row
+            if len(row) != table_width:
+                raise ValueError(
+                    "table_width must be equal to table_row size, "
+                    f"expected {table_width} but {len(row)} is given"
+                )
+        table = cls(table_width, has_column_header=has_column_header, has_row_header=has_row_header)
+        table.children = Children._from_list([TableRow._from_cells(row) for row in cells])
+        return table
+
+    def stream(self, size: int = CHILDREN_LENGTH) -> Tuple["Table", Iterator[Children]]:
+        """
+        stream(size: int = 100)
+            Split this table into requests within the children limit of the API
+
+        Parameters
+        ----------
+        size : int, default=100
+            Number of rows in a request
+
+        Returns
+        -------
+        Tuple[Table, Iterator[Children]]
+            Table with the first `size` rows, which is appended to create the table,
+            and batches of the rest rows, which are appended to the created table block.
+            Rows are shared with this table, not copied
+
+        Examples
+        --------
+        >>> head, batches = table.stream()
+        >>> status_code, created = client.append_block_children(block_id=page_id, children=Children(head))
+        >>> table_id = created["results"][-1]["id"]
+        >>> for batch in batches:
+        ...     client.append_block_children(block_id=table_id, children=batch)
+        """
+        if size < 1 or size > CHILDREN_LENGTH:
+            raise ValueError(f"size must be in 1 to {CHILDREN_LENGTH}, but {size} is given")
+        rows = self.__children["children"]
+        head = type(self)(
+            self.table_width,
+            has_column_header=self.has_column_header,
+            has_row_header=self.has_row_header,
+        )
+        head.children = Children._from_list(rows[:size])
+        batches = (Children._from_list(rows[start : start + size]) for start in range(size, len(rows), size))
+        return head, batches
+
     @property
     def table_width(self) -> int:
         return self["table"]["table_width"]
@@ -1,6 +1,9 @@
 import copy
 import warnings
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple, Union
+
+from ...utils import runs
+from ...utils.frozen import FrozenDict
 
 __all__ = [
     "BaseProps",
@@ -8,6 +11,8 @@ __all__ = [
     "PlainText",
     "Text",
     "RichText",
+    "merge_runs",
+    "split_runs",
     "FileObject",
     "Emoji",
     "Icon",
@@ -89,11 +94,24 @@ class BaseProps(dict):
         raise NotImplementedError
 
 
+class _Styles(FrozenDict):
+    """
+    Styles of interned annotations, with the styles which differ from the API defaults
+    precomputed for serializers (`non_defaults`)
+    """
+
+    non_defaults: FrozenDict
+
+
 class Annotations(BaseProps):
     """
     Annotations
     Text property values of a common structure
 
+    Annotations are immutable and interned, so one instance is shared
+    by every Text which has the same combination of styles.
+    Use `replace()` to get annotations with some styles changed
+
     Attributes
     ----------
     bold : bool, default=False
@@ -108,11 +126,13 @@ class Annotations(BaseProps):
         code text
     color : str, default='default'
         text color
+    non_defaults : dict
+        styles which differ from the API defaults
 
     Methods
     -------
-    clear()
-        Clear data of text
+    replace(**changes)
+        Return annotations whose given styles are changed
     """
 
     TEMPLATE: Dict[str, Dict[str, Union[str, bool]]] = {
@@ -125,9 +145,10 @@ class Annotations(BaseProps):
             "color": "default",
         },
     }
+    __interned: Dict[Tuple, "Annotations"] = {}
 
-    def __init__(
-        self,
+    def __new__(
+        cls,
         bold: bool = False,
         italic: bool = False,
         strikethrough: bool = False,
@@ -135,86 +156,93 @@ class Annotations(BaseProps):
         code: bool = False,
         color: str = "default",
     ):
-        super().__init__()
-        self.bold = bold
-        self.italic = italic
-        self.strikethrough = strikethrough
-        self.underline = underline
-        self.code = code
-        self.color = color
+        key = (cls, bold, italic, strikethrough, underline, code, color)
+        self = cls.__interned.get(key)
+        if self is None:
+            self = super().__new__(cls)
+            styles = _Styles(
+                bold=bold,
+                italic=italic,
+                strikethrough=strikethrough,
+                underline=underline,
+                code=code,
+                color=color,
+            )
+            styles.non_defaults = FrozenDict(
+                (k, v) for k, v in styles.items() if v != cls.TEMPLATE["annotations"][k]
+            )
+            dict.__setitem__(self, "annotations", styles)
+            self = cls.__interned.setdefault(key, self)
+        return self
 
-    @property
-    def bold(self):
-        return self["annotations"]["bold"]
+    def __init__(self, *args, **kwargs):  # already built by __new__
+        pass
 
-    @bold.setter
-    def bold(self, value: bool):
-        self["annotations"]["bold"] = value
+    def __setitem__(self, key: Any, item: Any):
+        raise TypeError("Annotations is immutable, use replace()")
 
-    @bold.deleter
-    def bold(self) -> None:
-        self["annotations"]["bold"] = False
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (type(self), tuple(self["annotations"].values()))
 
     @property
-    def italic(self):
-        return self["annotations"]["italic"]
+    def non_defaults(self) -> Dict[str, Union[str, bool]]:
+        """
+        Styles which differ from the API defaults, shared and read-only
+        """
+        return self["annotations"].non_defaults
 
-    @italic.setter
-    def italic(self, value: bool):
-        self["annotations"]["italic"] = value
+    def replace(self, **changes: Union[str, bool]) -> "Annotations":
+        """
+        replace(**changes)
+            Return annotations whose given styles are changed
 
-    @italic.deleter
-    def italic(self) -> None:
-        self["annotations"]["italic"] = False
+        Parameters
+        ----------
+        **changes : bool or str
+            styles to change, e.g. `bold=True`
+
+        Returns
+        -------
+        Annotations
+            interned annotations
+        """
+        values = dict(self["annotations"])
+        for key, value in changes.items():
+            if key not in values:
+                raise ValueError(f"`{key}` is not a style of annotations")
+            values[key] = value
+        return type(self)(**values)
 
     @property
-    def strikethrough(self):
-        return self["annotations"]["strikethrough"]
+    def bold(self) -> bool:
+        return self["annotations"]["bold"]
 
-    @strikethrough.setter
-    def strikethrough(self, value: bool):
-        self["annotations"]["strikethrough"] = value
+    @property
+    def italic(self) -> bool:
+        return self["annotations"]["italic"]
 
-    @strikethrough.deleter
-    def strikethrough(self) -> None:
-        self["annotations"]["strikethrough"] = False
+    @property
+    def strikethrough(self) -> bool:
+        return self["annotations"]["strikethrough"]
 
     @property
-    def underline(self):
+    def underline(self) -> bool:
         return self["annotations"]["underline"]
 
-    @underline.setter
-    def underline(self, value: bool):
-        self["annotations"]["underline"] = value
-
-    @underline.deleter
-    def underline(self) -> None:
-        self["annotations"]["underline"] = False
-
     @property
-    def code(self):
+    def code(self) -> bool:
         return self["annotations"]["code"]
 
-    @code.setter
-    def code(self, value: bool):
-        self["annotations"]["code"] = value
-
-    @code.deleter
-    def code(self) -> None:
-        self["annotations"]["code"] = False
-
     @property
-    def color(self):
+    def color(self) -> str:
         return self["annotations"]["color"]
 
-    @color.setter
-    def color(self, value: str):
-        self["annotations"]["color"] = value
-
-    @color.deleter
-    def color(self) -> None:
-        self["annotations"]["color"] = "default"
-
 
 class PlainText(BaseProps):
     """
@@ -302,6 +330,8 @@ class Text(BaseProps):
         code text
     color : str, default='default'
         text color
+    annotations : Annotations
+        interned annotations of the styles above
 
     Methods
     -------
@@ -315,14 +345,7 @@ class Text(BaseProps):
             "content": "",
             "link": None,
         },
-        "annotations": {
-            "bold": False,
-            "italic": False,
-            "strikethrough": False,
-            "underline": False,
-            "code": False,
-            "color": "default",
-        },
+        "annotations": Annotations()["annotations"],  # shared, not copied
     }
 
     def __init__(
@@ -372,23 +395,32 @@ class Text(BaseProps):
         self.__text.link = value
         self.update(self.__text)
 
-    @text.deleter
+    @link.deleter
     def link(self) -> None:
         del self.__text.link
         self.update(self.__text)
 
+    @property
+    def annotations(self) -> Annotations:
+        return self.__annotations
+
+    @annotations.setter
+    def annotations(self, value: Annotations) -> None:
+        self.__annotations = value
+        self.update(self.__annotations)
+
     @property
     def bold(self):
         return self.__annotations.bold
 
     @bold.setter
     def bold(self, value: bool):
-        self.__annotations.bold = value
+        self.__annotations = self.__annotations.replace(bold=value)
         self.update(self.__annotations)
 
     @bold.deleter
     def bold(self) -> None:
-        del self.__annotations.bold
+        self.__annotations = self.__annotations.replace(bold=False)
         self.update(self.__annotations)
 
     @property
@@ -397,12 +429,12 @@ class Text(BaseProps):
 
     @italic.setter
     def italic(self, value: bool):
-        self.__annotations.italic = value
+        self.__annotations = self.__annotations.replace(italic=value)
         self.update(self.__annotations)
 
     @italic.deleter
     def italic(self) -> None:
-        del self.__annotations.italic
+        self.__annotations = self.__annotations.replace(italic=False)
         self.update(self.__annotations)
 
     @property
@@ -411,12 +443,12 @@ class Text(BaseProps):
 
     @strikethrough.setter
     def strikethrough(self, value: bool):
-        self.__annotations.strikethrough = value
+        self.__annotations = self.__annotations.replace(strikethrough=value)
         self.update(self.__annotations)
 
     @strikethrough.deleter
     def strikethrough(self) -> None:
-        del self.__annotations.strikethrough
+        self.__annotations = self.__annotations.replace(strikethrough=False)
         self.update(self.__annotations)
 
     @property
@@ -425,12 +457,12 @@ class Text(BaseProps):
 
     @underline.setter
     def underline(self, value: bool):
-        self.__annotations.underline = value
+        self.__annotations = self.__annotations.replace(underline=value)
         self.update(self.__annotations)
 
     @underline.deleter
     def underline(self) -> None:
-        del self.__annotations.underline
+        self.__annotations = self.__annotations.replace(underline=False)
         self.update(self.__annotations)
 
     @property
@@ -439,12 +471,12 @@ class Text(BaseProps):
 
     @code.setter
     def code(self, value: bool):
-        self.__annotations.code = value
+        self.__annotations = self.__annotations.replace(code=value)
         self.update(self.__annotations)
 
     @code.deleter
     def code(self) -> None:
-        del self.__annotations.code
+        self.__annotations = self.__annotations.replace(code=False)
         self.update(self.__annotations)
 
     @property
@@ -453,12 +485,12 @@ class Text(BaseProps):
 
     @color.setter
     def color(self, value: str):
-        self.__annotations.color = value
+        self.__annotations = self.__annotations.replace(color=value)
         self.update(self.__annotations)
 
     @color.deleter
     def color(self):
-        del self.__annotations.color
+        self.__annotations = self.__annotations.replace(color="default")
         self.update(self.__annotations)
 
 
@@ -477,6 +509,8 @@ class RichText(BaseProps):
         Insert Text into specific index of existing list of Text
     pop(index: int=None)
         Pop Text from specific index of existing list of Text
+    merge()
+        Merge adjacent Texts with the same styles and link
     clear()
         Clear data of text
     """
@@ -489,6 +523,7 @@ class RichText(BaseProps):
         self,
         *text: Text,
         key: str = "rich_text",
+        merge: bool = False,
     ):
         """
         Parameters
@@ -497,10 +532,17 @@ class RichText(BaseProps):
             Property key of RichText
         *text: Text
             Texts of RichText
+        merge : bool, default=False
+            If True, adjacent texts with the same styles and link are merged into one text
+
+        .. note:: Texts longer than the content length limit of the API (2,000 characters)
+                  are split into several texts with the same styles and link
         """
         super().__init__()
         self.__key = key
-        self.__texts = list(text)
+        self.__texts = split_runs(text)
+        if merge:
+            self.__texts = merge_runs(self.__texts)
         self.update(
             {
                 key: self.__texts,
@@ -545,7 +587,7 @@ class RichText(BaseProps):
         text : Text
             Text you append to RichText
         """
-        self.__texts.append(text)
+        self.__texts.extend(split_runs((text,)))
         self[self.key] = self.__texts
 
     def extend(self, texts: List[Text]) -> None:
@@ -558,7 +600,7 @@ class RichText(BaseProps):
         text : list of Text
             List of text you append to RichText
         """
-        self.__texts.extend(texts)
+        self.__texts.extend(split_runs(texts))
         self[self.key] = self.__texts
 
     def insert(self, index: int, text: Text) -> None:
@@ -573,7 +615,9 @@ class RichText(BaseProps):
         text : Text
             Text you insert into RichText
         """
-        self.__texts.insert(index, text)
+        if index < 0:  # same position as list.insert
+            index = max(len(self.__texts) + index, 0)
+        self.__texts[index:index] = split_runs((text,))
         self[self.key] = self.__texts
 
     def pop(self, index=None):
@@ -590,6 +634,29 @@ class RichText(BaseProps):
         self[self.key] = self.__texts
         return item
 
+    def merge(self) -> None:
+        """
+        merge()
+            Merge adjacent Texts with the same styles and link into one Text
+        """
+        self.__texts[:] = merge_runs(self.__texts)
+        self[self.key] = self.__texts
+
+
+def split_runs(texts: Sequence[Text]) -> List[Text]:
+    """
+    Split Texts longer than the content length limit of the API (2,000 characters)
+    into several Texts which have the same styles and link, see `utils.runs.split_runs`
+    """
+    return runs.split_runs(texts, Text)
+
+
+def merge_runs(texts: Sequence[Text]) -> List[Text]:
+    """
+    Merge adjacent Texts which have the same styles and link, see `utils.runs.merge_runs`
+    """
+    return runs.merge_runs(texts, Text)
+
 
 class Emoji(BaseProps):
     """
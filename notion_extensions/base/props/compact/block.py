@@ -0,0 +1,764 @@
+import copy
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+
+from ...utils.limits import RICH_TEXT_LENGTH
+from .text import RichText, Text, aggregate_texts, split_runs, texts_to_list
+
+__all__ = [
+    "Block",
+    "Children",
+    "Paragraph",
+    "Heading1",
+    "Heading2",
+    "Heading3",
+    "Quote",
+    "BulletedListItem",
+    "NumberedListItem",
+    "Toggle",
+    "ToDo",
+    "Callout",
+    "Code",
+    "Equation",
+    "Divider",
+    "TableOfContents",
+    "BreadCrumb",
+    "Bookmark",
+    "Embed",
+    "Image",
+    "Video",
+    "File",
+    "Pdf",
+    "Column",
+    "ColumnList",
+    "TableRow",
+    "Table",
+]
+
+
+class Block:
+    """
+    Block Object
+    Base class of compact blocks, subclasses set `TYPE` and build the body of the block in `_body()`
+
+    Methods
+    -------
+    split()
+        Return sibling blocks which are within the limits of the API
+    to_dict()
+        Return this block as dictionary of the API
+    """
+
+    __slots__ = ()
+    TYPE: str = ""
+
+    def split(self) -> List["Block"]:
+        """
+        split()
+            Return sibling blocks which are within the limits of the API
+        """
+        return [self]
+
+    def _body(self, omit_defaults: bool = False, merge_texts: bool = False) -> Dict[str, Any]:
+        return {}
+
+    def __eq__(self, other: Any) -> bool:
+        if type(self) is not type(other):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+    def to_dict(self, omit_defaults: bool = False, merge_texts: bool = False) -> Dict[str, Any]:
+        """
+        to_dict(omit_defaults: bool = False, merge_texts: bool = False)
+            Return this block as dictionary of the API
+
+        Parameters
+        ----------
+        omit_defaults : bool, default=False
+            If True, fields which are equal to the API defaults are omitted
+        merge_texts : bool, default=False
+            If True, adjacent texts with the same styles and link are merged
+
+        Returns
+        -------
+        Dict[str, Any]
+        """
+        return {
+            "type": self.TYPE,
+            self.TYPE: self._body(omit_defaults, merge_texts),
+        }
+
+
+class Children:
+    """
+    Children
+    Compact children property values of block.
+    This can be given to `NotionClient` wherever dictionary based `Children` is accepted
+
+    Attributes
+    ----------
+    blocks : list of Block
+        Child blocks
+
+    Methods
+    -------
+    append(block: Block)
+        Append Block to existing list of Block
+    extend(blocks: List[Block])
+        Extend list of Block to existing list of Block
+    insert(index: int, block: Block)
+        Insert Block into specific index of existing list of Block
+    pop(index: int=-1)
+        Pop Block from specific index of existing list of Block
+    to_dict()
+        Return children as dictionary of the API
+
+    .. note:: Blocks whose text has more than 100 texts are serialized
+              as sibling blocks of the same type
+    """
+
+    __slots__ = ("blocks",)
+
+    def __init__(self, *block: Block):
+        self.blocks: List[Block] = list(block)
+
+    def __len__(self) -> int:
+        return len(self.blocks)
+
+    def __iter__(self) -> Iterator[Block]:
+        return iter(self.blocks)
+
+    def __getitem__(self, index: Union[int, str]) -> Any:
+        if index == "children":  # behave like {"children": [...]} for dict.update, split like to_list
+            return self._pieces()
+        if isinstance(index, str):
+            raise KeyError(index)
+        return self.blocks[index]
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Children):
+            return NotImplemented
+        return self.blocks == other.blocks
+
+    def __repr__(self) -> str:
+        return f"Children({len(self.blocks)} blocks)"
+
+    def __add__(self, other: Union[Block, List[Block]]):
+        if isinstance(other, list):
+            self.extend(other)
+            return self
+        self.append(other)
+        return self
+
+    def __iadd__(self, other: Union[Block, List[Block]]):
+        return self.__add__(other)
+
+    def keys(self):
+        return ("children",)
+
+    def append(self, block: Block) -> None:
+        """
+        append(block: Block)
+            Append Block to existing list of Block
+
+        Parameters
+        ----------
+        block : Block
+            Block you append to Children
+        """
+        self.blocks.append(block)
+
+    def extend(self, blocks: List[Block]) -> None:
+        """
+        extend(blocks: List[Block])
+            Append Blocks to existing list of Block
+
+        Parameters
+        ----------
+        blocks : list of Block
+            List of block you append to Children
+        """
+        self.blocks.extend(blocks)
+
+    def insert(self, index: int, block: Block) -> None:
+        """
+        insert(index: int, block: Block)
+            Insert Block into existing list of Block
+
+        Parameters
+        ----------
+        index : int
+            Index you insert Block into Children
+        block : Block
+            Block you insert into Children
+        """
+        self.blocks.insert(index, block)
+
+    def pop(self, index: int = -1) -> Block:
+        """
+        pop(index: int)
+            Pop Block from existing list of Block
+
+        Parameters
+        ----------
+        index : int, default=-1
+            Index of Block you pop from Children
+        """
+        return self.blocks.pop(index)
+
+    def to_list(self, omit_defaults: bool = False, merge_texts: bool = False) -> List[Dict[str, Any]]:
+        """
+        to_list(omit_defaults: bool = False, merge_texts: bool = False)
+            Return blocks as list of dictionary of the API
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+        """
+        return [piece.to_dict(omit_defaults, merge_texts) for piece in self._pieces()]
+
+    def _pieces(self) -> List[Block]:
+        """
+        Return blocks split into sibling blocks which are within the limits of the API
+        """
+        return [piece for block in self.blocks for piece in block.split()]
+
+    def to_dict(self, omit_defaults: bool = False, merge_texts: bool = False) -> Dict[str, Any]:
+        """
+        to_dict(omit_defaults: bool = False, merge_texts: bool = False)
+            Return children as dictionary of the API
+
+        Returns
+        -------
+        Dict[str, Any]
+        """
+        return {"children": self.to_list(omit_defaults, merge_texts)}
+
+
+class _TextBlock(Block):
+    """
+    Base class of blocks which have text and nested children
+    """
+
+    __slots__ = ("texts", "children")
+
+    def __init__(
+        self,
+        *text: Union[Text, RichText],
+        children: Optional[Children] = None,
+    ):
+        """
+        Parameters
+        ----------
+        *text : Text or RichText
+            text
+        children : Children, optional
+            children
+        """
+        self.texts: List[Text] = aggregate_texts(text)
+        self.children = children
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(map(repr, self.texts))})"
+
+    def __add__(self, other: Union[Text, List[Text]]):
+        if isinstance(other, list):
+            self.extend(other)
+            return self
+        self.append(other)
+        return self
+
+    def __iadd__(self, other: Union[Text, List[Text]]):
+        return self.__add__(other)
+
+    def append(self, text: Text) -> None:
+        """
+        append(text: Text)
+            Append Text to existing list of Text
+        """
+        self.texts.extend(split_runs((text,)))
+
+    def extend(self, texts: List[Text]) -> None:
+        """
+        extend(texts: List[Text])
+            Append Texts to existing list of Text
+        """
+        self.texts.extend(split_runs(texts))
+
+    def split(self) -> List[Block]:
+        """
+        split()
+            Return sibling blocks with up to 100 texts each,
+            nested children are kept by the last sibling
+        """
+        if len(self.texts) <= RICH_TEXT_LENGTH:
+            return [self]
+        pieces: List[Block] = []
+        for start in range(0, len(self.texts), RICH_TEXT_LENGTH):
+            piece = copy.copy(self)
+            piece.texts = self.texts[start : start + RICH_TEXT_LENGTH]
+            piece.children = None
+            pieces.append(piece)
+        piece.children = self.children  # kept by the last sibling
+        return pieces
+
+    def _body(self, omit_defaults: bool = False, merge_texts: bool = False) -> Dict[str, Any]:
+        body: Dict[str, Any] = {"text": texts_to_list(self.texts, omit_defaults, merge_texts)}
+        if self.children is not None:
+            body["children"] = self.children.to_list(omit_defaults, merge_texts)
+        return body
+
+
+class Paragraph(_TextBlock):
+    """
+    Paragraph
+    Compact paragraph block
+    """
+
+    __slots__ = ()
+    TYPE = "paragraph"
+
+
+class Heading1(_TextBlock):
+    """
+    Heading1
+    Compact heading_1 block
+    """
+
+    __slots__ = ()
+    TYPE = "heading_1"
+
+
+class Heading2(_TextBlock):
+    """
+    Heading2
+    Compact heading_2 block
+    """
+
+    __slots__ = ()
+    TYPE = "heading_2"
+
+
+class Heading3(_TextBlock):
+    """
+    Heading3
+    Compact heading_3 block
+    """
+
+    __slots__ = ()
+    TYPE = "heading_3"
+
+
+class Quote(_TextBlock):
+    """
+    Quote
+    Compact quote block
+    """
+
+    __slots__ = ()
+    TYPE = "quote"
+
+
+class BulletedListItem(_TextBlock):
+    """
+    BulletedListItem
+    Compact bulleted_list_item block
+    """
+
+    __slots__ = ()
+    TYPE = "bulleted_list_item"
+
+
+class NumberedListItem(_TextBlock):
+    """
+    NumberedListItem
+    Compact numbered_list_item block
+    """
+
+    __slots__ = ()
+    TYPE = "numbered_list_item"
+
+
+class Toggle(_TextBlock):
+    """
+    Toggle
+    Compact toggle block
+    """
+
+    __slots__ = ()
+    TYPE = "toggle"
+
+    def _body(self, omit_defaults: bool = False, merge_texts: bool = False) -> Dict[str, Any]:
+        body = super()._body(omit_defaults, merge_texts)
+        body.setdefault("children", [])  # as block.Toggle, which always has children
+        return body
+
+
+class ToDo(_TextBlock):
+    """
+    ToDo
+    Compact to_do block
+
+    Attributes
+    ----------
+    checked : bool, default=False
+        Whether the to_do is checked or not
+    """
+
+    __slots__ = ("checked",)
+    TYPE = "to_do"
+
+    def __init__(
+        self,
+        *text: Union[Text, RichText],
+        checked: bool = False,
+        children: Optional[Children] = None,
+    ):
+        super().__init__(*text, children=children)
+        self.checked = checked
+
+    def _body(self, omit_defaults: bool = False, merge_texts: bool = False) -> Dict[str, Any]:
+        body = super()._body(omit_defaults, merge_texts)
+        body["checked"] = self.checked
+        return body
+
+
+class Callout(_TextBlock):
+    """
+    Callout
+    Compact callout block
+
+    Attributes
+    ----------
+    emoji : str, default=''
+        Emoji of the icon
+    """
+
+    __slots__ = ("emoji",)
+    TYPE = "callout"
+
+    def __init__(
+        self,
+        *text: Union[Text, RichText],
+        emoji: str = "",
+        children: Optional[Children] = None,
+    ):
+        super().__init__(*text, children=children)
+        self.emoji = emoji
+
+    def _body(self, omit_defaults: bool = False, merge_texts: bool = False) -> Dict[str, Any]:
+        body = super()._body(omit_defaults, merge_texts)
+        body["icon"] = {"type": "emoji", "emoji": self.emoji}
+        return body
+
+
+class Code(_TextBlock):
+    """
+    Code
+    Compact code block
+
+    Attributes
+    ----------
+    language : str, default=''
+        Coding language in code block
+    """
+
+    __slots__ = ("language",)
+    TYPE = "code"
+
+    def __init__(
+        self,
+        *text: Union[Text, RichText],
+        language: str = "",
+    ):
+        super().__init__(*text)
+        self.language = language
+
+    def _body(self, omit_defaults: bool = False, merge_texts: bool = False) -> Dict[str, Any]:
+        body = super()._body(omit_defaults, merge_texts)
+        body["language"] = self.language
+        return body
+
+
+class Equation(Block):
+    """
+    Equation
+    Compact equation block
+
+    Attributes
+    ----------
+    expression : str
+        A KaTeX compatible string
+    """
+
+    __slots__ = ("expression",)
+    TYPE = "equation"
+
+    def __init__(self, expression: str):
+        self.expression = expression
+
+    def _body(self, omit_defaults: bool = False, merge_texts: bool = False) -> Dict[str, Any]:
+        return {"expression": self.expression}
+
+
+class Divider(Block):
+    """
+    Divider
+    Compact divider block
+    """
+
+    __slots__ = ()
+    TYPE = "divider"
+
+
+class TableOfContents(Block):
+    """
+    TableOfContents
+    Compact table_of_contents block
+    """
+
+    __slots__ = ()
+    TYPE = "table_of_contents"
+
+
+class BreadCrumb(Block):
+    """
+    BreadCrumb
+    Compact breadcrumb block
+    """
+
+    __slots__ = ()
+    TYPE = "breadcrumb"
+
+
+class Embed(Block):
+    """
+    Embed
+    Compact embed block
+
+    Attributes
+    ----------
+    url : str
+        Link to website the embed block will display
+    """
+
+    __slots__ = ("url",)
+    TYPE = "embed"
+
+    def __init__(self, url: str):
+        self.url = url
+
+    def _body(self, omit_defaults: bool = False, merge_texts: bool = False) -> Dict[str, Any]:
+        return {"url": self.url}
+
+
+class Bookmark(Block):
+    """
+    Bookmark
+    Compact bookmark block
+
+    Attributes
+    ----------
+    url : str
+        Link to website the bookmark block will display
+    caption : list of Text
+        Caption of the bookmark block
+    """
+
+    __slots__ = ("url", "caption")
+    TYPE = "bookmark"
+
+    def __init__(self, url: str, *caption: Union[Text, RichText]):
+        self.url = url
+        self.caption: List[Text] = aggregate_texts(caption)
+
+    def _body(self, omit_defaults: bool = False, merge_texts: bool = False) -> Dict[str, Any]:
+        body: Dict[str, Any] = {"url": self.url}
+        body["caption"] = texts_to_list(self.caption, omit_defaults, merge_texts)
+        return body
+
+
+class _FileBlock(Block):
+    """
+    Base class of blocks which display an external file
+    """
+
+    __slots__ = ("url", "caption")
+
+    def __init__(self, *caption: Union[Text, RichText], url: str):
+        """
+        Parameters
+        ----------
+        *caption : Text or RichText
+            Caption of the block
+        url : str
+            Link to the externally hosted file
+        """
+        self.url = url
+        self.caption: List[Text] = aggregate_texts(caption)
+
+    def _body(self, omit_defaults: bool = False, merge_texts: bool = False) -> Dict[str, Any]:
+        body: Dict[str, Any] = {
+            "type": "external",
+            "external": {"url": self.url},
+        }
+        body["caption"] = texts_to_list(self.caption, omit_defaults, merge_texts)
+        return body
+
+
+class Image(_FileBlock):
+    """
+    Image
+    Compact image block
+    """
+
+    __slots__ = ()
+    TYPE = "image"
+
+
+class Video(_FileBlock):
+    """
+    Video
+    Compact video block
+    """
+
+    __slots__ = ()
+    TYPE = "video"
+
+
+class File(_FileBlock):
+    """
+    File
+    Compact file block
+    """
+
+    __slots__ = ()
+    TYPE = "file"
+
+
+class Pdf(_FileBlock):
+    """
+    Pdf
+    Compact pdf block
+    """
+
+    __slots__ = ()
+    TYPE = "pdf"
+
+
+class Column(Block):
+    """
+    Column
+    Compact column block, this must have at least one child
+    """
+
+    __slots__ = ("children",)
+    TYPE = "column"
+
+    def __init__(self, *block: Block):
+        if len(block) < 1:
+            raise ValueError("This must have at least one block")
+        self.children = Children(*block)
+
+    def _body(self, omit_defaults: bool = False, merge_texts: bool = False) -> Dict[str, Any]:
+        return self.children.to_dict(omit_defaults, merge_texts)
+
+
+class ColumnList(Block):
+    """
+    ColumnList
+    Compact column_list block, this must have at least 2 columns
+    """
+
+    __slots__ = ("children",)
+    TYPE = "column_list"
+
+    def __init__(self, *column: Column):
+        if len(column) < 2:
+            raise ValueError("This must have at least 2 columns")
+        self.children = Children(*column)
+
+    def _body(self, omit_defaults: bool = False, merge_texts: bool = False) -> Dict[str, Any]:
+        return self.children.to_dict(omit_defaults, merge_texts)
+
+
+class TableRow(Block):
+    """
+    TableRow
+    Compact table_row block
+
+    Attributes
+    ----------
+    cells : list of list of Text
+        Array of cell contents in horizontal display order
+    """
+
+    __slots__ = ("cells",)
+    TYPE = "table_row"
+
+    def __init__(self, *cell: Union[Text, RichText, Sequence[Text]]):
+        """
+        Parameters
+        ----------
+        *cell : Text, RichText or list of Text
+            Array of cell contents in horizontal display order
+        """
+        self.cells: List[List[Text]] = [
+            [c] if isinstance(c, Text) else aggregate_texts(tuple(c)) for c in cell
+        ]
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def _body(self, omit_defaults: bool = False, merge_texts: bool = False) -> Dict[str, Any]:
+        return {"cells": [texts_to_list(cell, omit_defaults, merge_texts) for cell in self.cells]}
+
+
+class Table(Block):
+    """
+    Table
+    Compact table block
+
+    Attributes
+    ----------
+    table_width : int
+        Number of columns in the table
+    children : Children
+        table row children
+    has_column_header : bool, default=False
+        Whether or not the table has a column header
+    has_row_header : bool, default=False
+        Whether or not the table has a header row
+    """
+
+    __slots__ = ("table_width", "children", "has_column_header", "has_row_header")
+    TYPE = "table"
+
+    def __init__(
+        self,
+        table_width: int,
+        *table_row: TableRow,
+        has_column_header: bool = False,
+        has_row_header: bool = False,
+    ):
+        for table_row_ in table_row:  # Validate length of table row
+            if len(table_row_) != table_width:
+                raise ValueError(
+                    "table_width must be equal to table_row size, "
+                    f"expected {table_width} but {len(table_row_)} is given"
+                )
+        self.table_width = table_width
+        self.children = Children(*table_row)
+        self.has_column_header = has_column_header
+        self.has_row_header = has_row_header
+
+    def _body(self, omit_defaults: bool = False, merge_texts: bool = False) -> Dict[str, Any]:
+        body: Dict[str, Any] = {
+            "table_width": self.table_width,
+            "has_column_header": self.has_column_header,
+            "has_row_header": self.has_row_header,
+        }
+        body["children"] = self.children.to_list(omit_defaults, merge_texts)
+        return body
@@ -0,0 +1,371 @@
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+
+from ...utils import runs
+from ..common import Annotations
+
+__all__ = [
+    "Text",
+    "RichText",
+    "merge_runs",
+    "split_runs",
+]
+
+
+class Text:
+    """
+    Text
+    Compact text property values.
+    Fields are stored in `__slots__` and the API dictionary is built by `to_dict()`.
+    Styles are kept in an interned `Annotations`, which is shared between texts
+
+    Attributes
+    ----------
+    text: str, default=''
+        text
+    link : str, optional
+        link of text
+    bold : bool, default=False
+        bold text
+    italic : bool, default=False
+        italic text
+    strikethrough : bool, default=False
+        strikethrough text
+    underline : bool, default=False
+        underline text
+    code : bool, default=False
+        code text
+    color : str, default='default'
+        text color
+    annotations : Annotations
+        interned annotations of the styles above
+
+    Methods
+    -------
+    to_dict()
+        Return this text as dictionary of the API
+    """
+
+    __slots__ = ("text", "link", "annotations")
+
+    def __init__(
+        self,
+        text: str = "",
+        link: Optional[str] = None,
+        bold: bool = False,
+        italic: bool = False,
+        strikethrough: bool = False,
+        underline: bool = False,
+        code: bool = False,
+        color: str = "default",
+    ):
+        self.text = text
+        self.link = link
+        self.annotations = Annotations(
+            bold=bold,
+            italic=italic,
+            strikethrough=strikethrough,
+            underline=underline,
+            code=code,
+            color=color,
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Text):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"Text({self.text!r})"
+
+    @property
+    def bold(self) -> bool:
+        return self.annotations.bold
+
+    @bold.setter
+    def bold(self, value: bool) -> None:
+        self.annotations = self.annotations.replace(bold=value)
+
+    @property
+    def italic(self) -> bool:
+        return self.annotations.italic
+
+    @italic.setter
+    def italic(self, value: bool) -> None:
+        self.annotations = self.annotations.replace(italic=value)
+
+    @property
+    def strikethrough(self) -> bool:
+        return self.annotations.strikethrough
+
+    @strikethrough.setter
+    def strikethrough(self, value: bool) -> None:
+        self.annotations = self.annotations.replace(strikethrough=value)
+
+    @property
+    def underline(self) -> bool:
+        return self.annotations.underline
+
+    @underline.setter
+    def underline(self, value: bool) -> None:
+        self.annotations = self.annotations.replace(underline=value)
+
+    @property
+    def code(self) -> bool:
+        return self.annotations.code
+
+    @code.setter
+    def code(self, value: bool) -> None:
+        self.annotations = self.annotations.replace(code=value)
+
+    @property
+    def color(self) -> str:
+        return self.annotations.color
+
+    @color.setter
+    def color(self, value: str) -> None:
+        self.annotations = self.annotations.replace(color=value)
+
+    def to_dict(self, omit_defaults: bool = False, merge_texts: bool = False) -> Dict[str, Any]:
+        """
+        to_dict(omit_defaults: bool = False, merge_texts: bool = False)
+            Return this text as dictionary of the API
+
+        Parameters
+        ----------
+        omit_defaults : bool, default=False
+            If True, `link: null` and annotations equal to the defaults are omitted
+        merge_texts : bool, default=False
+            Accepted like `RichText.to_dict`, a single text has nothing to merge
+
+        Returns
+        -------
+        Dict[str, Any]
+        """
+        if omit_defaults:
+            text: Dict[str, Any] = {"content": self.text}
+            if self.link is not None:
+                text["link"] = self.link
+            out: Dict[str, Any] = {"type": "text", "text": text}
+            if self.annotations.non_defaults:
+                out["annotations"] = self.annotations.non_defaults
+            return out
+        return {
+            "type": "text",
+            "text": {
+                "content": self.text,
+                "link": self.link,
+            },
+            "annotations": self.annotations["annotations"],  # shared, read-only
+        }
+
+
+class RichText:
+    """
+    RichText
+    Compact rich text property values
+
+    Attributes
+    ----------
+    key : str, default='rich_text'
+        Property key of RichText
+    texts : list of Text
+        Texts of RichText
+
+    Methods
+    -------
+    append(text: Text)
+        Append Text to existing list of Text
+    extend(texts: List[Text])
+        Extend list of Text to existing list of Text
+    insert(index: int, Text)
+        Insert Text into specific index of existing list of Text
+    pop(index: int=None)
+        Pop Text from specific index of existing list of Text
+    merge()
+        Merge adjacent Texts with the same styles and link
+    to_dict()
+        Return this rich text as dictionary of the API
+    """
+
+    __slots__ = ("key", "texts")
+
+    def __init__(
+        self,
+        *text: Text,
+        key: str = "rich_text",
+        merge: bool = False,
+    ):
+        """
+        Parameters
+        ----------
+        *text: Text
+            Texts of RichText
+        key : str, default='rich_text'
+            Property key of RichText
+        merge : bool, default=False
+            If True, adjacent texts with the same styles and link are merged into one text
+
+        .. note:: Texts longer than the content length limit of the API (2,000 characters)
+                  are split into several texts with the same styles and link
+        """
+        self.key = key
+        self.texts: List[Text] = split_runs(text)
+        if merge:
+            self.texts = merge_runs(self.texts)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def __iter__(self) -> Iterator[Text]:
+        return iter(self.texts)
+
+    def __getitem__(self, index: int) -> Text:
+        return self.texts[index]
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, RichText):
+            return NotImplemented
+        return self.key == other.key and self.texts == other.texts
+
+    def __repr__(self) -> str:
+        return f"RichText({', '.join(map(repr, self.texts))}, key={self.key!r})"
+
+    def __add__(self, other: Union[Text, List[Text]]):
+        if isinstance(other, list):
+            self.extend(other)
+            return self
+        self.append(other)
+        return self
+
+    def __iadd__(self, other: Union[Text, List[Text]]):
+        return self.__add__(other)
+
+    def append(self, text: Text) -> None:
+        """
+        append(text: Text)
+            Append Text to existing list of Text
+
+        Parameters
+        ----------
+        text : Text
+            Text you append to RichText
+        """
+        self.texts.extend(split_runs((text,)))
+
+    def extend(self, texts: List[Text]) -> None:
+        """
+        extend(texts: List[Text])
+            Append Texts to existing list of Text
+
+        Parameters
+        ----------
+        texts : list of Text
+            List of text you append to RichText
+        """
+        self.texts.extend(split_runs(texts))
+
+    def insert(self, index: int, text: Text) -> None:
+        """
+        insert(index: int, text: Text)
+            Insert Text into existing list of Text
+
+        Parameters
+        ----------
+        index : int
+            Index you insert Text into
+        text : Text
+            Text you insert into RichText
+        """
+        if index < 0:  # same position as list.insert
+            index = max(len(self.texts) + index, 0)
+        self.texts[index:index] = split_runs((text,))
+
+    def pop(self, index: int = -1) -> Text:
+        """
+        pop(index: int)
+            Pop Text from existing list of Text
+
+        Parameters
+        ----------
+        index : int, default=-1
+            Index of Text you pop from RichText
+        """
+        return self.texts.pop(index)
+
+    def merge(self) -> None:
+        """
+        merge()
+            Merge adjacent Texts with the same styles and link into one Text
+        """
+        self.texts[:] = merge_runs(self.texts)
+
+    def to_list(self, omit_defaults: bool = False, merge_texts: bool = False) -> List[Dict[str, Any]]:
+        """
+        to_list(omit_defaults: bool = False, merge_texts: bool = False)
+            Return texts as list of dictionary of the API
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+        """
+        return texts_to_list(self.texts, omit_defaults, merge_texts)
+
+    def to_dict(self, omit_defaults: bool = False, merge_texts: bool = False) -> Dict[str, Any]:
+        """
+        to_dict(omit_defaults: bool = False, merge_texts: bool = False)
+            Return this rich text as dictionary of the API
+
+        Returns
+        -------
+        Dict[str, Any]
+        """
+        return {self.key: self.to_list(omit_defaults, merge_texts)}
+
+
+def aggregate_texts(texts: tuple) -> List[Text]:
+    """
+    Flatten Text and RichText arguments of block constructors into list of Text,
+    texts over the content length limit of the API are split
+
+    Raises
+    ------
+    ValueError
+        if anything other than Text or RichText is given
+    """
+    base: List[Text] = []
+    for t in texts:
+        if isinstance(t, RichText):
+            base.extend(t.texts)
+        elif isinstance(t, Text):
+            base.append(t)
+        else:
+            raise ValueError(
+                f"Expected type is `RichText` or `Text`, but {type(t)} is given"
+            )
+    return split_runs(base)
+
+
+def split_runs(texts: Sequence[Text]) -> List[Text]:
+    """
+    Split Texts longer than the content length limit of the API (2,000 characters)
+    into several Texts which have the same styles and link, see `utils.runs.split_runs`
+    """
+    return runs.split_runs(texts, Text)
+
+
+def merge_runs(texts: Sequence[Text]) -> List[Text]:
+    """
+    Merge adjacent Texts which have the same styles and link, see `utils.runs.merge_runs`
+    """
+    return runs.merge_runs(texts, Text)
+
+
+def texts_to_list(
+    texts: Sequence[Text], omit_defaults: bool = False, merge_texts: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Return texts as list of dictionary of the API
+    """
+    if merge_texts:
+        texts = merge_runs(texts)
+    return [text.to_dict(omit_defaults) for text in texts]
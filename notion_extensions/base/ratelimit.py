@@ -0,0 +1,232 @@
+import threading
+import time
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import sqlite3
+
+__all__ = [
+    "RateLimiter",
+    "SharedRateLimiter",
+]
+
+
+class RateLimiter:
+    """
+    RateLimiter
+    Thread-safe token bucket which keeps requests under the rate limit of the API
+
+    The API allows an average of three requests per second per integration,
+    with some bursts above it.
+    A caller takes one token per request and sleeps until it is available,
+    so concurrent callers are spread evenly over time
+
+    Attributes
+    ----------
+    rate : float
+        Tokens added per second
+    burst : int
+        Capacity of the bucket, number of requests which can be sent at once
+    tokens : float
+        Tokens in the bucket now, negative if callers are waiting
+
+    Methods
+    -------
+    acquire(tokens: int = 1)
+        Take tokens from the bucket, sleep until they are available
+    """
+
+    def __init__(self, rate: float = 3.0, burst: Optional[int] = None):
+        """
+        Parameters
+        ----------
+        rate : float, default=3.0
+            Tokens added per second
+        burst : int, optional
+            Capacity of the bucket. If not given, `max(1, int(rate))` is used
+
+        Raises
+        ------
+        ValueError
+            if rate or burst is not positive
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be more than 0, but {rate} is given")
+        if burst is None:
+            burst = max(1, int(rate))
+        if burst <= 0:
+            raise ValueError(f"burst must be more than 0, but {burst} is given")
+        self.__rate = float(rate)
+        self.__burst = burst
+        self.__tokens = float(burst)
+        self.__updated = time.monotonic()
+        self.__lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"RateLimiter(rate={self.rate}, burst={self.burst})"
+
+    @property
+    def rate(self) -> float:
+        return self.__rate
+
+    @property
+    def burst(self) -> int:
+        return self.__burst
+
+    @property
+    def tokens(self) -> float:
+        with self.__lock:
+            elapsed = time.monotonic() - self.__updated
+            return min(self.__burst, self.__tokens + elapsed * self.__rate)
+
+    def reserve(self, tokens: int = 1) -> float:
+        """
+        reserve(tokens: int = 1)
+            Take tokens from the bucket without sleeping
+
+        Parameters
+        ----------
+        tokens : int, default=1
+            Number of tokens to take
+
+        Returns
+        -------
+        float
+            Seconds the caller must wait before sending the request
+        """
+        with self.__lock:
+            now = time.monotonic()
+            self.__tokens = min(self.__burst, self.__tokens + (now - self.__updated) * self.__rate)
+            self.__updated = now
+            self.__tokens -= tokens  # may go negative, later callers wait longer
+            if self.__tokens >= 0:
+                return 0.0
+            return -self.__tokens / self.__rate
+
+    def acquire(self, tokens: int = 1) -> float:
+        """
+        acquire(tokens: int = 1)
+            Take tokens from the bucket, sleep until they are available
+
+        Parameters
+        ----------
+        tokens : int, default=1
+            Number of tokens to take
+
+        Returns
+        -------
+        float
+            Seconds slept
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class SharedRateLimiter(RateLimiter):
+    """
+    SharedRateLimiter
+    Token bucket shared by the processes on a host through an SQLite database file
+
+    Processes using the same integration token share one bucket by opening the same file
+    with the same `name`, so together they stay under the rate limit without a central service.
+    The bucket is read and updated in one locked transaction per request, which costs
+    well under a millisecond on a local disk. The file must not be on a network file system
+
+    Attributes
+    ----------
+    path : str
+        Path of the database file
+    name : str
+        Name of the bucket, e.g. per integration token
+    rate : float
+        Tokens added per second, shared by all processes
+    burst : int
+        Capacity of the bucket
+
+    Methods
+    -------
+    acquire(tokens: int = 1)
+        Take tokens from the bucket, sleep until they are available
+
+    Examples
+    --------
+    >>> limiter = SharedRateLimiter("/tmp/notion-ratelimit.db", rate=3.0, name="importer")
+    >>> client = NotionClient(rate_limit=limiter)  # in each worker process
+    """
+
+    def __init__(self, path: str, rate: float = 3.0, burst: Optional[int] = None, *, name: str = "default"):
+        """
+        Parameters
+        ----------
+        path : str
+            Path of the database file, created if it does not exist
+        rate : float, default=3.0
+            Tokens added per second, shared by all processes
+        burst : int, optional
+            Capacity of the bucket. If not given, `max(1, int(rate))` is used
+        name : str, default='default'
+            Name of the bucket. Processes with the same path and name share the bucket
+
+        Raises
+        ------
+        ValueError
+            if rate or burst is not positive
+        """
+        super().__init__(rate, burst)
+        self.path = path
+        self.name = name
+        self.__local = threading.local()  # connection of each thread
+        self._connect().execute(
+            "CREATE TABLE IF NOT EXISTS buckets (name TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+        )
+
+    def __repr__(self) -> str:
+        return f"SharedRateLimiter({self.path!r}, rate={self.rate}, burst={self.burst}, name={self.name!r})"
+
+    def _connect(self) -> "sqlite3.Connection":
+        conn = getattr(self.__local, "conn", None)
+        if conn is None:
+            import sqlite3  # deferred, most clients do not share a limiter
+
+            conn = self.__local.conn = sqlite3.connect(self.path, timeout=60.0, isolation_level=None)
+        return conn
+
+    @property
+    def tokens(self) -> float:
+        row = self._connect().execute("SELECT tokens, updated FROM buckets WHERE name = ?", (self.name,)).fetchone()
+        if row is None:
+            return float(self.burst)
+        return min(self.burst, row[0] + max(0.0, time.time() - row[1]) * self.rate)
+
+    def reserve(self, tokens: int = 1) -> float:
+        """
+        reserve(tokens: int = 1)
+            Take tokens from the shared bucket without sleeping
+
+        Parameters
+        ----------
+        tokens : int, default=1
+            Number of tokens to take
+
+        Returns
+        -------
+        float
+            Seconds the caller must wait before sending the request
+        """
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")  # takes the write lock, other processes wait
+        try:
+            now = time.time()  # wall clock, comparable between processes
+            row = conn.execute("SELECT tokens, updated FROM buckets WHERE name = ?", (self.name,)).fetchone()
+            available = float(self.burst) if row is None else row[0] + max(0.0, now - row[1]) * self.rate
+            available = min(self.burst, available) - tokens  # may go negative, later callers wait longer
+            conn.execute("INSERT OR REPLACE INTO buckets VALUES (?, ?, ?)", (self.name, available, now))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        if available >= 0:
+            return 0.0
+        return -available / self.rate
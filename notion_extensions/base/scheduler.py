@@ -0,0 +1,169 @@
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .ratelimit import RateLimiter
+
+__all__ = [
+    "DEFAULT_LANE",
+    "PRIORITIES",
+    "PriorityScheduler",
+    "current_lane",
+    "lane",
+]
+
+# Weights of the priority lanes, a lane gets its share of the rate while other lanes are waiting
+PRIORITIES: Dict[str, float] = {
+    "interactive": 8.0,
+    "normal": 4.0,
+    "bulk": 1.0,
+}
+DEFAULT_LANE = "normal"
+
+# Lane of requests sent in the current context, inherited by the workers of bulk operations
+_LANE: ContextVar[Optional[str]] = ContextVar("notion_extensions_lane", default=None)
+
+
+def current_lane() -> Optional[str]:
+    """
+    Return the lane of the current context, None if no lane is set
+    """
+    return _LANE.get()
+
+
+@contextmanager
+def lane(name: str) -> Iterator[None]:
+    """
+    Send requests in the block in a priority lane, e.g. `with lane("bulk"): ...`
+    """
+    token = _LANE.set(name)
+    try:
+        yield
+    finally:
+        _LANE.reset(token)
+
+
+class PriorityScheduler:
+    """
+    PriorityScheduler
+    Share the tokens of a rate limiter between priority lanes by weighted fair queuing
+
+    Callers wait in a queue ordered by virtual finish time: each request of a lane adds
+    `1 / weight` to the lane's virtual time, and the queue head takes the next token.
+    While several lanes are waiting, each gets tokens in proportion to its weight,
+    so an interactive request jumps ahead of a queue of bulk requests,
+    and a lane which waits alone gets all the tokens
+
+    Attributes
+    ----------
+    limiter : RateLimiter
+        Token bucket of the shared rate
+    weights : Dict[str, float]
+        Weight of each lane
+    stats : Dict[str, Dict[str, Any]]
+        Requests granted, waiting, and seconds waited of each lane
+
+    Methods
+    -------
+    acquire(lane: str = 'normal', tokens: int = 1)
+        Take tokens in a lane, sleep until it is the lane's turn and the tokens are available
+    """
+
+    def __init__(self, limiter: RateLimiter, weights: Optional[Dict[str, float]] = None):
+        """
+        Parameters
+        ----------
+        limiter : RateLimiter
+            Token bucket of the shared rate
+        weights : Dict[str, float], optional
+            Weight of each lane, `PRIORITIES` if not given. It must have lane 'normal'
+
+        Raises
+        ------
+        ValueError
+            if a weight is not positive or lane 'normal' is missing
+        """
+        weights = dict(PRIORITIES if weights is None else weights)
+        if DEFAULT_LANE not in weights:
+            raise ValueError(f"weights must have lane `{DEFAULT_LANE}`")
+        for name, weight in weights.items():
+            if weight <= 0:
+                raise ValueError(f"weight must be more than 0, but {weight} is given to `{name}`")
+        self.limiter = limiter
+        self.weights = weights
+        self.__cond = threading.Condition()
+        self.__queue: List[Tuple[float, int]] = []  # heap of (virtual finish time, arrival)
+        self.__arrivals = itertools.count()
+        self.__vtime = 0.0  # virtual finish time of the last granted request
+        self.__finish = dict.fromkeys(weights, 0.0)  # virtual finish time of the last request of each lane
+        self.__counters = {name: {"granted": 0, "waiting": 0, "waited": 0.0} for name in weights}
+
+    def __repr__(self) -> str:
+        return f"PriorityScheduler({self.limiter!r}, weights={self.weights})"
+
+    @property
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Counters of each lane, `granted` (requests), `waiting` (requests queued now) and `waited` (seconds)
+        """
+        with self.__cond:
+            return {name: dict(counters) for name, counters in self.__counters.items()}
+
+    def acquire(self, lane: str = DEFAULT_LANE, tokens: int = 1) -> float:
+        """
+        acquire(lane: str = 'normal', tokens: int = 1)
+            Take tokens in a lane, sleep until it is the lane's turn and the tokens are available
+
+        Parameters
+        ----------
+        lane : str, default='normal'
+            Name of the lane
+        tokens : int, default=1
+            Number of tokens to take
+
+        Returns
+        -------
+        float
+            Seconds waited
+
+        Raises
+        ------
+        ValueError
+            if lane is unknown
+        """
+        weight = self.weights.get(lane)
+        if weight is None:
+            raise ValueError(f"lane must be one of {sorted(self.weights)}, but `{lane}` is given")
+        start = time.monotonic()
+        with self.__cond:
+            finish = max(self.__vtime, self.__finish[lane]) + tokens / weight
+            self.__finish[lane] = finish
+            entry = (finish, next(self.__arrivals))
+            heapq.heappush(self.__queue, entry)
+            counters = self.__counters[lane]
+            counters["waiting"] += 1
+            self.__cond.notify_all()  # the head may have changed
+            while True:
+                if self.__queue[0] == entry:
+                    shortage = min(tokens, self.limiter.burst) - self.limiter.tokens
+                    if shortage <= 0:
+                        break
+                    self.__cond.wait(shortage / self.limiter.rate)
+                else:
+                    self.__cond.wait()
+            heapq.heappop(self.__queue)
+            self.__vtime = finish
+            wait = self.limiter.reserve(tokens)  # 0 unless another process took the tokens
+            counters["waiting"] -= 1
+            counters["granted"] += 1
+            self.__cond.notify_all()
+        if wait > 0:
+            time.sleep(wait)
+        waited = time.monotonic() - start
+        with self.__cond:
+            counters["waited"] += waited
+        return waited
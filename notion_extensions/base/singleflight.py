@@ -0,0 +1,122 @@
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+__all__ = [
+    "SingleFlight",
+]
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    SingleFlight
+    Coalesce concurrent calls with the same key into one call
+
+    While a call for a key is in flight, other callers with the same key wait for it
+    and receive its result (or its exception) instead of calling again.
+    Results are not cached, a call which starts after the previous one finished is executed
+
+    Attributes
+    ----------
+    executed : int
+        Number of calls executed
+    shared : int
+        Number of calls which received the result of another call in flight, i.e. calls saved
+
+    Methods
+    -------
+    do(key: Hashable, func: Callable[[], Any])
+        Call func, or wait for the call in flight with the same key
+    reset()
+        Reset the counters
+    """
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__calls: Dict[Hashable, _Call] = {}
+        self.__executed = 0
+        self.__shared = 0
+
+    def __repr__(self) -> str:
+        return f"SingleFlight(executed={self.executed}, shared={self.shared})"
+
+    @property
+    def executed(self) -> int:
+        return self.__executed
+
+    @property
+    def shared(self) -> int:
+        return self.__shared
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Counters as dictionary, `executed`, `shared` and `in_flight`
+        """
+        with self.__lock:
+            return {"executed": self.__executed, "shared": self.__shared, "in_flight": len(self.__calls)}
+
+    def reset(self) -> None:
+        """
+        reset()
+            Reset the counters
+        """
+        with self.__lock:
+            self.__executed = 0
+            self.__shared = 0
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        do(key: Hashable, func: Callable[[], Any])
+            Call func, or wait for the call in flight with the same key
+
+        Parameters
+        ----------
+        key : Hashable
+            Key identifying the call, e.g. method and URL of a request
+        func : Callable[[], Any]
+            Function to call
+
+        Returns
+        -------
+        Tuple[Any, bool]
+            Result of func, and whether the result was shared by another call
+
+        Raises
+        ------
+        Exception
+            raised by func, in every caller sharing the call
+        """
+        with self.__lock:
+            call = self.__calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self.__calls[key] = _Call()
+                self.__executed += 1
+            else:
+                call.waiters += 1
+                self.__shared += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self.__lock:
+                del self.__calls[key]
+            call.done.set()
+        return call.result, False
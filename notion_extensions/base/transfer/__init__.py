@@ -0,0 +1,4 @@
+from .exporter import *
+from .importer import *
+from .pages import *
+from .render import *
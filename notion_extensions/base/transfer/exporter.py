@@ -0,0 +1,393 @@
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+__all__ = [
+    "DatabaseExporter",
+    "ARROW_TYPES",
+    "DECODERS",
+]
+
+Columns = Dict[str, List[Any]]  # a batch of columnar data, column name -> values
+Decoder = Callable[[Any], Any]
+
+
+def _plain_text(texts: List[Dict[str, Any]]) -> str:
+    return "".join(text.get("plain_text", "") for text in texts)
+
+
+def _name(value: Optional[Dict[str, Any]]) -> Optional[str]:
+    return value["name"] if value else None
+
+
+def _start(value: Optional[Dict[str, Any]]) -> Optional[str]:
+    return value["start"] if value else None
+
+
+def _files(files: List[Dict[str, Any]]) -> List[str]:
+    return [f[f["type"]]["url"] for f in files if f.get("type") in ("file", "external")]
+
+
+def _typed(value: Optional[Dict[str, Any]]) -> Any:
+    """
+    Decode an object holding its value under its type, e.g. formula and rollup
+    """
+    if not value:
+        return None
+    type_ = value["type"]
+    inner = value.get(type_)
+    if type_ == "array":
+        return [_decode(item) for item in inner or []]
+    decoder = DECODERS.get(type_)
+    return decoder(inner) if decoder is not None else inner
+
+
+def _decode(prop: Dict[str, Any]) -> Any:
+    type_ = prop["type"]
+    decoder = DECODERS.get(type_)
+    return decoder(prop[type_]) if decoder is not None else prop.get(type_)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+# Decoders of property values into scalars or lists of scalars, keyed by the type of property
+DECODERS: Dict[str, Decoder] = {
+    "title": _plain_text,
+    "rich_text": _plain_text,
+    "number": _identity,
+    "select": _name,
+    "status": _name,
+    "multi_select": lambda options: [option["name"] for option in options],
+    "date": _start,
+    "checkbox": _identity,
+    "url": _identity,
+    "email": _identity,
+    "phone_number": _identity,
+    "people": lambda users: [user.get("name") or user["id"] for user in users],
+    "relation": lambda pages: [page["id"] for page in pages],
+    "files": _files,
+    "formula": _typed,
+    "rollup": _typed,
+    "string": _identity,
+    "boolean": _identity,
+    "created_time": _identity,
+    "last_edited_time": _identity,
+    "created_by": lambda user: user.get("name") or user["id"],
+    "last_edited_by": lambda user: user.get("name") or user["id"],
+}
+
+
+# Names of Arrow types of decoded property values, keyed by the type of property.
+# Types of formula and rollup depend on their expressions, they are inferred from values
+ARROW_TYPES: Dict[str, str] = {
+    "title": "string",
+    "rich_text": "string",
+    "number": "float64",
+    "select": "string",
+    "status": "string",
+    "multi_select": "list<string>",
+    "date": "string",
+    "checkbox": "bool",
+    "url": "string",
+    "email": "string",
+    "phone_number": "string",
+    "people": "list<string>",
+    "relation": "list<string>",
+    "files": "list<string>",
+    "created_time": "string",
+    "last_edited_time": "string",
+    "created_by": "string",
+    "last_edited_by": "string",
+}
+
+
+def _import_pyarrow() -> Any:
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError("pyarrow is required for exporting Arrow record batches") from e
+    return pa
+
+
+def _arrow_type(pa: Any, name: str) -> Any:
+    if name.startswith("list<"):
+        return pa.list_(_arrow_type(pa, name[5:-1]))
+    return getattr(pa, name)()
+
+
+def _infer_arrow_type(pa: Any, values: List[Any]) -> Any:
+    """
+    Infer the Arrow type of non-null values, None if it is not known yet (e.g. only empty lists)
+    """
+    type_ = pa.array(values).type
+    if pa.types.is_integer(type_):  # numbers of the API are not always integers
+        return pa.float64()
+    if pa.types.is_list(type_) and pa.types.is_null(type_.value_type):
+        return None
+    return type_
+
+
+def _arrow_schema(pa: Any, types: Dict[str, Any]) -> Any:
+    return pa.schema([(name, pa.null() if type_ is None else type_) for name, type_ in types.items()])
+
+
+class DatabaseExporter:
+    """
+    DatabaseExporter
+    Export pages of a database as columnar data
+
+    Pages are consumed from a streaming database query,
+    and their property values are decoded into column buffers one response at a time,
+    so only a batch of rows is held besides the output.
+    Output is Arrow record batches or table when `pyarrow` is installed,
+    pandas DataFrame when `pandas` is installed, or dictionary of lists
+
+    Attributes
+    ----------
+    client : NotionClient
+        Client used for requests
+    database_id : str
+        ID or URL of the database
+    filter : Dict, optional
+        Filter object of the API
+    sorts : list of Dict, optional
+        Sort objects of the API
+    columns : list of str, optional
+        Properties to export, all the properties if None
+    users : UserDirectory, optional
+        Directory to resolve names of users which are given only by ID
+
+    Methods
+    -------
+    iter_batches(batch_size: int = 1000)
+        Iterate over batches of columns
+    iter_record_batches(batch_size: int = 1000)
+        Iterate over Arrow record batches
+    to_columns()
+        Return all rows as dictionary of lists
+    to_arrow()
+        Return all rows as Arrow table
+    to_pandas()
+        Return all rows as pandas DataFrame
+
+    Examples
+    --------
+    >>> exporter = DatabaseExporter(client, database_id, columns=["Name", "Score"])
+    >>> df = exporter.to_pandas()
+    """
+
+    ID_COLUMN: str = "id"
+
+    def __init__(
+        self,
+        client: Any,
+        database_id: str,
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        sorts: Optional[List[Dict[str, Any]]] = None,
+        columns: Optional[Iterable[str]] = None,
+        users: Optional[Any] = None,
+    ):
+        """
+        Parameters
+        ----------
+        client : NotionClient
+            Client used for requests
+        database_id : str
+            ID or URL of the database
+        filter : Dict, optional
+            Filter object of the API
+        sorts : list of Dict, optional
+            Sort objects of the API
+        columns : iterable of str, optional
+            Properties to export, all the properties if None.
+            ID of each page is always exported as column `id`
+        users : UserDirectory, optional
+            Directory to resolve names of users which are given only by ID,
+            e.g. of people properties. Their IDs are exported if None
+        """
+        self.client = client
+        self.database_id = database_id
+        self.filter = filter
+        self.sorts = sorts
+        self.columns: Optional[List[str]] = list(columns) if columns is not None else None
+        self.users = users
+
+    def _decoder(self, type_: str) -> Decoder:
+        users = self.users
+        if users is not None:
+            if type_ == "people":
+                return lambda people: [users.name(user) for user in people]
+            if type_ in ("created_by", "last_edited_by"):
+                return users.name
+        return DECODERS.get(type_, _identity)
+
+    def _properties(self) -> Dict[str, Any]:
+        status_code, res = self.client.get_database(database_id=self.database_id)
+        if status_code != 200:
+            raise ValueError(f"failed to get the database ({status_code}): {res.get('message')}")
+        return res["properties"]
+
+    def _names(self) -> List[str]:
+        if self.columns is not None:
+            return self.columns
+        return list(self._properties())
+
+    def _arrow_types(self, pa: Any) -> Dict[str, Any]:
+        """
+        Return column name to Arrow type, None if the type is inferred from values
+        """
+        properties = self._properties()
+        names = self.columns if self.columns is not None else list(properties)
+        types: Dict[str, Any] = {self.ID_COLUMN: pa.string()}
+        for name in names:
+            type_ = properties.get(name, {}).get("type")
+            types[name] = _arrow_type(pa, ARROW_TYPES[type_]) if type_ in ARROW_TYPES else None
+        return types
+
+    def iter_batches(self, batch_size: int = 1000) -> Iterator[Columns]:
+        """
+        iter_batches(batch_size: int = 1000)
+            Iterate over batches of columns
+
+        Parameters
+        ----------
+        batch_size : int, default=1000
+            Maximum number of rows in a batch
+
+        Yields
+        ------
+        Dict[str, List[Any]]
+            Column name to values, with column `id` first
+        """
+        yield from self._iter_batches(self._names(), batch_size)
+
+    def _iter_batches(self, names: List[str], batch_size: int) -> Iterator[Columns]:
+        decoders: Dict[str, Decoder] = {}
+        buffers: Columns = {name: [] for name in [self.ID_COLUMN, *names]}
+        ids = buffers[self.ID_COLUMN]
+        size = 0
+        pages = self.client.iter_database_query(
+            database_id=self.database_id, filter=self.filter, sorts=self.sorts
+        )
+        for page in pages:
+            ids.append(page["id"])
+            properties = page["properties"]
+            for name in names:
+                prop = properties.get(name)
+                if prop is None:
+                    buffers[name].append(None)
+                    continue
+                decoder = decoders.get(name)
+                if decoder is None:  # resolved once per column
+                    decoder = decoders[name] = self._decoder(prop["type"])
+                buffers[name].append(decoder(prop[prop["type"]]))
+            size += 1
+            if size >= batch_size:
+                yield buffers
+                buffers = {name: [] for name in buffers}
+                ids = buffers[self.ID_COLUMN]
+                size = 0
+        if size > 0:
+            yield buffers
+
+    def iter_record_batches(self, batch_size: int = 1000) -> Iterator[Any]:
+        """
+        iter_record_batches(batch_size: int = 1000)
+            Iterate over Arrow record batches, `pyarrow` is required
+
+        All batches have the same schema, given by the types of the properties.
+        Types of formula and rollup are inferred from their first values,
+        so batches are held until every such column has a value (or the last batch)
+
+        Parameters
+        ----------
+        batch_size : int, default=1000
+            Maximum number of rows in a batch
+
+        Yields
+        ------
+        pyarrow.RecordBatch
+
+        Raises
+        ------
+        ImportError
+            if pyarrow is not installed
+        """
+        pa = _import_pyarrow()
+        yield from self._iter_record_batches(pa, self._arrow_types(pa), batch_size)
+
+    def _iter_record_batches(self, pa: Any, types: Dict[str, Any], batch_size: int) -> Iterator[Any]:
+        pending: List[Columns] = []
+        for batch in self._iter_batches(list(types)[1:], batch_size):
+            for name, type_ in types.items():
+                if type_ is None:
+                    values = [value for value in batch[name] if value is not None]
+                    if values:
+                        types[name] = _infer_arrow_type(pa, values)
+            pending.append(batch)
+            if all(type_ is not None for type_ in types.values()):
+                schema = _arrow_schema(pa, types)
+                for columns in pending:
+                    yield pa.RecordBatch.from_pydict(columns, schema=schema)
+                pending = []
+        schema = _arrow_schema(pa, types)  # columns without values are null
+        for columns in pending:
+            yield pa.RecordBatch.from_pydict(columns, schema=schema)
+
+    def to_columns(self) -> Columns:
+        """
+        to_columns()
+            Return all rows as dictionary of lists
+
+        Returns
+        -------
+        Dict[str, List[Any]]
+        """
+        names = self._names()
+        columns: Columns = {name: [] for name in [self.ID_COLUMN, *names]}
+        for batch in self._iter_batches(names, 1000):
+            for name, values in batch.items():
+                columns[name].extend(values)
+        return columns
+
+    def to_arrow(self) -> Any:
+        """
+        to_arrow()
+            Return all rows as Arrow table, `pyarrow` is required
+
+        Returns
+        -------
+        pyarrow.Table
+
+        Raises
+        ------
+        ImportError
+            if pyarrow is not installed
+        """
+        pa = _import_pyarrow()
+        types = self._arrow_types(pa)
+        batches = list(self._iter_record_batches(pa, types, 1000))
+        if not batches:  # no page matched
+            return _arrow_schema(pa, types).empty_table()
+        return pa.Table.from_batches(batches)
+
+    def to_pandas(self) -> Any:
+        """
+        to_pandas()
+            Return all rows as pandas DataFrame, `pandas` is required
+
+        Returns
+        -------
+        pandas.DataFrame
+
+        Raises
+        ------
+        ImportError
+            if pandas is not installed
+        """
+        try:
+            import pandas as pd
+        except ImportError as e:
+            raise ImportError("pandas is required for exporting DataFrame") from e
+        return pd.DataFrame(self.to_columns())
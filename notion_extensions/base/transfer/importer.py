@@ -0,0 +1,450 @@
+import csv
+import datetime
+import math
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from ..utils.limits import TEXT_CONTENT_LENGTH
+
+__all__ = [
+    "ImportResult",
+    "DatabaseImporter",
+    "iter_csv",
+    "iter_parquet",
+    "ENCODERS",
+]
+
+Columns = Dict[str, List[Any]]  # a chunk of columnar data, column name -> values
+Encoder = Callable[[Any], Dict[str, Any]]
+
+_TRUE = frozenset(("true", "t", "yes", "y", "1", "x", "checked", "on"))
+
+
+class ImportResult(NamedTuple):
+    """
+    ImportResult
+    Result of creating a page from a row
+
+    Attributes
+    ----------
+    row : int
+        Index of the row in the source, starting from 0
+    status_code : int, optional
+        Status code of the response, None if the request was not sent
+    page_id : str, optional
+        ID of the created page
+    error : str, optional
+        Description of the failure, None if the page was created
+    """
+
+    row: int
+    status_code: Optional[int]
+    page_id: Optional[str]
+    error: Optional[str]
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+# Readers
+def iter_csv(
+    path: str,
+    *,
+    chunk_size: int = 1000,
+    encoding: str = "utf-8",
+    **kwargs: Any,
+) -> Iterator[Columns]:
+    """
+    Read a CSV file with a header row in chunks of columns
+
+    Parameters
+    ----------
+    path : str
+        Path of the CSV file
+    chunk_size : int, default=1000
+        Number of rows in a chunk
+    encoding : str, default='utf-8'
+        Encoding of the file
+    **kwargs
+        Passed to `csv.reader`, e.g. `delimiter`
+
+    Yields
+    ------
+    Dict[str, List[str]]
+        Column name to values of up to `chunk_size` rows
+    """
+    with open(path, newline="", encoding=encoding) as f:
+        reader = csv.reader(f, **kwargs)
+        header = next(reader, None)
+        if header is None:
+            return
+        rows: List[List[str]] = []
+        for row in reader:
+            rows.append(row)
+            if len(rows) >= chunk_size:
+                yield _transpose(header, rows)
+                rows = []
+        if rows:
+            yield _transpose(header, rows)
+
+
+def _transpose(header: List[str], rows: List[List[str]]) -> Columns:
+    width = len(header)
+    rows = [row + [""] * (width - len(row)) if len(row) < width else row for row in rows]
+    return {name: list(values) for name, values in zip(header, zip(*rows))}
+
+
+def iter_parquet(path: str, *, chunk_size: int = 1000) -> Iterator[Columns]:
+    """
+    Read a Parquet file in chunks of columns, `pyarrow` is required
+
+    Parameters
+    ----------
+    path : str
+        Path of the Parquet file
+    chunk_size : int, default=1000
+        Number of rows in a chunk
+
+    Yields
+    ------
+    Dict[str, List[Any]]
+        Column name to values of up to `chunk_size` rows
+
+    Raises
+    ------
+    ImportError
+        if pyarrow is not installed
+    """
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("pyarrow is required for reading Parquet files") from e
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+        yield batch.to_pydict()
+
+
+# Encoders
+def _is_empty(value: Any) -> bool:
+    if value is None or value == "":
+        return True
+    return isinstance(value, float) and math.isnan(value)
+
+
+def _rich_text(value: Any) -> List[Dict[str, Any]]:
+    content = str(value)
+    return [
+        {"type": "text", "text": {"content": content[start : start + TEXT_CONTENT_LENGTH]}}
+        for start in range(0, len(content), TEXT_CONTENT_LENGTH)
+    ]
+
+
+def _number(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        value = float(str(value).replace(",", ""))
+        if value.is_integer():
+            value = int(value)
+    return {"number": value}
+
+
+def _checkbox(value: Any) -> Dict[str, Any]:
+    if isinstance(value, str):
+        return {"checkbox": value.strip().lower() in _TRUE}
+    return {"checkbox": bool(value)}
+
+
+def _date(value: Any) -> Dict[str, Any]:
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return {"date": {"start": value.isoformat()}}
+    return {"date": {"start": str(value)}}
+
+
+def _multi_select(value: Any, separator: str = ",") -> Dict[str, Any]:
+    names = value.split(separator) if isinstance(value, str) else value
+    return {"multi_select": [{"name": str(name).strip()} for name in names if str(name).strip()]}
+
+
+# Encoders of values of each property type, keyed by the type in the database schema
+ENCODERS: Dict[str, Encoder] = {
+    "title": lambda value: {"title": _rich_text(value)},
+    "rich_text": lambda value: {"rich_text": _rich_text(value)},
+    "number": _number,
+    "select": lambda value: {"select": {"name": str(value)}},
+    "multi_select": _multi_select,
+    "checkbox": _checkbox,
+    "date": _date,
+    "url": lambda value: {"url": str(value)},
+    "email": lambda value: {"email": str(value)},
+    "phone_number": lambda value: {"phone_number": str(value)},
+}
+
+
+class DatabaseImporter:
+    """
+    DatabaseImporter
+    Create pages of a database from columnar data, e.g. CSV or Parquet files
+
+    Columns are mapped to properties by the schema of the database,
+    values of a chunk are encoded column by column,
+    and pages are created concurrently with a bounded number of requests in flight,
+    so memory stays flat regardless of the number of rows.
+    Use a client with `rate_limit` to keep requests under the rate limit of the API
+
+    Attributes
+    ----------
+    client : NotionClient
+        Client used for requests
+    database_id : str
+        ID or URL of the database
+    columns : Dict[str, str]
+        Column name to property name
+    workers : int
+        Number of concurrent requests
+
+    Methods
+    -------
+    import_csv(path: str, chunk_size: int = 1000, **kwargs)
+        Create pages from rows of a CSV file
+    import_parquet(path: str, chunk_size: int = 1000)
+        Create pages from rows of a Parquet file
+    import_chunks(chunks: Iterable[Dict[str, List[Any]]])
+        Create pages from chunks of columns
+
+    Examples
+    --------
+    >>> client = NotionClient(rate_limit=3, max_retries=3)
+    >>> importer = DatabaseImporter(client, database_id)
+    >>> failed = [r for r in importer.import_csv("export.csv") if not r.ok]
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        database_id: str,
+        *,
+        columns: Optional[Mapping[str, str]] = None,
+        workers: int = 4,
+        multi_select_separator: str = ",",
+    ):
+        """
+        Parameters
+        ----------
+        client : NotionClient
+            Client used for requests
+        database_id : str
+            ID or URL of the database
+        columns : Mapping[str, str], optional
+            Column name to property name.
+            If not given, columns are mapped to properties of the same name
+        workers : int, default=4
+            Number of concurrent requests
+        multi_select_separator : str, default=','
+            Separator of names of multi_select values given as str
+
+        Raises
+        ------
+        ValueError
+            if workers is not positive
+        """
+        if workers <= 0:
+            raise ValueError(f"workers must be more than 0, but {workers} is given")
+        self.client = client
+        self.database_id = database_id
+        self.columns: Optional[Dict[str, str]] = dict(columns) if columns is not None else None
+        self.workers = workers
+        self.multi_select_separator = multi_select_separator
+        self.__schema: Optional[Dict[str, str]] = None
+
+    @property
+    def schema(self) -> Dict[str, str]:
+        """
+        Property name to property type of the database, fetched once
+
+        Raises
+        ------
+        ValueError
+            if the database cannot be retrieved
+        """
+        if self.__schema is None:
+            status_code, res = self.client.get_database(database_id=self.database_id)
+            if status_code != 200:
+                raise ValueError(f"failed to get the database ({status_code}): {res.get('message')}")
+            self.__schema = {name: prop["type"] for name, prop in res["properties"].items()}
+        return self.__schema
+
+    def encoders(self, names: Iterable[str]) -> Dict[str, Tuple[str, Encoder]]:
+        """
+        encoders(names: Iterable[str])
+            Return column name to (property name, encoder) of the given columns
+
+        Raises
+        ------
+        ValueError
+            if a column of `columns` is missing from names, a column has no property,
+            or the type of its property is not supported
+        """
+        schema = self.schema
+        names = list(names)
+        if self.columns is not None:
+            missing = [column for column in self.columns if column not in names]
+            if missing:
+                raise ValueError(f"columns {missing} are missing from the header {names}")
+        mapping = self.columns if self.columns is not None else {name: name for name in names}
+        out: Dict[str, Tuple[str, Encoder]] = {}
+        for column, prop in mapping.items():
+            if prop not in schema:
+                raise ValueError(
+                    f"column `{column}` has no property `{prop}` in the database, "
+                    "use `columns` to map or select columns"
+                )
+            type_ = schema[prop]
+            if type_ == "multi_select":
+                separator = self.multi_select_separator
+                out[column] = (prop, lambda value: _multi_select(value, separator))
+            elif type_ in ENCODERS:
+                out[column] = (prop, ENCODERS[type_])
+            else:
+                raise ValueError(f"type `{type_}` of property `{prop}` is not supported")
+        return out
+
+    def encode(self, chunk: Mapping[str, Any]) -> List[Tuple[Optional[Dict[str, Any]], Optional[str]]]:
+        """
+        encode(chunk: Mapping[str, Any])
+            Encode a chunk of columns into properties of pages, column by column
+
+        Parameters
+        ----------
+        chunk : Mapping[str, Any]
+            Column name to values, e.g. dict of list or pandas DataFrame
+
+        Returns
+        -------
+        list of (properties, error)
+            Properties of each row, or None and the error if a value cannot be encoded
+
+        Raises
+        ------
+        ValueError
+            if a column of `columns` is missing from the chunk, see `encoders`
+        """
+        encoders = self.encoders(chunk.keys())
+        size = 0
+        for column in encoders:
+            values = chunk[column]
+            size = max(size, len(values))
+        rows: List[Dict[str, Any]] = [{} for _ in range(size)]
+        errors: List[Optional[str]] = [None] * size
+        for column, (prop, encoder) in encoders.items():
+            values = chunk[column]
+            tolist = getattr(values, "tolist", None)  # NumPy arrays and pandas Series
+            for i, value in enumerate(tolist() if tolist is not None else values):
+                if _is_empty(value):
+                    continue
+                try:
+                    rows[i][prop] = encoder(value)
+                except (TypeError, ValueError) as e:
+                    errors[i] = f"column `{column}`: {e}"
+        return [(None, error) if error is not None else (row, None) for row, error in zip(rows, errors)]
+
+    def import_chunks(self, chunks: Iterable[Mapping[str, Any]]) -> Iterator[ImportResult]:
+        """
+        import_chunks(chunks: Iterable[Mapping[str, Any]])
+            Create pages from chunks of columns
+
+        Parameters
+        ----------
+        chunks : iterable of Mapping[str, Any]
+            Chunks of columns, e.g. from `iter_csv` or `iter_parquet`
+
+        Yields
+        ------
+        ImportResult
+            Result of each row, in the order of rows
+        """
+        pending: Deque[Tuple[int, Future]] = deque()
+        index = 0
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for chunk in chunks:
+                for properties, error in self.encode(chunk):
+                    if properties is None:
+                        while pending:  # keep the order of results
+                            yield self._result(*pending.popleft())
+                        yield ImportResult(index, None, None, error)
+                    else:
+                        pending.append((index, executor.submit(copy_context().run, self._create, properties)))
+                        while len(pending) > self.workers * 2:  # bound rows in flight
+                            yield self._result(*pending.popleft())
+                    index += 1
+            while pending:
+                yield self._result(*pending.popleft())
+
+    def import_csv(self, path: str, *, chunk_size: int = 1000, **kwargs: Any) -> Iterator[ImportResult]:
+        """
+        import_csv(path: str, chunk_size: int = 1000, **kwargs)
+            Create pages from rows of a CSV file with a header row
+
+        Parameters
+        ----------
+        path : str
+            Path of the CSV file
+        chunk_size : int, default=1000
+            Number of rows read at once
+        **kwargs
+            Passed to `iter_csv`, e.g. `encoding` and `delimiter`
+
+        Yields
+        ------
+        ImportResult
+            Result of each row, in the order of rows
+        """
+        return self.import_chunks(iter_csv(path, chunk_size=chunk_size, **kwargs))
+
+    def import_parquet(self, path: str, *, chunk_size: int = 1000) -> Iterator[ImportResult]:
+        """
+        import_parquet(path: str, chunk_size: int = 1000)
+            Create pages from rows of a Parquet file, `pyarrow` is required
+
+        Parameters
+        ----------
+        path : str
+            Path of the Parquet file
+        chunk_size : int, default=1000
+            Number of rows read at once
+
+        Yields
+        ------
+        ImportResult
+            Result of each row, in the order of rows
+        """
+        return self.import_chunks(iter_parquet(path, chunk_size=chunk_size))
+
+    def _create(self, properties: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        return self.client.create_page(
+            parent_id=self.database_id,
+            parent_type="database",
+            properties=properties,
+        )
+
+    @staticmethod
+    def _result(index: int, future: Future) -> ImportResult:
+        try:
+            status_code, res = future.result()
+        except Exception as e:  # e.g. connection errors, reported per row
+            return ImportResult(index, None, None, f"{type(e).__name__}: {e}")
+        if status_code != 200:
+            return ImportResult(index, status_code, None, res.get("message", "request failed"))
+        return ImportResult(index, status_code, res.get("id"), None)
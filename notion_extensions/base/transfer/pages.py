@@ -0,0 +1,297 @@
+import multiprocessing
+import os
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Any, Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from ..utils import parse_id
+from .render import RENDERERS, page_title
+
+__all__ = [
+    "ExportResult",
+    "PageExporter",
+    "fetch_page_tree",
+]
+
+_DONE = object()  # end of the fetch stage
+_EXTENSIONS = {"markdown": "md", "html": "html"}
+
+
+class ExportResult(NamedTuple):
+    """
+    ExportResult
+    Result of exporting a page
+
+    Attributes
+    ----------
+    page_id : str
+        ID or URL of the page as it was given
+    title : str
+        Title of the page, empty if the page could not be fetched
+    content : str, optional
+        Rendered page, None if the export failed
+    error : str, optional
+        Description of the failure, None if the page was exported
+    """
+
+    page_id: str
+    title: str
+    content: Optional[str]
+    error: Optional[str]
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def fetch_page_tree(
+    client: Any, block_id: str, max_depth: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Fetch all the blocks under block_id.
+    Children of a block which has children are stored under the key `children` of the block
+
+    Parameters
+    ----------
+    client : NotionClient
+        Client used for requests
+    block_id : str
+        ID or URL of a page or block
+    max_depth : int, optional
+        Levels of nested blocks to fetch, unlimited if None.
+        Child pages and databases are not descended into
+
+    Returns
+    -------
+    list of Dict[str, Any]
+        Block objects
+    """
+    blocks = list(client.iter_block_children(block_id=block_id))
+    if max_depth is not None and max_depth <= 1:
+        return blocks
+    depth = None if max_depth is None else max_depth - 1
+    for block in blocks:
+        if block.get("has_children") and block.get("type") not in ("child_page", "child_database"):
+            block["children"] = fetch_page_tree(client, block["id"], depth)
+    return blocks
+
+
+def _render(format: str, page: Dict[str, Any], blocks: List[Dict[str, Any]]) -> str:
+    return RENDERERS[format](page, blocks)
+
+
+class PageExporter:
+    """
+    PageExporter
+    Export many pages concurrently as Markdown or HTML
+
+    The export is a pipeline of two stages.
+    Page trees are fetched by a pool of threads, as fetching is bound by I/O (and the rate limit),
+    and rendered by a pool of processes, as rendering is bound by CPU.
+    A bounded queue between the stages keeps fetched trees waiting for rendering under `queue_size`,
+    so fetching is paused when rendering falls behind.
+    Use a client with `rate_limit` to keep requests under the rate limit of the API
+
+    Attributes
+    ----------
+    client : NotionClient
+        Client used for requests
+    format : 'markdown' or 'html'
+        Format of exported pages
+    fetch_workers : int
+        Number of threads fetching pages
+    render_workers : int
+        Number of processes rendering pages, rendered in the calling process if 0
+    queue_size : int
+        Maximum number of fetched pages waiting for rendering
+    max_depth : int, optional
+        Levels of nested blocks to fetch, unlimited if None
+
+    Methods
+    -------
+    export(page_ids: Iterable[str])
+        Export pages, yield the results as they are rendered
+    export_to(directory: str, page_ids: Iterable[str])
+        Export pages into files of a directory
+
+    Examples
+    --------
+    >>> exporter = PageExporter(NotionClient(rate_limit=3, max_retries=3), format="html")
+    >>> for result in exporter.export_to("backup", page_ids):
+    ...     if not result.ok:
+    ...         print(result.page_id, result.error)
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        format: str = "markdown",
+        fetch_workers: int = 4,
+        render_workers: Optional[int] = None,
+        queue_size: int = 16,
+        max_depth: Optional[int] = None,
+    ):
+        """
+        Parameters
+        ----------
+        client : NotionClient
+            Client used for requests
+        format : 'markdown' or 'html', default='markdown'
+            Format of exported pages
+        fetch_workers : int, default=4
+            Number of threads fetching pages
+        render_workers : int, optional
+            Number of processes rendering pages, the number of CPUs if None.
+            Pages are rendered in the calling process if 0
+        queue_size : int, default=16
+            Maximum number of fetched pages waiting for rendering
+        max_depth : int, optional
+            Levels of nested blocks to fetch, unlimited if None
+
+        Raises
+        ------
+        ValueError
+            if format is unknown or a number of workers is invalid
+        """
+        if format not in RENDERERS:
+            raise ValueError(f"format must be one of {sorted(RENDERERS)}, but `{format}` is given")
+        if fetch_workers <= 0:
+            raise ValueError(f"fetch_workers must be more than 0, but {fetch_workers} is given")
+        if render_workers is not None and render_workers < 0:
+            raise ValueError(f"render_workers must be 0 or more, but {render_workers} is given")
+        if queue_size <= 0:
+            raise ValueError(f"queue_size must be more than 0, but {queue_size} is given")
+        self.client = client
+        self.format = format
+        self.fetch_workers = fetch_workers
+        self.render_workers: int = render_workers if render_workers is not None else (os.cpu_count() or 1)
+        self.queue_size = queue_size
+        self.max_depth = max_depth
+
+    def _fetch(self, page_id: str) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        status_code, page = self.client.get_page(page_id=page_id)
+        if status_code != 200:
+            raise ValueError(f"failed to get the page ({status_code}): {page.get('message')}")
+        return page, fetch_page_tree(self.client, page["id"], self.max_depth)
+
+    def _fetch_stage(self, page_ids: Iterable[str], fetched: "queue.Queue[Any]", stop: threading.Event) -> None:
+        """
+        Fetch pages with a pool of threads, and put them into `fetched` in the order they complete
+        """
+        slots = threading.Semaphore(self.fetch_workers)  # pages being fetched
+
+        def job(page_id: str) -> None:
+            try:
+                try:
+                    item: Any = (page_id, self._fetch(page_id), None)
+                except Exception as e:  # reported per page
+                    item = (page_id, None, f"{type(e).__name__}: {e}")
+                fetched.put(item)  # blocks while the render stage is behind
+            finally:
+                slots.release()
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.fetch_workers) as pool:
+                for page_id in page_ids:
+                    slots.acquire()
+                    if stop.is_set():
+                        slots.release()
+                        break
+                    pool.submit(copy_context().run, job, page_id)
+        finally:
+            fetched.put(_DONE)
+
+    def export(self, page_ids: Iterable[str]) -> Iterator[ExportResult]:
+        """
+        export(page_ids: Iterable[str])
+            Export pages, yield the results as they are rendered
+
+        Parameters
+        ----------
+        page_ids : iterable of str
+            IDs or URLs of pages
+
+        Yields
+        ------
+        ExportResult
+            Result of each page, in the order the pages are fetched
+        """
+        fetched: "queue.Queue[Any]" = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+        feeder = threading.Thread(  # fetched in the context (priority lane) of the caller
+            target=copy_context().run, args=(self._fetch_stage, page_ids, fetched, stop), daemon=True
+        )
+        feeder.start()
+        renderer: Optional[Executor] = None
+        if self.render_workers > 0:  # spawned, as forking a process with running threads may deadlock
+            renderer = ProcessPoolExecutor(
+                max_workers=self.render_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        pending: Deque[Tuple[str, str, Future]] = deque()
+        try:
+            while True:
+                item = fetched.get()
+                if item is _DONE:
+                    break
+                page_id, tree, error = item
+                if error is not None:
+                    yield ExportResult(page_id, "", None, error)
+                    continue
+                page, blocks = tree
+                title = page_title(page)
+                if renderer is None:
+                    yield self._result(page_id, title, lambda: _render(self.format, page, blocks))
+                    continue
+                pending.append((page_id, title, renderer.submit(_render, self.format, page, blocks)))
+                while len(pending) > self.render_workers * 2:  # bound pages being rendered
+                    page_id, title, future = pending.popleft()
+                    yield self._result(page_id, title, future.result)
+            while pending:
+                page_id, title, future = pending.popleft()
+                yield self._result(page_id, title, future.result)
+        finally:
+            stop.set()
+            while feeder.is_alive():  # unblock the fetch stage if the caller stopped early
+                try:
+                    fetched.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            if renderer is not None:
+                renderer.shutdown(cancel_futures=True)
+
+    def export_to(self, directory: str, page_ids: Iterable[str]) -> Iterator[ExportResult]:
+        """
+        export_to(directory: str, page_ids: Iterable[str])
+            Export pages into files named by page ID with dashes, e.g. `<page id>.md`
+
+        Parameters
+        ----------
+        directory : str
+            Directory of exported files, created if it does not exist
+        page_ids : iterable of str
+            IDs or URLs of pages
+
+        Yields
+        ------
+        ExportResult
+            Result of each page, in the order the pages are fetched
+        """
+        os.makedirs(directory, exist_ok=True)
+        extension = _EXTENSIONS[self.format]
+        for result in self.export(page_ids):
+            if result.ok:
+                name = parse_id(result.page_id, "page")  # the same file for an ID and its URL
+                with open(os.path.join(directory, f"{name}.{extension}"), "w", encoding="utf-8") as f:
+                    f.write(result.content)  # type: ignore
+            yield result
+
+    @staticmethod
+    def _result(page_id: str, title: str, render: Any) -> ExportResult:
+        try:
+            return ExportResult(page_id, title, render(), None)
+        except Exception as e:  # reported per page
+            return ExportResult(page_id, title, None, f"{type(e).__name__}: {e}")
@@ -0,0 +1,238 @@
+import html
+from typing import Any, Callable, Dict, List
+
+__all__ = [
+    "render_markdown",
+    "render_html",
+    "RENDERERS",
+    "page_title",
+]
+
+Renderer = Callable[[Dict[str, Any], List[Dict[str, Any]]], str]
+
+_HEADINGS = {"heading_1": 1, "heading_2": 2, "heading_3": 3}
+_LIST_ITEMS = ("bulleted_list_item", "numbered_list_item", "to_do")
+_FILES = ("image", "video", "file", "pdf", "bookmark", "embed")
+
+
+def _texts(body: Dict[str, Any]) -> List[Dict[str, Any]]:
+    # `text` until API version 2022-02-22, `rich_text` after it
+    return body.get("rich_text", body.get("text", []))
+
+
+def _url(body: Dict[str, Any]) -> str:
+    if "url" in body:
+        return body["url"]
+    type_ = body.get("type")
+    return body.get(type_, {}).get("url", "") if type_ else ""
+
+
+def page_title(page: Dict[str, Any]) -> str:
+    """
+    Return the plain text title of a page object
+    """
+    for prop in page.get("properties", {}).values():
+        if prop.get("type") == "title":
+            return "".join(t.get("plain_text", "") for t in prop["title"])
+    return ""
+
+
+# Markdown
+def _markdown_text(texts: List[Dict[str, Any]]) -> str:
+    out = []
+    for text in texts:
+        content = text.get("plain_text", "")
+        if not content:
+            continue
+        annotations = text.get("annotations", {})
+        if annotations.get("code"):
+            content = f"`{content}`"
+        if annotations.get("bold"):
+            content = f"**{content}**"
+        if annotations.get("italic"):
+            content = f"*{content}*"
+        if annotations.get("strikethrough"):
+            content = f"~~{content}~~"
+        if text.get("href"):
+            content = f"[{content}]({text['href']})"
+        out.append(content)
+    return "".join(out)
+
+
+def _markdown_blocks(blocks: List[Dict[str, Any]], indent: str, out: List[str]) -> None:
+    number = 0
+    for block in blocks:
+        type_ = block.get("type", "")
+        body = block.get(type_, {})
+        children = block.get("children", [])
+        number = number + 1 if type_ == "numbered_list_item" else 0
+        text = _markdown_text(_texts(body))
+        if type_ == "paragraph":
+            out.append(f"{indent}{text}\n")
+        elif type_ in _HEADINGS:
+            out.append(f"{indent}{'#' * _HEADINGS[type_]} {text}\n")
+        elif type_ == "bulleted_list_item":
+            out.append(f"{indent}- {text}")
+        elif type_ == "numbered_list_item":
+            out.append(f"{indent}{number}. {text}")
+        elif type_ == "to_do":
+            out.append(f"{indent}- [{'x' if body.get('checked') else ' '}] {text}")
+        elif type_ == "toggle":
+            out.append(f"{indent}- {text}")
+        elif type_ in ("quote", "callout"):
+            out.append(f"{indent}> {text}\n")
+        elif type_ == "code":
+            code = "".join(t.get("plain_text", "") for t in _texts(body))
+            out.append(f"{indent}```{body.get('language', '')}\n{code}\n{indent}```\n")
+        elif type_ == "equation":
+            out.append(f"{indent}$$ {body.get('expression', '')} $$\n")
+        elif type_ == "divider":
+            out.append(f"{indent}---\n")
+        elif type_ in _FILES:
+            caption = _markdown_text(body.get("caption", [])) or type_
+            prefix = "!" if type_ == "image" else ""
+            out.append(f"{indent}{prefix}[{caption}]({_url(body)})\n")
+        elif type_ == "child_page":
+            out.append(f"{indent}[{body.get('title', '')}]({block.get('id', '')})\n")
+        elif type_ == "table":
+            rows = [row.get("table_row", {}).get("cells", []) for row in children]
+            for i, cells in enumerate(rows):
+                out.append(f"{indent}| " + " | ".join(_markdown_text(c) for c in cells) + " |")
+                if i == 0:
+                    out.append(f"{indent}|" + " --- |" * len(cells))
+            out.append("")
+            continue
+        if children:
+            nested = indent + "    " if type_ in _LIST_ITEMS or type_ == "toggle" else indent
+            _markdown_blocks(children, nested, out)
+
+
+def render_markdown(page: Dict[str, Any], blocks: List[Dict[str, Any]]) -> str:
+    """
+    Render a page and its block tree as Markdown
+
+    Parameters
+    ----------
+    page : Dict[str, Any]
+        Page object
+    blocks : list of Dict[str, Any]
+        Block objects, nested blocks are under the key `children` of each block
+
+    Returns
+    -------
+    str
+    """
+    out = [f"# {page_title(page)}\n"]
+    _markdown_blocks(blocks, "", out)
+    return "\n".join(out).rstrip("\n") + "\n"
+
+
+# HTML
+_HTML_TAGS = {
+    "paragraph": "p",
+    "heading_1": "h1",
+    "heading_2": "h2",
+    "heading_3": "h3",
+    "quote": "blockquote",
+    "callout": "aside",
+}
+_HTML_LISTS = {"bulleted_list_item": "ul", "numbered_list_item": "ol", "to_do": "ul"}
+
+
+def _html_text(texts: List[Dict[str, Any]]) -> str:
+    out = []
+    for text in texts:
+        content = html.escape(text.get("plain_text", ""))
+        annotations = text.get("annotations", {})
+        for style, tag in (("code", "code"), ("bold", "strong"), ("italic", "em"), ("strikethrough", "s")):
+            if annotations.get(style):
+                content = f"<{tag}>{content}</{tag}>"
+        if text.get("href"):
+            content = f'<a href="{html.escape(text["href"])}">{content}</a>'
+        out.append(content)
+    return "".join(out)
+
+
+def _html_blocks(blocks: List[Dict[str, Any]], out: List[str]) -> None:
+    open_list = ""
+    for block in blocks:
+        type_ = block.get("type", "")
+        body = block.get(type_, {})
+        children = block.get("children", [])
+        list_tag = _HTML_LISTS.get(type_, "")
+        if open_list != list_tag:
+            if open_list:
+                out.append(f"</{open_list}>")
+            if list_tag:
+                out.append(f"<{list_tag}>")
+            open_list = list_tag
+        text = _html_text(_texts(body))
+        inner: List[str] = []
+        if children and type_ != "table":
+            _html_blocks(children, inner)
+        if type_ in _HTML_TAGS:
+            out.append(f"<{_HTML_TAGS[type_]}>{text}</{_HTML_TAGS[type_]}>")
+            out.extend(inner)
+        elif list_tag:
+            checkbox = ""
+            if type_ == "to_do":
+                checked = " checked" if body.get("checked") else ""
+                checkbox = f'<input type="checkbox" disabled{checked}> '
+            out.append(f"<li>{checkbox}{text}{''.join(inner)}</li>")
+        elif type_ == "toggle":
+            out.append(f"<details><summary>{text}</summary>{''.join(inner)}</details>")
+        elif type_ == "code":
+            code = html.escape("".join(t.get("plain_text", "") for t in _texts(body)))
+            out.append(f'<pre><code class="language-{html.escape(body.get("language", ""))}">{code}</code></pre>')
+        elif type_ == "equation":
+            out.append(f'<div class="equation">{html.escape(body.get("expression", ""))}</div>')
+        elif type_ == "divider":
+            out.append("<hr>")
+        elif type_ == "image":
+            caption = html.escape("".join(t.get("plain_text", "") for t in body.get("caption", [])))
+            out.append(f'<img src="{html.escape(_url(body))}" alt="{caption}">')
+        elif type_ in _FILES:
+            caption = _html_text(body.get("caption", [])) or type_
+            out.append(f'<p><a href="{html.escape(_url(body))}">{caption}</a></p>')
+        elif type_ == "child_page":
+            out.append(f'<p><a href="{html.escape(block.get("id", ""))}">{html.escape(body.get("title", ""))}</a></p>')
+        elif type_ == "table":
+            out.append("<table>")
+            for row in children:
+                cells = row.get("table_row", {}).get("cells", [])
+                out.append("<tr>" + "".join(f"<td>{_html_text(c)}</td>" for c in cells) + "</tr>")
+            out.append("</table>")
+        else:
+            out.extend(inner)
+    if open_list:
+        out.append(f"</{open_list}>")
+
+
+def render_html(page: Dict[str, Any], blocks: List[Dict[str, Any]]) -> str:
+    """
+    Render a page and its block tree as HTML document
+
+    Parameters
+    ----------
+    page : Dict[str, Any]
+        Page object
+    blocks : list of Dict[str, Any]
+        Block objects, nested blocks are under the key `children` of each block
+
+    Returns
+    -------
+    str
+    """
+    title = html.escape(page_title(page))
+    out = [f"<!DOCTYPE html>\n<html>\n<head><meta charset=\"utf-8\"><title>{title}</title></head>\n<body>"]
+    out.append(f"<h1>{title}</h1>")
+    _html_blocks(blocks, out)
+    out.append("</body>\n</html>\n")
+    return "\n".join(out)
+
+
+# Renderers of each export format
+RENDERERS: Dict[str, Renderer] = {
+    "markdown": render_markdown,
+    "html": render_html,
+}
@@ -0,0 +1,158 @@
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional
+
+__all__ = [
+    "UserDirectory",
+]
+
+
+class UserDirectory:
+    """
+    UserDirectory
+    In-memory cache of the users of a workspace
+
+    The full list of users is loaded once with `iter_users` (a request per 100 users),
+    then IDs of people properties and mentions are resolved from memory.
+    An unknown ID reloads the list lazily, at most once per `min_refresh_interval` seconds,
+    so a burst of unknown IDs (e.g. guests, who are not listed) costs a single reload.
+    The directory is safe to share between threads
+
+    Attributes
+    ----------
+    client : NotionClient
+        Client used for requests
+    min_refresh_interval : float
+        Minimum seconds between reloads on a miss
+
+    Methods
+    -------
+    refresh()
+        Reload the list of users
+    get(user_id: str)
+        Return the user object of an ID
+    resolve(user_ids: Iterable[str])
+        Return user objects of IDs
+    name(user: Dict[str, Any] or str)
+        Return the name of a user
+
+    Examples
+    --------
+    >>> users = UserDirectory(client)
+    >>> names = [users.name(user) for user in page["properties"]["Assignee"]["people"]]
+    """
+
+    def __init__(self, client: Any, *, min_refresh_interval: float = 60.0):
+        """
+        Parameters
+        ----------
+        client : NotionClient
+            Client used for requests
+        min_refresh_interval : float, default=60.0
+            Minimum seconds between reloads on a miss
+        """
+        self.client = client
+        self.min_refresh_interval = min_refresh_interval
+        self.__lock = threading.Lock()  # one reload at a time
+        self.__users: Optional[Dict[str, Dict[str, Any]]] = None  # loaded on first use
+        self.__loaded_at = 0.0
+
+    def __len__(self) -> int:
+        return len(self._users())
+
+    def __contains__(self, user_id: str) -> bool:
+        return user_id in self._users()
+
+    def _users(self) -> Dict[str, Dict[str, Any]]:
+        users = self.__users
+        if users is None:
+            with self.__lock:
+                if self.__users is None:
+                    self._load()
+                users = self.__users
+        return users  # type: ignore
+
+    def _load(self) -> None:
+        self.__users = {user["id"]: user for user in self.client.iter_users()}
+        self.__loaded_at = time.monotonic()
+
+    def refresh(self) -> None:
+        """
+        refresh()
+            Reload the list of users
+        """
+        with self.__lock:
+            self._load()
+
+    def _refresh_on_miss(self) -> bool:
+        """
+        Reload unless the list was loaded within `min_refresh_interval`, return whether it was reloaded
+        """
+        loaded_at = self.__loaded_at
+        with self.__lock:
+            if self.__loaded_at != loaded_at:  # reloaded by another thread meanwhile
+                return True
+            if time.monotonic() - loaded_at < self.min_refresh_interval:
+                return False
+            self._load()
+            return True
+
+    def get(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """
+        get(user_id: str)
+            Return the user object of an ID
+
+        Parameters
+        ----------
+        user_id : str
+            ID of the user
+
+        Returns
+        -------
+        Dict[str, Any], optional
+            User object, None if the user is not found
+        """
+        return self.resolve([user_id]).get(user_id)
+
+    def resolve(self, user_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        resolve(user_ids: Iterable[str])
+            Return user objects of IDs, reloading the list at most once if some IDs are unknown
+
+        Parameters
+        ----------
+        user_ids : iterable of str
+            IDs of users
+
+        Returns
+        -------
+        Dict[str, Dict[str, Any]]
+            ID to user object, of the users found
+        """
+        users = self._users()
+        ids = set(user_ids)
+        if not ids <= users.keys() and self._refresh_on_miss():
+            users = self._users()
+        return {id_: users[id_] for id_ in ids if id_ in users}
+
+    def name(self, user: Any) -> str:
+        """
+        name(user: Dict[str, Any] or str)
+            Return the name of a user, the ID if the name is unknown
+
+        Parameters
+        ----------
+        user : Dict[str, Any] or str
+            Partial user object, e.g. of a people property, or ID of the user
+
+        Returns
+        -------
+        str
+            Name of the user
+        """
+        if isinstance(user, dict):
+            if user.get("name"):
+                return user["name"]
+            user = user["id"]
+        found = self.get(user)
+        return (found or {}).get("name") or user
@@ -1,5 +1,11 @@
+from .frozen import FrozenDict
 from .helper import parse_id
+from .serialize import dumps, normalize, omit_defaults
 
 __all__ = [
+    "dumps",
+    "FrozenDict",
+    "normalize",
+    "omit_defaults",
     "parse_id",
 ]
@@ -0,0 +1,31 @@
+__all__ = [
+    "FrozenDict",
+]
+
+
+class FrozenDict(dict):
+    """
+    Read-only dictionary which can be shared between props.
+    Copying returns itself, so `BaseProps.__setitem__` does not allocate a new one
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError(f"{type(self).__name__} is immutable")
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __ior__ = _readonly
+    clear = _readonly
+    pop = _readonly
+    popitem = _readonly
+    setdefault = _readonly
+    update = _readonly
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
@@ -1,4 +1,6 @@
+import re
 import sys
+from functools import lru_cache
 
 if sys.version_info >= (3, 10):
     from typing import TypeAlias
@@ -9,20 +11,74 @@ if sys.version_info >= (3, 8):
 else:
     from typing_extensions import Literal
 
+__all__ = [
+    "UrlLike",
+    "parse_id",
+]
+
 UrlLike: TypeAlias = str
 
+# 32 hex digits, dashed (8-4-4-4-12) or not, which is not a part of a longer run of hex digits
+_UUID = re.compile(
+    r"(?<![0-9a-fA-F])"
+    r"([0-9a-fA-F]{8})-?([0-9a-fA-F]{4})-?([0-9a-fA-F]{4})-?([0-9a-fA-F]{4})-?([0-9a-fA-F]{12})"
+    r"(?![0-9a-fA-F])"
+)
+# `p` of the query is a page opened as a peek view of a database, e.g. `?v=<view id>&p=<page id>`
+_PEEK = re.compile(r"[?&]p=([0-9a-fA-F-]{32,36})")
+_TYPES = ("page", "database", "block")
+
+
+def _canonical(match: "re.Match[str]") -> str:
+    return "-".join(match.groups()).lower()
+
 
+@lru_cache(maxsize=4096)
 def parse_id(
     id_: UrlLike,
-    type_: Literal["page", "database", "block"],
+    type_: Literal["page", "database", "block"] = "page",
 ) -> str:
-    id_ = id_.split("/")[-1]
-    if type_ in ("page"):
-        id_ = id_.split("-")[-1]  # remove string like title
-    elif type_ in ("database"):
-        id_ = id_.split("?")[0]  # remove body of url
-    elif type_ in ("block"):
-        id_ = id_.split("#")[-1]  # remove page link
-    else:
+    """
+    Return the canonical ID, lowercase UUID with dashes, of an ID or URL of Notion
+
+    Parameters
+    ----------
+    id_ : str or UrlLike
+        ID with or without dashes, or URL of a page, database or block, e.g.
+        `https://www.notion.so/workspace/Title-<page id>`,
+        `https://www.notion.so/<database id>?v=<view id>`,
+        `https://www.notion.so/<database id>?v=<view id>&p=<page id>` or
+        `https://www.notion.so/Title-<page id>#<block id>`
+    type_ : 'page', 'database' or 'block', default='page'
+        Type of the object which the ID belongs to
+
+    Returns
+    -------
+    str
+        ID like `01234567-89ab-cdef-0123-456789abcdef`
+
+    Raises
+    ------
+    ValueError
+        if type_ is unknown or no ID is found
+
+    .. note:: Results are memoized, so parsing the same ID repeatedly is a dictionary lookup
+    """
+    if type_ not in _TYPES:
         raise ValueError("type_ must be `page` or `database` or `block`")
-    return id_
+    path, _, fragment = id_.partition("#")
+    path, _, query = path.partition("?")
+    if type_ == "block" and fragment:  # link to a block in a page
+        match = _UUID.fullmatch(fragment)
+        if match is not None:
+            return _canonical(match)
+    if type_ == "page" and query:
+        peek = _PEEK.search("?" + query)
+        if peek is not None:
+            match = _UUID.fullmatch(peek.group(1))
+            if match is not None:
+                return _canonical(match)
+    matches = list(_UUID.finditer(path.rstrip("/").rsplit("/", 1)[-1]))
+    if not matches:
+        raise ValueError(f"no ID of {type_} is found in `{id_}`")
+    return _canonical(matches[-1])
@@ -0,0 +1,30 @@
+__all__ = [
+    "TEXT_CONTENT_LENGTH",
+    "RICH_TEXT_LENGTH",
+    "CHILDREN_LENGTH",
+    "PAYLOAD_BYTES",
+    "SPLITTABLE_BLOCK_TYPES",
+]
+
+# Size limits of request bodies of the Notion API
+TEXT_CONTENT_LENGTH: int = 2000  # characters of `text.content` in a rich text object
+RICH_TEXT_LENGTH: int = 100  # rich text objects in one rich text array
+CHILDREN_LENGTH: int = 100  # blocks in one children array
+PAYLOAD_BYTES: int = 500_000  # bytes of one request body
+
+# Blocks whose text can be split into sibling blocks of the same type
+SPLITTABLE_BLOCK_TYPES = frozenset(
+    (
+        "paragraph",
+        "heading_1",
+        "heading_2",
+        "heading_3",
+        "quote",
+        "bulleted_list_item",
+        "numbered_list_item",
+        "to_do",
+        "toggle",
+        "callout",
+        "code",
+    )
+)
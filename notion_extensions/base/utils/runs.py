@@ -0,0 +1,108 @@
+from typing import Any, Callable, List, Protocol, Sequence, Type
+
+from .limits import TEXT_CONTENT_LENGTH
+
+__all__ = [
+    "merge_runs",
+    "split_runs",
+]
+
+
+class _Run(Protocol):
+    """
+    Text of either model, `common.Text` or `compact.Text`
+    """
+
+    @property
+    def text(self) -> str:
+        ...
+
+    @property
+    def link(self) -> Any:
+        ...
+
+    @property
+    def annotations(self) -> Any:
+        ...
+
+
+def _copy(text_type: Callable[..., Any], content: str, like: Any) -> Any:
+    """
+    Return a text of content which has the styles and link of like
+    """
+    text = text_type(content, link=like.link)
+    text.annotations = like.annotations
+    return text
+
+
+def split_runs(texts: Sequence[Any], text_type: Type[_Run]) -> List[Any]:
+    """
+    Split texts longer than the content length limit of the API (2,000 characters)
+    into several texts which have the same styles and link
+
+    Parameters
+    ----------
+    texts : sequence of Text
+        Texts to split, items which are not instances of text_type are kept as they are
+    text_type : type
+        Class of the texts, `common.Text` or `compact.Text`
+
+    Returns
+    -------
+    list of Text
+        Texts within the limit, given texts are reused if they are short enough
+    """
+    out: List[Any] = []
+    for t in texts:
+        if not isinstance(t, text_type) or len(t.text) <= TEXT_CONTENT_LENGTH:
+            out.append(t)
+            continue
+        content = t.text
+        for start in range(0, len(content), TEXT_CONTENT_LENGTH):
+            out.append(_copy(text_type, content[start : start + TEXT_CONTENT_LENGTH], t))
+    return out
+
+
+def merge_runs(texts: Sequence[Any], text_type: Type[_Run]) -> List[Any]:
+    """
+    Merge adjacent texts which have the same styles and link.
+    Given texts are not modified and a merged text never exceeds the content length limit of the API
+
+    Parameters
+    ----------
+    texts : sequence of Text
+        Texts to merge, items which are not instances of text_type are kept as they are
+    text_type : type
+        Class of the texts, `common.Text` or `compact.Text`
+
+    Returns
+    -------
+    list of Text
+        Merged texts
+    """
+    merged: List[Any] = []
+    pieces: List[str] = []  # contents of the last text in merged
+    length = 0
+
+    def flush() -> None:
+        if len(pieces) > 1:
+            merged[-1] = _copy(text_type, "".join(pieces), merged[-1])
+
+    for t in texts:
+        is_text = isinstance(t, text_type)
+        if (
+            pieces
+            and is_text
+            and t.annotations is merged[-1].annotations
+            and t.link == merged[-1].link
+            and length + len(t.text) <= TEXT_CONTENT_LENGTH
+        ):
+            pieces.append(t.text)
+            length += len(t.text)
+            continue
+        flush()
+        merged.append(t)
+        pieces = [t.text] if is_text else []
+        length = len(t.text) if is_text else 0
+    flush()
+    return merged
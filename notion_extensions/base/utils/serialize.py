@@ -0,0 +1,188 @@
+import json
+from typing import Any, Dict, List
+
+from .frozen import FrozenDict
+from .limits import TEXT_CONTENT_LENGTH
+
+__all__ = [
+    "DEFAULTS",
+    "dumps",
+    "normalize",
+    "omit_defaults",
+]
+
+_MISSING = object()
+
+# Values which are equal to the API defaults, keyed by the key of the object holding them.
+# Only styles of rich text are listed: a rich text object is always sent whole, so omitting them
+# cannot change anything, while e.g. `checked: false` in an update body unchecks a to_do
+DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "annotations": {
+        "bold": False,
+        "italic": False,
+        "strikethrough": False,
+        "underline": False,
+        "code": False,
+        "color": "default",
+    },
+    "text": {"link": None},
+}
+_BLOCK_DEFAULTS: Dict[str, Any] = {"object": "block"}
+_EMPTY: Dict[str, Any] = {}
+
+
+def _merge_text_dicts(items: List[Any]) -> List[Any]:
+    """
+    Merge adjacent rich text objects of type `text` which have the same annotations and link
+    """
+    merged: List[Any] = []
+    pieces: List[str] = []  # contents of the last item in merged, if it is a text
+    length = 0
+
+    def flush() -> None:
+        if len(pieces) > 1:
+            last = merged[-1]
+            merged[-1] = {**last, "text": {**last["text"], "content": "".join(pieces)}}
+
+    for item in items:
+        text = item.get("text") if isinstance(item, dict) and item.get("type") == "text" else None
+        if not isinstance(text, dict):
+            flush()
+            merged.append(item)
+            pieces = []
+            continue
+        content = text.get("content", "")
+        if (
+            pieces
+            and item.get("annotations") == merged[-1].get("annotations")
+            and text.get("link") == merged[-1]["text"].get("link")
+            and length + len(content) <= TEXT_CONTENT_LENGTH
+        ):
+            pieces.append(content)
+            length += len(content)
+            continue
+        flush()
+        merged.append(item)
+        pieces = [content]
+        length = len(content)
+    flush()
+    return merged
+
+
+def _normalize_dict(
+    obj: Dict[str, Any], defaults: Dict[str, Any], omit: bool, merge: bool
+) -> Dict[str, Any]:
+    out = {}
+    for key, value in obj.items():
+        if defaults and defaults.get(key, _MISSING) == value:
+            continue
+        if isinstance(value, dict):
+            if isinstance(value, FrozenDict):  # nothing to merge inside, e.g. annotations
+                if omit:  # styles of interned annotations have their non-default styles precomputed
+                    minimized = getattr(value, "non_defaults", None)
+                    if minimized is None:
+                        minimized = _normalize_dict(value, DEFAULTS.get(key, _EMPTY), omit, merge)
+                    value = minimized
+            else:
+                value = _normalize_dict(
+                    value, DEFAULTS.get(key, _EMPTY) if omit else _EMPTY, omit, merge
+                )
+            if omit and not value and key == "annotations":  # all styles are default
+                continue
+        elif isinstance(value, list):
+            value = _normalize_list(value, omit, merge)
+        elif not isinstance(value, (str, bool, int, float)) and value is not None:
+            value = _normalize(value, omit, merge)
+        out[key] = value
+    return out
+
+
+def _normalize_list(items: List[Any], omit: bool, merge: bool) -> List[Any]:
+    out = [_normalize(item, omit, merge) for item in items]
+    if merge and len(out) > 1:
+        out = _merge_text_dicts(out)
+    return out
+
+
+def _normalize(obj: Any, omit: bool, merge: bool) -> Any:
+    if isinstance(obj, dict):
+        return _normalize_dict(obj, _BLOCK_DEFAULTS if omit else _EMPTY, omit, merge)
+    if isinstance(obj, list):
+        return _normalize_list(obj, omit, merge)
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is not None:  # compact props normalize themselves while materializing
+        return to_dict(omit_defaults=omit, merge_texts=merge)
+    return obj
+
+
+def normalize(body: Any, *, omit_defaults: bool = False, merge_texts: bool = False) -> Any:
+    """
+    Return a normalized copy of a request body in one pass
+
+    Parameters
+    ----------
+    body : Any
+        Request body
+    omit_defaults : bool, default=False
+        If True, fields which are equal to the API defaults,
+        e.g. all-false annotations, `color: default` and `link: null` of texts, are omitted
+    merge_texts : bool, default=False
+        If True, adjacent rich text objects with the same annotations and link are merged
+
+    Returns
+    -------
+    Any
+        Normalized copy of body
+    """
+    return _normalize(body, omit_defaults, merge_texts)
+
+
+def omit_defaults(body: Any) -> Any:
+    """
+    Return a copy of a request body without the fields which are equal to the API defaults,
+    e.g. all-false annotations, `color: default` and `link: null` of texts
+
+    Parameters
+    ----------
+    body : Any
+        Request body
+
+    Returns
+    -------
+    Any
+        Minimized copy of body
+    """
+    return _normalize(body, True, False)
+
+
+def _default(obj: Any) -> Any:
+    """
+    Materialize objects which are not dictionary, e.g. compact props, at serialization time
+    """
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return to_dict()
+
+
+def dumps(body: Any, *, omit_defaults: bool = False, merge_texts: bool = False) -> str:
+    """
+    Serialize a request body into JSON
+
+    Parameters
+    ----------
+    body : Any
+        Request body. Compact props (`props.compact`) are materialized here
+    omit_defaults : bool, default=False
+        If True, fields which are equal to the API defaults are not serialized
+    merge_texts : bool, default=False
+        If True, adjacent rich text objects with the same annotations and link are merged
+
+    Returns
+    -------
+    str
+        JSON string of the body
+    """
+    if omit_defaults or merge_texts:
+        body = _normalize(body, omit_defaults, merge_texts)
+    return json.dumps(body, default=_default)
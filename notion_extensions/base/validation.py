@@ -0,0 +1,361 @@
+import sys
+from typing import Any, Callable, Dict, List, NamedTuple, Sequence, Tuple
+
+if sys.version_info >= (3, 8):
+    from typing import get_args
+else:
+    from typing_extensions import get_args
+
+from .props.block.code import LANGUAGES
+from .props.database.number import AVAILABLE_FORMAT
+from .utils.limits import CHILDREN_LENGTH, RICH_TEXT_LENGTH, TEXT_CONTENT_LENGTH
+
+__all__ = [
+    "ValidationIssue",
+    "ValidationError",
+    "validate",
+    "assert_valid",
+    "partition",
+    "NESTING_DEPTH",
+    "URL_LENGTH",
+    "EQUATION_LENGTH",
+]
+
+NESTING_DEPTH: int = 2  # levels of children allowed in a single request
+URL_LENGTH: int = 2000  # characters of a url
+EQUATION_LENGTH: int = 1000  # characters of an equation expression
+
+_LANGUAGES = frozenset(get_args(LANGUAGES))
+_FORMATS = frozenset(AVAILABLE_FORMAT)
+
+
+class ValidationIssue(NamedTuple):
+    """
+    ValidationIssue
+    A violation of a structural limit of the API
+
+    Attributes
+    ----------
+    path : str
+        Location in the request body, e.g. `children[3].paragraph.text[0]`
+    message : str
+        Description of the violation
+    """
+
+    path: str
+    message: str
+
+
+class ValidationError(ValueError):
+    """
+    ValidationError
+    Raised by `assert_valid` when a request body would be rejected by the API
+
+    Attributes
+    ----------
+    issues : list of ValidationIssue
+        All the violations found in the body
+    """
+
+    def __init__(self, issues: List[ValidationIssue]):
+        self.issues = issues
+        lines = "\n".join(f"{issue.path}: {issue.message}" for issue in issues)
+        super().__init__(f"{len(issues)} invalid field(s) in request body\n{lines}")
+
+
+Issues = List[ValidationIssue]
+Rule = Callable[[Dict[str, Any], str, Issues], None]
+
+
+# Rules
+def _check_rich_text(texts: Any, path: str, issues: Issues) -> None:
+    if not isinstance(texts, list):
+        issues.append(ValidationIssue(path, "rich text must be a list"))
+        return
+    if len(texts) > RICH_TEXT_LENGTH:
+        issues.append(
+            ValidationIssue(path, f"{len(texts)} rich text objects, up to {RICH_TEXT_LENGTH} are allowed")
+        )
+    for i, text in enumerate(texts):
+        type_ = text.get("type") if isinstance(text, dict) else None
+        if type_ in ("text", "equation") and not isinstance(text.get(type_), dict):
+            issues.append(ValidationIssue(f"{path}[{i}].{type_}", f"`{type_}` object is required"))
+        elif type_ == "text":
+            content = text["text"].get("content", "")
+            if not isinstance(content, str):
+                issues.append(ValidationIssue(f"{path}[{i}].text.content", "content must be a string"))
+            elif len(content) > TEXT_CONTENT_LENGTH:
+                issues.append(
+                    ValidationIssue(
+                        f"{path}[{i}].text.content",
+                        f"{len(content)} characters, up to {TEXT_CONTENT_LENGTH} are allowed",
+                    )
+                )
+            link = text["text"].get("link")
+            url = link.get("url", "") if isinstance(link, dict) else link
+            if isinstance(url, str) and len(url) > URL_LENGTH:
+                issues.append(
+                    ValidationIssue(f"{path}[{i}].text.link", f"url is longer than {URL_LENGTH} characters")
+                )
+        elif type_ == "equation":
+            expression = text["equation"].get("expression", "")
+            if not isinstance(expression, str):
+                issues.append(ValidationIssue(f"{path}[{i}].equation.expression", "expression must be a string"))
+            elif len(expression) > EQUATION_LENGTH:
+                issues.append(
+                    ValidationIssue(
+                        f"{path}[{i}].equation.expression",
+                        f"{len(expression)} characters, up to {EQUATION_LENGTH} are allowed",
+                    )
+                )
+        elif type_ != "mention":
+            issues.append(ValidationIssue(f"{path}[{i}]", f"unknown rich text type `{type_}`"))
+
+
+def _rich_text(key: str, required: bool = True) -> Rule:
+    def rule(body: Dict[str, Any], path: str, issues: Issues) -> None:
+        if key in body:
+            _check_rich_text(body[key], f"{path}.{key}", issues)
+        elif required:
+            issues.append(ValidationIssue(path, f"`{key}` is required"))
+
+    return rule
+
+
+def _url(key: str = "url") -> Rule:
+    def rule(body: Dict[str, Any], path: str, issues: Issues) -> None:
+        url = body.get(key)
+        if not isinstance(url, str) or not url:
+            issues.append(ValidationIssue(f"{path}.{key}", "url is required"))
+        elif len(url) > URL_LENGTH:
+            issues.append(ValidationIssue(f"{path}.{key}", f"url is longer than {URL_LENGTH} characters"))
+
+    return rule
+
+
+def _file(body: Dict[str, Any], path: str, issues: Issues) -> None:
+    type_ = body.get("type", "external")
+    if type_ not in ("external", "file") or not isinstance(body.get(type_), dict):
+        issues.append(ValidationIssue(path, "`external` or `file` object is required"))
+        return
+    _url()(body[type_], f"{path}.{type_}", issues)
+
+
+def _language(body: Dict[str, Any], path: str, issues: Issues) -> None:
+    language = body.get("language")
+    if language not in _LANGUAGES:
+        issues.append(ValidationIssue(f"{path}.language", f"unknown language `{language}`"))
+
+
+def _checked(body: Dict[str, Any], path: str, issues: Issues) -> None:
+    if not isinstance(body.get("checked", False), bool):
+        issues.append(ValidationIssue(f"{path}.checked", "checked must be bool"))
+
+
+def _expression(body: Dict[str, Any], path: str, issues: Issues) -> None:
+    expression = body.get("expression")
+    if not isinstance(expression, str):
+        issues.append(ValidationIssue(f"{path}.expression", "expression is required"))
+    elif len(expression) > EQUATION_LENGTH:
+        issues.append(
+            ValidationIssue(
+                f"{path}.expression",
+                f"{len(expression)} characters, up to {EQUATION_LENGTH} are allowed",
+            )
+        )
+
+
+def _min_children(n: int) -> Rule:
+    def rule(body: Dict[str, Any], path: str, issues: Issues) -> None:
+        children = body.get("children")
+        if not isinstance(children, list) or len(children) < n:
+            issues.append(ValidationIssue(f"{path}.children", f"at least {n} children are required"))
+
+    return rule
+
+
+def _table(body: Dict[str, Any], path: str, issues: Issues) -> None:
+    width = body.get("table_width")
+    if not isinstance(width, int) or isinstance(width, bool) or width < 1:
+        issues.append(ValidationIssue(f"{path}.table_width", "table_width must be a positive integer"))
+        return
+    rows = body.get("children")
+    if not isinstance(rows, list) or not rows:
+        issues.append(ValidationIssue(f"{path}.children", "at least 1 table_row is required"))
+        return
+    for i, row in enumerate(rows):
+        if not isinstance(row, dict) or row.get("type") != "table_row":
+            issues.append(ValidationIssue(f"{path}.children[{i}]", "children of table must be table_row"))
+            continue
+        cells = row["table_row"].get("cells", [])
+        if len(cells) != width:
+            issues.append(
+                ValidationIssue(
+                    f"{path}.children[{i}].table_row.cells",
+                    f"{len(cells)} cells but table_width is {width}",
+                )
+            )
+
+
+def _cells(body: Dict[str, Any], path: str, issues: Issues) -> None:
+    for i, cell in enumerate(body.get("cells", [])):
+        _check_rich_text(cell, f"{path}.cells[{i}]", issues)
+
+
+_TEXT = _rich_text("text")
+_CAPTION = _rich_text("caption", required=False)
+
+# Rules applied to the body of each block type, e.g. block["paragraph"]
+RULES: Dict[str, Tuple[Rule, ...]] = {
+    "paragraph": (_TEXT,),
+    "heading_1": (_TEXT,),
+    "heading_2": (_TEXT,),
+    "heading_3": (_TEXT,),
+    "quote": (_TEXT,),
+    "bulleted_list_item": (_TEXT,),
+    "numbered_list_item": (_TEXT,),
+    "toggle": (_TEXT,),
+    "callout": (_TEXT,),
+    "to_do": (_TEXT, _checked),
+    "code": (_TEXT, _language),
+    "equation": (_expression,),
+    "divider": (),
+    "table_of_contents": (),
+    "breadcrumb": (),
+    "bookmark": (_url(), _CAPTION),
+    "embed": (_url(),),
+    "image": (_file, _CAPTION),
+    "video": (_file, _CAPTION),
+    "file": (_file, _CAPTION),
+    "pdf": (_file, _CAPTION),
+    "link_to_page": (),
+    "synced_block": (),
+    "column_list": (_min_children(2),),
+    "column": (_min_children(1),),
+    "table": (_table,),
+    "table_row": (_cells,),
+}
+
+
+# Traversal
+def _validate_blocks(blocks: Any, path: str, depth: int, issues: Issues) -> None:
+    if not isinstance(blocks, list):
+        issues.append(ValidationIssue(path, "children must be a list"))
+        return
+    if depth > NESTING_DEPTH:
+        issues.append(
+            ValidationIssue(path, f"children are nested deeper than {NESTING_DEPTH} levels in one request")
+        )
+        return
+    if len(blocks) > CHILDREN_LENGTH:
+        issues.append(ValidationIssue(path, f"{len(blocks)} blocks, up to {CHILDREN_LENGTH} are allowed"))
+    for i, block in enumerate(blocks):
+        _validate_block(block, f"{path}[{i}]", depth, issues)
+
+
+def _validate_block(block: Any, path: str, depth: int, issues: Issues) -> None:
+    to_dict = getattr(block, "to_dict", None)
+    if to_dict is not None:  # compact props
+        block = to_dict()
+    type_ = block.get("type") if isinstance(block, dict) else None
+    rules = RULES.get(type_)  # type: ignore
+    if rules is None:
+        issues.append(ValidationIssue(path, f"unknown block type `{type_}`"))
+        return
+    body = block.get(type_)
+    if not isinstance(body, dict):
+        issues.append(ValidationIssue(f"{path}.{type_}", "block body is required"))
+        return
+    path = f"{path}.{type_}"
+    for rule in rules:
+        rule(body, path, issues)
+    if "children" in body:
+        _validate_blocks(body["children"], f"{path}.children", depth + 1, issues)
+
+
+def _validate_properties(properties: Dict[str, Any], issues: Issues) -> None:
+    for name, value in properties.items():
+        if not isinstance(value, dict):
+            continue
+        path = f"properties.{name}"
+        if isinstance(value.get("title"), list):  # title of a page
+            _check_rich_text(value["title"], f"{path}.title", issues)
+        if isinstance(value.get("rich_text"), list):
+            _check_rich_text(value["rich_text"], f"{path}.rich_text", issues)
+        number = value.get("number")
+        if isinstance(number, dict) and "format" in number and number["format"] not in _FORMATS:
+            issues.append(ValidationIssue(f"{path}.number.format", f"unknown format `{number['format']}`"))
+
+
+def validate(body: Any) -> List[ValidationIssue]:
+    """
+    Check a request body against the structural limits of the API in one pass
+
+    Parameters
+    ----------
+    body : Children, compact.Children, list of Block or Dict
+        Children, a list of blocks, or a body of a page or database request
+        which has `children` and/or `properties`
+
+    Returns
+    -------
+    list of ValidationIssue
+        All the violations found, empty if the body is valid
+    """
+    issues: Issues = []
+    to_dict = getattr(body, "to_dict", None)
+    if to_dict is not None:  # compact props
+        body = to_dict()
+    if isinstance(body, list):
+        _validate_blocks(body, "children", 1, issues)
+        return issues
+    if "children" in body:
+        _validate_blocks(body["children"], "children", 1, issues)
+    if isinstance(body.get("properties"), dict):
+        _validate_properties(body["properties"], issues)
+    return issues
+
+
+def assert_valid(body: Any) -> None:
+    """
+    Raise ValidationError if a request body would be rejected by the API
+
+    Parameters
+    ----------
+    body : Children, compact.Children, list of Block or Dict
+        Request body, see `validate`
+
+    Raises
+    ------
+    ValidationError
+        if any violation is found
+    """
+    issues = validate(body)
+    if issues:
+        raise ValidationError(issues)
+
+
+def partition(blocks: Sequence[Any]) -> Tuple[List[Any], List[Tuple[Any, List[ValidationIssue]]]]:
+    """
+    Split blocks into valid ones and invalid ones, so the valid blocks can be sent in one request
+
+    Parameters
+    ----------
+    blocks : sequence of Block
+        Top level blocks, e.g. `children["children"]`
+
+    Returns
+    -------
+    Tuple[List[Block], List[Tuple[Block, List[ValidationIssue]]]]
+        valid blocks, and invalid blocks with their issues
+    """
+    valid: List[Any] = []
+    invalid: List[Tuple[Any, List[ValidationIssue]]] = []
+    for block in blocks:
+        issues: Issues = []
+        _validate_block(block, "block", 1, issues)
+        if issues:
+            invalid.append((block, issues))
+        else:
+            valid.append(block)
+    return valid, invalid
@@ -0,0 +1,271 @@
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from .props.block.children import split_blocks
+from .utils import dumps, parse_id
+from .utils.limits import CHILDREN_LENGTH, PAYLOAD_BYTES
+from .validation import assert_valid
+
+__all__ = [
+    "BlockWriter",
+]
+
+_PREFIX = '{"children": ['
+_SUFFIX = "]}"
+_OVERHEAD = len(_PREFIX) + len(_SUFFIX)
+
+
+class BlockWriter:
+    """
+    BlockWriter
+    Buffer blocks appended to a parent block, and append them with as few requests as possible
+
+    Blocks are serialized once when they are written, and flushed to `append_block_children`
+    when 100 blocks are buffered, the body reaches `max_bytes`, or the oldest buffered block
+    has waited for `max_delay` seconds. Blocks are appended in the order they are written.
+    The writer is thread-safe, so many producers can share one writer per parent block.
+    A batch which fails with 429 or 5xx stays in the buffer for the next flush,
+    a batch rejected with another status is dropped and reported by the error
+
+    Attributes
+    ----------
+    client : NotionClient
+        Client used for requests
+    block_id : str
+        ID of the parent block
+    max_blocks : int
+        Number of blocks which triggers a flush
+    max_bytes : int
+        Size of a request body which triggers a flush
+    max_delay : float, optional
+        Seconds the oldest buffered block waits before a flush, never flushed by time if None
+    pending : int
+        Number of buffered blocks
+
+    Methods
+    -------
+    write(*block: Block)
+        Buffer blocks
+    flush()
+        Append all buffered blocks
+    close()
+        Flush and stop the writer
+
+    Examples
+    --------
+    >>> with BlockWriter(client, page_id, max_delay=2.0) as writer:
+    ...     for line in log:
+    ...         writer.write(Paragraph(Text(line)))
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        block_id: str,
+        *,
+        max_blocks: int = CHILDREN_LENGTH,
+        max_bytes: int = PAYLOAD_BYTES,
+        max_delay: Optional[float] = 1.0,
+    ):
+        """
+        Parameters
+        ----------
+        client : NotionClient
+            Client used for requests
+        block_id : str
+            ID or URL of the parent block
+        max_blocks : int, default=100
+            Number of blocks which triggers a flush, up to 100
+        max_bytes : int, default=500000
+            Size of a request body which triggers a flush
+        max_delay : float, optional, default=1.0
+            Seconds the oldest buffered block waits before a flush, never flushed by time if None
+
+        Raises
+        ------
+        ValueError
+            if a limit is out of range
+        """
+        if not 0 < max_blocks <= CHILDREN_LENGTH:
+            raise ValueError(f"max_blocks must be in 1 to {CHILDREN_LENGTH}, but {max_blocks} is given")
+        if max_bytes <= _OVERHEAD:
+            raise ValueError(f"max_bytes must be more than {_OVERHEAD}, but {max_bytes} is given")
+        if max_delay is not None and max_delay <= 0:
+            raise ValueError(f"max_delay must be more than 0, but {max_delay} is given")
+        self.client = client
+        self.block_id: str = parse_id(block_id, "block")
+        self.max_blocks = max_blocks
+        self.max_bytes = max_bytes
+        self.max_delay = max_delay
+        self.__buffer: List[str] = []  # serialized blocks
+        self.__bytes = _OVERHEAD  # size of the body of the buffered blocks
+        self.__lock = threading.Lock()  # guards the buffer
+        self.__send_lock = threading.Lock()  # keeps the order of requests
+        self.__timer: Optional[threading.Timer] = None
+        self.__error: Optional[BaseException] = None  # failure of a flush by time
+        self.__closed = False
+
+    def __enter__(self) -> "BlockWriter":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @property
+    def pending(self) -> int:
+        return len(self.__buffer)
+
+    def write(self, *block: Any) -> None:
+        """
+        write(*block: Block)
+            Buffer blocks, and flush them if a limit is reached
+
+        Parameters
+        ----------
+        *block : Block or compact.Block
+            Blocks to append
+
+        Raises
+        ------
+        ValueError
+            if the writer is closed or a block is larger than `max_bytes`
+        ValidationError
+            if `validate` of the client is True and a block would be rejected by the API
+        """
+        self._raise_error()
+        if self.__closed:
+            raise ValueError("writer is closed")
+        pieces: List[str] = []
+        for b in split_blocks(block):
+            for piece in b.split() if hasattr(b, "split") else (b,):  # compact blocks
+                if self.client.validate:
+                    assert_valid([piece])
+                data = dumps(piece, omit_defaults=self.client.omit_defaults, merge_texts=self.client.merge_texts)
+                if _OVERHEAD + len(data.encode()) > self.max_bytes:
+                    raise ValueError(f"a block of {len(data.encode())} bytes is larger than max_bytes")
+                pieces.append(data)
+        full = False
+        with self.__lock:
+            for data in pieces:
+                self.__buffer.append(data)
+                self.__bytes += len(data.encode()) + 2  # separator
+            full = len(self.__buffer) >= self.max_blocks or self.__bytes >= self.max_bytes
+            if not full and self.__buffer and self.__timer is None and self.max_delay is not None:
+                self.__timer = threading.Timer(self.max_delay, self._flush_by_time)
+                self.__timer.daemon = True
+                self.__timer.start()
+        if full:
+            self._flush(only_full=True)
+
+    def flush(self) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        flush()
+            Append all buffered blocks
+
+        Returns
+        -------
+        list of Tuple[int, Dict[str, Any]]
+            status_code and response of each request
+
+        Raises
+        ------
+        ValueError
+            if a request fails. Blocks of a request which failed with 429 or 5xx (or without a response)
+            are kept in the buffer, blocks of a request rejected with another status are dropped
+        """
+        self._raise_error()
+        return self._flush(only_full=False)
+
+    def close(self) -> None:
+        """
+        close()
+            Flush all buffered blocks and stop the writer. The writer is closed even if the flush fails
+
+        Raises
+        ------
+        ValueError
+            if a request fails, see `flush`
+        """
+        if self.__closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self.__closed = True
+            with self.__lock:
+                if self.__timer is not None:
+                    self.__timer.cancel()
+                    self.__timer = None
+
+    def _take(self) -> List[str]:
+        """
+        Take blocks from the head of the buffer as many as a request can hold
+        """
+        size = _OVERHEAD
+        count = 0
+        for data in self.__buffer[: self.max_blocks]:
+            size += len(data.encode()) + 2
+            if count > 0 and size > self.max_bytes:
+                break
+            count += 1
+        batch = self.__buffer[:count]
+        del self.__buffer[:count]
+        self.__bytes -= sum(len(data.encode()) + 2 for data in batch)
+        return batch
+
+    def _flush(self, only_full: bool) -> List[Tuple[int, Dict[str, Any]]]:
+        responses: List[Tuple[int, Dict[str, Any]]] = []
+        with self.__send_lock:
+            while True:
+                with self.__lock:
+                    if only_full and len(self.__buffer) < self.max_blocks and self.__bytes < self.max_bytes:
+                        break
+                    batch = self._take()
+                    if not self.__buffer and self.__timer is not None:
+                        self.__timer.cancel()
+                        self.__timer = None
+                if not batch:
+                    break
+                try:
+                    # the body is joined from blocks serialized by `write`,
+                    # so it is sent by `_request` rather than serialized again by `append_block_children`
+                    res = self.client._request(
+                        "PATCH",
+                        f"{self.client.base_url}/blocks/{self.block_id}/children",
+                        data=_PREFIX + ", ".join(batch) + _SUFFIX,
+                    )
+                except BaseException:
+                    self._restore(batch)
+                    raise
+                if res.status_code == 200:
+                    responses.append((res.status_code, res.json()))
+                    continue
+                message = res.json().get("message")
+                if res.status_code == 429 or res.status_code >= 500:  # may succeed later
+                    self._restore(batch)
+                    raise ValueError(f"failed to append block children ({res.status_code}): {message}")
+                raise ValueError(
+                    f"failed to append block children ({res.status_code}): {message}, {len(batch)} blocks are dropped"
+                )
+        return responses
+
+    def _restore(self, batch: List[str]) -> None:
+        """
+        Put blocks back at the head of the buffer, keeping their order for the next flush
+        """
+        with self.__lock:
+            self.__buffer[:0] = batch
+            self.__bytes += sum(len(data.encode()) + 2 for data in batch)
+
+    def _flush_by_time(self) -> None:
+        with self.__lock:
+            self.__timer = None
+        try:
+            self._flush(only_full=False)
+        except BaseException as e:  # raised by the next call in the producer
+            self.__error = e
+
+    def _raise_error(self) -> None:
+        error, self.__error = self.__error, None
+        if error is not None:
+            raise error
@@ -0,0 +1,426 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from notion_extensions.base.client import NotionClient
+from notion_extensions.base.concurrency import AdaptiveLimit
+from notion_extensions.base import ratelimit
+from notion_extensions.base.pool import ClientPool
+from notion_extensions.base.props import compact
+from notion_extensions.base.props.page import Title
+from notion_extensions.base.scheduler import PriorityScheduler
+from notion_extensions.base.users import UserDirectory
+from notion_extensions.base.utils import parse_id
+
+
+def _id(i):
+    return f"{i:032x}"
+
+
+class Response:
+    def __init__(self, status_code, body):
+        self.status_code = status_code
+        self.body = body
+        self.headers = {}
+
+    def json(self):
+        return self.body
+
+
+def test_delete_blocks_of_parent(monkeypatch):
+    calls = []
+    lock = threading.Lock()
+
+    def request(session, method, url, **kwargs):
+        with lock:
+            calls.append((method, url))
+        if method == "GET":
+            return Response(200, {"results": [{"id": _id(i)} for i in range(5)], "has_more": False})
+        if url.endswith(parse_id(_id(3))):
+            return Response(404, {"message": "not found"})
+        return Response(200, {"id": url.rsplit("/", 1)[-1], "archived": True})
+
+    monkeypatch.setattr(requests.Session, "request", request)
+    client = NotionClient(key="secret")
+    results = client.delete_blocks(parent_id=_id(100))
+    assert [r.id for r in results] == [_id(i) for i in range(5)]
+    assert [r.ok for r in results] == [True, True, True, False, True]
+    assert sum(method == "DELETE" for method, _ in calls) == 5
+
+    results = client.archive_pages(page_ids=[_id(1), _id(2)], workers=2)
+    assert all(r.ok and r.response["archived"] for r in results)
+
+
+def test_parse_id():
+    id_ = "0123456789abcdef0123456789ABCDEF"
+    canonical = "01234567-89ab-cdef-0123-456789abcdef"
+    view = "fedcba9876543210fedcba9876543210"
+    assert parse_id(id_, "page") == canonical
+    assert parse_id(canonical, "block") == canonical
+    assert parse_id(f"https://www.notion.so/ws/Title-{id_}", "page") == canonical
+    assert parse_id(f"https://www.notion.so/{id_}?v={view}", "database") == canonical
+    assert parse_id(f"https://www.notion.so/{view}?v={view}&p={id_}&pm=s", "page") == canonical
+    assert parse_id(f"https://www.notion.so/Title-{view}#{id_}", "block") == canonical
+    for invalid in ("", "https://www.notion.so/Title", "0123"):
+        try:
+            parse_id(invalid, "page")
+        except ValueError:
+            continue
+        raise AssertionError(f"{invalid} is parsed")
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """
+    Stand-in of the API which answers every request after a fixed latency,
+    and counts the requests it is answering at the same time
+    """
+
+    latency = 0.02
+    gate = None  # threading.Barrier which holds requests until enough of them are in flight
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            cls.peak = max(cls.peak, cls.in_flight)
+        try:
+            if cls.gate is not None:
+                try:
+                    cls.gate.wait()
+                except threading.BrokenBarrierError:  # fewer requests came, the peak tells
+                    pass
+            time.sleep(self.latency)
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+        body = json.dumps({"object": "block", "id": self.path.rsplit("/", 1)[-1]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _throughput(client, threads, requests_per_thread):
+    def work(t):
+        for i in range(requests_per_thread):
+            status_code, res = client.get_block(block_id=_id(t * 1000 + i))
+            assert status_code == 200 and res["id"] == parse_id(_id(t * 1000 + i))
+
+    workers = [threading.Thread(target=work, args=(t,)) for t in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return threads * requests_per_thread / (time.perf_counter() - start)
+
+
+def test_shared_client_scales_with_threads(monkeypatch):
+    threads = 8
+    monkeypatch.setattr(StandInHandler, "gate", threading.Barrier(threads, timeout=5))
+    monkeypatch.setattr(StandInHandler, "peak", 0)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    try:
+        with NotionClient(key="secret", base_url=base_url) as client:
+            _throughput(client, threads, 3)
+            assert StandInHandler.peak == threads  # every thread has a request in flight at once
+        monkeypatch.setattr(StandInHandler, "gate", None)
+        with NotionClient(key="secret", base_url=base_url, rate_limit=100) as client:
+            client.limiter.acquire(client.limiter.burst)  # drain the burst of the token bucket
+            assert _throughput(client, threads, 10) < 100 * 1.3  # bound by the rate limit
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_concurrent_identical_reads_share_a_request(monkeypatch):
+    sent = []
+    release = threading.Event()
+
+    def request(session, method, url, **kwargs):
+        sent.append(url)
+        release.wait(1)
+        return Response(200, {"id": url.rsplit("/", 1)[-1]})
+
+    monkeypatch.setattr(requests.Session, "request", request)
+    client = NotionClient(key="secret")
+    results = []
+    workers = [
+        threading.Thread(target=lambda: results.append(client.get_block(block_id=_id(1))))
+        for _ in range(5)
+    ]
+    for worker in workers:
+        worker.start()
+    while client.single_flight.stats["shared"] < 4:
+        time.sleep(0.001)
+    release.set()
+    for worker in workers:
+        worker.join()
+    assert len(sent) == 1
+    assert [status_code for status_code, _ in results] == [200] * 5
+    assert client.single_flight.executed == 1 and client.single_flight.shared == 4
+
+
+def test_user_directory_resolves_from_memory(monkeypatch):
+    sent = []
+    users = [{"object": "user", "id": _id(i), "name": f"user {i}"} for i in range(150)]
+
+    def request(session, method, url, **kwargs):
+        sent.append(url)
+        start = int(kwargs["params"].get("start_cursor", 0))
+        end = start + kwargs["params"]["page_size"]
+        return Response(200, {"results": users[start:end], "has_more": end < len(users), "next_cursor": str(end)})
+
+    monkeypatch.setattr(requests.Session, "request", request)
+    directory = UserDirectory(NotionClient(key="secret"), min_refresh_interval=0)
+    found = directory.resolve([_id(1), _id(120), _id(149)])
+    assert [found[_id(i)]["name"] for i in (1, 120, 149)] == ["user 1", "user 120", "user 149"]
+    assert directory.name({"object": "user", "id": _id(7)}) == "user 7"
+    assert len(sent) == 2  # loaded once, in pages of 100
+
+    users.append({"object": "user", "id": _id(150), "name": "new user"})
+    assert directory.name(_id(150)) == "new user"  # a miss reloads the list
+    assert len(sent) == 4
+
+    directory.min_refresh_interval = 60
+    assert directory.get(_id(999)) is None
+    assert len(sent) == 4  # reloaded recently
+
+
+def test_page_property_items_are_paginated(monkeypatch):
+    relations = [{"object": "property_item", "type": "relation", "relation": {"id": _id(i)}} for i in range(230)]
+
+    def request(session, method, url, **kwargs):
+        if url.endswith("/properties/title"):
+            return Response(200, {"object": "property_item", "type": "number", "number": 1})
+        start = int(kwargs["params"].get("start_cursor", 0))
+        end = start + kwargs["params"]["page_size"]
+        return Response(
+            200,
+            {
+                "object": "list",
+                "results": relations[start:end],
+                "has_more": end < len(relations),
+                "next_cursor": str(end) if end < len(relations) else None,
+                "property_item": {"id": "rel", "type": "relation"},
+            },
+        )
+
+    monkeypatch.setattr(requests.Session, "request", request)
+    client = NotionClient(key="secret")
+    items = list(client.iter_page_property(page_id=_id(1), property_id="rel"))
+    assert [item["relation"]["id"] for item in items] == [_id(i) for i in range(230)]
+    assert [item["number"] for item in client.iter_page_property(page_id=_id(1), property_id="title")] == [1]
+
+    results = client.get_page_properties(page_ids=[_id(1), _id(2)], property_id="rel", workers=2)
+    assert [len(r.response["results"]) for r in results] == [230, 230]
+    assert all(r.ok and r.response["property_item"]["type"] == "relation" for r in results)
+
+
+def test_slow_reads_are_hedged(monkeypatch):
+    attempts = {}
+    lock = threading.Lock()
+    release = threading.Event()  # answers the first attempt of the slow read
+
+    def request(session, method, url, **kwargs):
+        with lock:
+            attempts[url] = attempts.get(url, 0) + 1
+            first = attempts[url] == 1
+        if first and url.endswith(parse_id(_id(999))):
+            release.wait(5)
+        return Response(200, {"id": url.rsplit("/", 1)[-1], "first": first})
+
+    monkeypatch.setattr(requests.Session, "request", request)
+    client = NotionClient(key="secret", hedge_percentile=0.9, hedge_budget=0.1, hedge_min_delay=0.2)
+    for i in range(30):  # latencies to learn the delay from, and budget for 3 hedges
+        client.get_block(block_id=_id(i))
+    assert client.hedger.stats["hedged"] == 0 and client.hedger.delay == 0.2
+
+    try:
+        status_code, res = client.get_block(block_id=_id(999))
+    finally:
+        release.set()
+    assert status_code == 200 and not res["first"]  # answered by the hedge
+    stats = client.metrics["hedger"]
+    assert stats["hedged"] == 1 and stats["hedge_wins"] == 1
+    client.close()
+
+
+def test_adaptive_concurrency_converges_on_capacity():
+    capacity = 6  # requests in flight beyond it are throttled
+    limit = AdaptiveLimit(4.0)
+    sizes = []
+    for _ in range(100):  # rounds of as many requests as the limit allows
+        size = int(limit.limit)
+        tokens = [limit.acquire() for _ in range(size)]
+        for i, token in enumerate(tokens):
+            limit.release(token, latency=0.01, throttled=i >= capacity)
+        sizes.append(size)
+    assert max(sizes) == capacity + 1  # probed one past the capacity
+    assert all(capacity // 2 <= size <= capacity + 1 for size in sizes[20:])
+    stats = limit.stats
+    assert stats["decreases"] == stats["throttled"] > 0  # once per throttled round
+    assert stats["in_flight"] == 0
+
+
+def test_throttled_requests_decrease_the_concurrency(monkeypatch):
+    attempts = {}
+    lock = threading.Lock()
+
+    def request(session, method, url, **kwargs):
+        with lock:
+            attempts[url] = attempts.get(url, 0) + 1
+            first = attempts[url] == 1
+        if first:
+            res = Response(429, {"message": "rate limited"})
+            res.headers = {"Retry-After": "0"}
+            return res
+        return Response(200, {"id": url.rsplit("/", 1)[-1], "archived": True})
+
+    monkeypatch.setattr(requests.Session, "request", request)
+    client = NotionClient(key="secret", adaptive_concurrency=True, max_retries=1)
+    assert client.concurrency.limit == 4
+
+    results = client.archive_pages(page_ids=[_id(i) for i in range(20)])
+    assert all(r.ok for r in results)
+    stats = client.metrics["concurrency"]
+    assert stats["requests"] == 40 and stats["throttled"] == 20
+    assert stats["decreases"] >= 1 and stats["in_flight"] == 0
+
+
+class FrozenTime:
+    """
+    Clock of token buckets which does not move, so buckets are not refilled during a test
+    """
+
+    @staticmethod
+    def monotonic():
+        return 0.0
+
+    @staticmethod
+    def sleep(seconds):
+        raise AssertionError(f"a bucket is empty, {seconds} seconds to wait")
+
+
+def test_client_pool_spreads_requests_over_keys(monkeypatch):
+    keys = []
+    lock = threading.Lock()
+
+    def request(session, method, url, **kwargs):
+        with lock:
+            keys.append(session.headers["Authorization"])
+        return Response(200, {"id": url.rsplit("/", 1)[-1], "archived": True})
+
+    monkeypatch.setattr(requests.Session, "request", request)
+    monkeypatch.setattr(ratelimit, "time", FrozenTime)
+    with ClientPool(keys=["a", "b", "c"], rate_limit=20) as pool:  # 20 tokens in each bucket
+        results = pool.archive_pages(page_ids=[_id(i) for i in range(60)], workers=1)
+        assert all(r.ok for r in results)
+        assert [keys.count(f"Bearer {key}") for key in "abc"] == [20, 20, 20]  # 60 requests, 3 buckets of 20
+        assert [client.limiter.tokens for client in pool.clients] == [0, 0, 0]
+        granted = [sum(lane["granted"] for lane in client.scheduler.stats.values()) for client in pool.clients]
+        assert granted == [20, 20, 20]
+
+        page_id = _id(5)
+        assert pool.client(page_id) is pool.client(f"https://www.notion.so/Title-{page_id}")
+
+
+class HeldLimiter:
+    """
+    Token bucket which is refilled only by the test, and records the lane of each grant
+    """
+
+    rate = 1000.0  # waiting callers check the tokens every millisecond
+    burst = 1
+
+    def __init__(self):
+        self.tokens = 0
+        self.grants = []
+
+    def reserve(self, tokens=1):
+        self.tokens -= tokens
+        self.grants.append(threading.current_thread().name)
+        return 0.0
+
+
+def test_interactive_requests_jump_the_bulk_queue():
+    limiter = HeldLimiter()
+    scheduler = PriorityScheduler(limiter)
+    workers = [threading.Thread(target=scheduler.acquire, args=("bulk",), name="bulk") for _ in range(10)]
+    for worker in workers:
+        worker.start()
+    while scheduler.stats["bulk"]["waiting"] < 10:
+        time.sleep(0.001)
+    interactive = [
+        threading.Thread(target=scheduler.acquire, args=("interactive",), name="interactive") for _ in range(5)
+    ]
+    workers += interactive
+    for worker in interactive:
+        worker.start()
+    while scheduler.stats["interactive"]["waiting"] < 5:
+        time.sleep(0.001)
+
+    limiter.tokens = 15
+    for worker in workers:
+        worker.join()
+    assert limiter.grants == ["interactive"] * 5 + ["bulk"] * 10  # queued last, granted first
+    stats = scheduler.stats
+    assert stats["bulk"]["granted"] == 10 and stats["interactive"]["granted"] == 5
+
+
+def test_bulk_operations_run_in_the_bulk_lane(monkeypatch):
+    def request(session, method, url, **kwargs):
+        return Response(200, {"id": url.rsplit("/", 1)[-1], "archived": True})
+
+    monkeypatch.setattr(requests.Session, "request", request)
+    client = NotionClient(key="secret", rate_limit=1000)
+    client.archive_pages(page_ids=[_id(i) for i in range(6)], workers=3)
+    with client.priority("interactive"):
+        client.get_block(block_id=_id(100))
+    client.get_block(block_id=_id(101))
+    stats = client.metrics["scheduler"]
+    assert [stats[name]["granted"] for name in ("interactive", "normal", "bulk")] == [1, 1, 6]
+
+
+def test_update_block_keeps_default_values(monkeypatch):
+    bodies = []
+
+    def request(session, method, url, **kwargs):
+        bodies.append(json.loads(kwargs["data"]))
+        return Response(200, {})
+
+    monkeypatch.setattr(requests.Session, "request", request)
+    client = NotionClient(key="secret", omit_defaults=True)
+    client.update_block(block_id=_id(1), type_={"to_do": {"checked": False}})
+    client.update_block(block_id=_id(2), type_={"table": {"has_column_header": False}})
+    assert bodies[0]["to_do"] == {"checked": False}  # unchecks the to_do
+    assert bodies[1]["table"] == {"has_column_header": False}
+
+
+def test_create_page_splits_compact_blocks(monkeypatch):
+    bodies = []
+
+    def request(session, method, url, **kwargs):
+        bodies.append(json.loads(kwargs["data"]))
+        return Response(200, {})
+
+    monkeypatch.setattr(requests.Session, "request", request)
+    client = NotionClient(key="secret", validate=True)
+    paragraph = compact.Paragraph(*[compact.Text(str(i)) for i in range(150)])  # over the limit of 100 texts
+    client.create_page(
+        parent_id=_id(1), parent_type="page", properties=Title("title"), children=compact.Children(paragraph)
+    )
+    children = bodies[0]["children"]
+    assert [len(child["paragraph"]["text"]) for child in children] == [100, 50]
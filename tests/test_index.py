@@ -0,0 +1,47 @@
+from notion_extensions.base.index import TitleIndex
+
+
+def _page(id_, title, edited, archived=False):
+    return {
+        "object": "page",
+        "id": id_,
+        "last_edited_time": edited,
+        "archived": archived,
+        "properties": {"Name": {"type": "title", "title": [{"plain_text": title}]}},
+    }
+
+
+class FakeClient:
+    def __init__(self, results):
+        self.results = {obj["id"]: obj for obj in results}
+        self.read = 0
+
+    def iter_search(self, *, filter=None, sort=None):
+        for obj in sorted(self.results.values(), key=lambda o: o["last_edited_time"], reverse=True):
+            self.read += 1
+            yield obj
+
+
+def test_title_index_refreshes_incrementally():
+    client = FakeClient(
+        [
+            _page("a", "Weekly  Report", "2022-01-01T00:00:00.000Z"),
+            _page("b", "Notes", "2022-01-02T00:00:00.000Z"),
+            {"object": "database", "id": "c", "last_edited_time": "2022-01-03T00:00:00.000Z",
+             "title": [{"plain_text": "Tasks"}]},
+        ]
+    )
+    index = TitleIndex(client)
+    assert index.get("weekly report") == "a"
+    assert index.get("tasks") == "c"
+    assert client.read == 3
+
+    client.results["b"] = _page("b", "Renamed", "2022-01-05T00:00:00.000Z")
+    client.results["d"] = _page("d", "Old", "2021-12-31T00:00:00.000Z")
+    assert index.get("renamed") == "b"
+    assert client.read == 3 + 3  # b, c at the watermark, and a which is older stops the refresh
+
+    client.results["a"] = _page("a", "Weekly Report", "2022-01-06T00:00:00.000Z", archived=True)
+    index.refresh()
+    assert index.get("notes", refresh=False) is None
+    assert index.find("weekly report", refresh=False) == []
@@ -0,0 +1,127 @@
+import json
+
+from notion_extensions.base.props import block, common, compact
+from notion_extensions.base.utils import dumps
+
+
+def test_compact_matches_dict_model():
+    paragraph = block.Paragraph(common.Text("a", bold=True), common.Text("b", link="https://example.com"))
+    compact_paragraph = compact.Paragraph(
+        compact.Text("a", bold=True), compact.Text("b", link="https://example.com")
+    )
+    expected = json.loads(json.dumps(paragraph))
+    expected.pop("object")
+    assert compact_paragraph.to_dict() == expected
+
+    toggle = json.loads(json.dumps(block.Toggle(common.Text("a"))))
+    toggle.pop("object", None)
+    assert compact.Toggle(compact.Text("a")).to_dict() == toggle
+    assert dumps(compact.Toggle(compact.Text("a")), omit_defaults=True) == dumps(
+        block.Toggle(common.Text("a")), omit_defaults=True
+    )
+
+
+def test_compact_children_is_materialized_by_dumps():
+    children = compact.Children(compact.Divider(), compact.Equation("e=mc^2"))
+    body = {}
+    body.update(children)
+    assert json.loads(dumps(body)) == {
+        "children": [
+            {"type": "divider", "divider": {}},
+            {"type": "equation", "equation": {"expression": "e=mc^2"}},
+        ]
+    }
+
+
+def test_annotations_are_interned_and_immutable():
+    annotations = common.Annotations(bold=True)
+    assert annotations is common.Annotations(bold=True)
+    assert annotations.replace(bold=False) is common.Annotations()
+
+    text = common.Text("a")
+    text.bold = True
+    assert text["annotations"] is annotations["annotations"]
+    try:
+        text["annotations"]["italic"] = True
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("annotations must be immutable")
+
+
+def test_omit_defaults():
+    paragraph = block.Paragraph(common.Text("a"), common.Text("b", bold=True))
+    expected = {
+        "type": "paragraph",
+        "paragraph": {
+            "text": [
+                {"type": "text", "text": {"content": "a"}},
+                {"type": "text", "text": {"content": "b"}, "annotations": {"bold": True}},
+            ]
+        },
+    }
+    assert json.loads(dumps(paragraph, omit_defaults=True)) == expected
+    compact_paragraph = compact.Paragraph(compact.Text("a"), compact.Text("b", bold=True))
+    assert json.loads(dumps(compact_paragraph, omit_defaults=True)) == expected
+    assert len(dumps(paragraph, omit_defaults=True)) < len(dumps(paragraph))
+
+    body = {"properties": {"Name": {"title": [compact.Text("a")]}}}  # a bare compact text in a body
+    for merge_texts in (False, True):
+        assert json.loads(dumps(body, omit_defaults=True, merge_texts=merge_texts)) == {
+            "properties": {"Name": {"title": [{"type": "text", "text": {"content": "a"}}]}}
+        }
+
+
+def test_merge_runs():
+    texts = [common.Text("a"), common.Text("b"), common.Text("c", bold=True), common.Text("d")]
+    rich_text = common.RichText(*texts, merge=True)
+    assert [t.text for t in rich_text[rich_text.key]] == ["ab", "c", "d"]
+    assert texts[0].text == "a"
+
+    paragraph = block.Paragraph(*texts)
+    body = json.loads(dumps(paragraph, merge_texts=True))
+    assert [t["text"]["content"] for t in body["paragraph"]["text"]] == ["ab", "c", "d"]
+
+    compact_paragraph = compact.Paragraph(compact.Text("a"), compact.Text("b"))
+    body = json.loads(dumps(compact_paragraph, merge_texts=True))
+    assert [t["text"]["content"] for t in body["paragraph"]["text"]] == ["ab"]
+
+    long_texts = [common.Text("x" * 1500), common.Text("y" * 600)]
+    assert len(common.merge_runs(long_texts)) == 2
+
+
+def test_split_oversized_runs_and_blocks():
+    rich_text = common.RichText(common.Text("x" * 4500, bold=True))
+    assert [len(t["text"]["content"]) for t in rich_text["rich_text"]] == [2000, 2000, 500]
+    assert all(t["annotations"]["bold"] for t in rich_text["rich_text"])
+
+    texts = [common.Text(str(i)) for i in range(250)]
+    children = block.Children(block.Toggle(*texts, children=block.Children(block.Divider())))
+    toggles = children["children"]
+    assert [len(t["toggle"]["text"]) for t in toggles] == [100, 100, 50]
+    assert ["children" in t["toggle"] for t in toggles] == [False, False, True]
+
+    compact_children = compact.Children(compact.Code(*(compact.Text(str(i)) for i in range(101))))
+    assert [len(b["code"]["text"]) for b in json.loads(dumps(compact_children))["children"]] == [100, 1]
+
+
+def test_table_from_rows_and_columns():
+    rows = [["1", "a"], ["2", "b"]]
+    table = block.Table(
+        2,
+        *(block.TableRow(*(common.RichText(common.Text(c)) for c in row)) for row in rows),
+    )
+    assert json.dumps(block.Table.from_rows(rows)) == json.dumps(table)
+    assert json.dumps(block.Table.from_columns([["1", "2"], ["a", "b"]])) == json.dumps(table)
+
+    table = block.Table.from_columns({"id": [1, None], "name": ["x", float("nan")]}, has_column_header=True)
+    cells = [row["table_row"]["cells"] for row in table["table"]["children"]]
+    assert [[[t["text"]["content"] for t in cell] for cell in row] for row in cells] == [
+        [["id"], ["name"]],
+        [["1"], ["x"]],
+        [[], []],
+    ]
+
+    head, batches = block.Table.from_rows([[str(i)] for i in range(250)]).stream()
+    assert len(head["table"]["children"]) == 100
+    assert [len(batch["children"]) for batch in batches] == [100, 50]
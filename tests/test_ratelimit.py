@@ -0,0 +1,29 @@
+import multiprocessing
+
+from notion_extensions.base.ratelimit import RateLimiter, SharedRateLimiter
+
+
+def test_rate_limiter_spreads_requests():
+    limiter = RateLimiter(rate=100, burst=1)
+    assert limiter.reserve() == 0.0
+    assert 0 < limiter.reserve() <= 0.01
+    assert 0.01 < limiter.reserve() <= 0.02
+
+
+def _reserve_shared(path, count):
+    limiter = SharedRateLimiter(path, rate=0.001, burst=30)
+    for _ in range(count):
+        assert limiter.reserve() == 0.0
+
+
+def test_shared_rate_limiter_spans_processes(tmp_path):
+    path = str(tmp_path / "ratelimit.db")
+    workers = [multiprocessing.Process(target=_reserve_shared, args=(path, 10)) for _ in range(3)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert all(worker.exitcode == 0 for worker in workers)
+    limiter = SharedRateLimiter(path, rate=0.001, burst=30)
+    assert limiter.tokens < 0.1  # 30 tokens were taken from one bucket, jointly
+    assert 990 < limiter.reserve() <= 1000  # the next token is a refill of 1000 seconds away
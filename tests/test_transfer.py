@@ -0,0 +1,144 @@
+import threading
+
+from notion_extensions.base.transfer import DatabaseExporter, DatabaseImporter, PageExporter
+
+
+class FakeClient:
+    """
+    Records requests instead of sending them
+    """
+
+    def __init__(self, properties):
+        self.properties = properties
+        self.created = []
+        self.lock = threading.Lock()
+
+    def get_database(self, *, database_id):
+        return 200, {"id": database_id, "properties": self.properties}
+
+    def create_page(self, *, parent_id, parent_type, properties):
+        with self.lock:
+            self.created.append(properties)
+            return 200, {"id": f"page-{len(self.created)}"}
+
+
+def test_import_csv(tmp_path):
+    path = tmp_path / "rows.csv"
+    path.write_text("Name,Score,Tags,Done\na,1.5,\"x, y\",yes\nb,oops,,no\nc,,z,\n")
+    client = FakeClient(
+        {
+            "Name": {"type": "title"},
+            "Score": {"type": "number"},
+            "Tags": {"type": "multi_select"},
+            "Done": {"type": "checkbox"},
+        }
+    )
+    results = list(DatabaseImporter(client, "db", workers=2).import_csv(str(path), chunk_size=2))
+    assert [r.row for r in results] == [0, 1, 2]
+    assert [r.ok for r in results] == [True, False, True]
+    assert "Score" in results[1].error
+    first = next(p for p in client.created if p["Name"]["title"][0]["text"]["content"] == "a")
+    assert first["Score"] == {"number": 1.5}
+    assert first["Tags"] == {"multi_select": [{"name": "x"}, {"name": "y"}]}
+    assert first["Done"] == {"checkbox": True}
+
+
+def test_import_csv_missing_columns(tmp_path):
+    path = tmp_path / "rows.csv"
+    path.write_text("Name,Score\na,1\n")
+    client = FakeClient({"Name": {"type": "title"}, "Score": {"type": "number"}})
+    importer = DatabaseImporter(client, "db", columns={"Name": "Name", "Points": "Score"})
+    try:
+        list(importer.import_csv(str(path)))
+    except ValueError as e:
+        assert "Points" in str(e)
+    else:
+        raise AssertionError("ValueError is not raised")
+    assert client.created == []
+
+
+class FakeQueryClient:
+    def __init__(self, pages):
+        self.pages = pages
+        self.fetched = 0
+
+    def get_database(self, *, database_id):
+        self.fetched += 1
+        return 200, {"properties": {"Name": {"type": "title"}, "Tags": {"type": "multi_select"}}}
+
+    def iter_database_query(self, *, database_id, filter=None, sorts=None):
+        yield from self.pages
+
+
+def test_export_columns():
+    pages = [
+        {
+            "id": str(i),
+            "properties": {
+                "Name": {"type": "title", "title": [{"plain_text": f"n{i}"}]},
+                "Tags": {"type": "multi_select", "multi_select": [{"name": "x"}]},
+                "Total": {"type": "formula", "formula": {"type": "number", "number": i * 2}},
+            },
+        }
+        for i in range(5)
+    ]
+    exporter = DatabaseExporter(FakeQueryClient(pages), "db", columns=["Name", "Tags", "Total", "Missing"])
+    assert [len(batch["id"]) for batch in exporter.iter_batches(batch_size=2)] == [2, 2, 1]
+    columns = exporter.to_columns()
+    assert columns["Name"] == ["n0", "n1", "n2", "n3", "n4"]
+    assert columns["Tags"][0] == ["x"]
+    assert columns["Total"][4] == 8
+    assert columns["Missing"] == [None] * 5
+
+
+def test_export_fetches_database_once():
+    client = FakeQueryClient([])
+    columns = DatabaseExporter(client, "db").to_columns()
+    assert columns == {"id": [], "Name": [], "Tags": []}
+    assert client.fetched == 1
+
+
+class FakePageClient:
+    def __init__(self, children):
+        self.children = children
+
+    def get_page(self, *, page_id):
+        if page_id not in self.children:
+            return 404, {"message": "not found"}
+        title = [{"plain_text": f"Page {page_id}"}]
+        return 200, {"id": page_id, "properties": {"Name": {"type": "title", "title": title}}}
+
+    def iter_block_children(self, *, block_id):
+        yield from self.children.get(block_id, [])
+
+
+def _paragraph(id_, text, has_children=False):
+    texts = [{"plain_text": text, "annotations": {"bold": True}}]
+    return {"id": id_, "type": "paragraph", "has_children": has_children, "paragraph": {"text": texts}}
+
+
+def test_export_pages():
+    client = FakePageClient(
+        {
+            "p1": [_paragraph("b1", "hello", has_children=True)],
+            "b1": [{"id": "b2", "type": "bulleted_list_item", "bulleted_list_item": {"text": []}}],
+            "p2": [{"id": "b3", "type": "divider", "divider": {}}],
+        }
+    )
+    results = {r.page_id: r for r in PageExporter(client, render_workers=0).export(["p1", "p2", "p3"])}
+    assert results["p1"].content == "# Page p1\n\n**hello**\n\n- \n"
+    assert results["p2"].title == "Page p2"
+    assert not results["p3"].ok
+
+    results = {r.page_id: r for r in PageExporter(client, format="html", render_workers=1).export(["p1"])}
+    assert "<p><strong>hello</strong></p>" in results["p1"].content
+    assert "<ul>\n<li></li>\n</ul>" in results["p1"].content
+
+
+def test_export_pages_to_files(tmp_path):
+    page_id = "0123456789abcdef0123456789abcdef"
+    url = f"https://www.notion.so/workspace/Title-{page_id}"
+    client = FakePageClient({url: [{"id": "b1", "type": "divider", "divider": {}}]})
+    results = list(PageExporter(client, render_workers=0).export_to(str(tmp_path), [url]))
+    assert [r.ok for r in results] == [True]
+    assert [p.name for p in tmp_path.iterdir()] == ["01234567-89ab-cdef-0123-456789abcdef.md"]
@@ -0,0 +1,57 @@
+from notion_extensions.base.props import block, common, compact
+from notion_extensions.base.validation import ValidationError, assert_valid, partition, validate
+
+
+def test_valid_children():
+    children = block.Children(
+        block.Paragraph(common.Text("a")),
+        block.Code(common.Text("print(1)"), language="python"),
+        compact.Divider(),
+    )
+    assert validate(children) == []
+
+
+def test_invalid_children():
+    row = block.TableRow(common.RichText(common.Text("a")))
+    table = block.Table(1, row)
+    table["table"]["table_width"] = 2
+    children = block.Children(
+        block.Code(common.Text("x"), language="cobol"),
+        table,
+        block.Toggle(
+            common.Text("a"),
+            children=block.Children(
+                block.Toggle(common.Text("b"), children=block.Children(block.Divider()))
+            ),
+        ),
+    )
+    paths = [issue.path for issue in validate(children)]
+    assert paths == [
+        "children[0].code.language",
+        "children[1].table.children[0].table_row.cells",
+        "children[2].toggle.children[0].toggle.children",
+    ]
+    try:
+        assert_valid(children)
+    except ValidationError as e:
+        assert len(e.issues) == 3
+    else:
+        raise AssertionError("ValidationError must be raised")
+
+
+def test_partition():
+    blocks = [compact.Paragraph(compact.Text("a")), compact.Code(compact.Text("b"), language="cobol")]
+    valid, invalid = partition(blocks)
+    assert valid == blocks[:1]
+    assert invalid[0][0] is blocks[1]
+
+
+def test_malformed_rich_text_is_reported():
+    texts = [{"type": "text"}, {"type": "equation", "equation": None}, {"type": "text", "text": {"content": 1}}]
+    body = {"children": [{"type": "paragraph", "paragraph": {"text": texts}}]}
+    paths = [issue.path for issue in validate(body)]
+    assert paths == [
+        "children[0].paragraph.text[0].text",
+        "children[0].paragraph.text[1].equation",
+        "children[0].paragraph.text[2].text.content",
+    ]
@@ -0,0 +1,127 @@
+import json
+import threading
+
+from notion_extensions.base.props import block, common, compact
+from notion_extensions.base.writer import BlockWriter
+
+PARENT = "0123456789abcdef0123456789abcdef"
+_TIMER = threading.Timer
+
+
+class Response:
+    def __init__(self, status_code, body):
+        self.status_code = status_code
+        self.body = body
+
+    def json(self):
+        return self.body
+
+
+class FakeClient:
+    validate = False
+    omit_defaults = False
+    merge_texts = False
+    base_url = "https://api.notion.com/v1"
+
+    def __init__(self, statuses=()):
+        self.bodies = []
+        self.statuses = list(statuses)  # status codes of the first requests, then 200
+
+    def _request(self, method, url, **kwargs):
+        status_code = self.statuses.pop(0) if self.statuses else 200
+        if status_code != 200:
+            return Response(status_code, {"message": "failed"})
+        self.bodies.append(json.loads(kwargs["data"]))
+        return Response(200, {"results": []})
+
+
+class FakeTimers:
+    """
+    Stand-in of threading.Timer whose timers fire only when the test calls `fire`
+    """
+
+    def __init__(self):
+        self.timers = []
+
+    def __call__(self, interval, function):
+        timer = _TIMER(interval, function)
+        timer.start = lambda: None  # started by the test
+        self.timers.append(timer)
+        return timer
+
+    def fire(self):
+        for timer in self.timers:
+            if not timer.finished.is_set():  # not cancelled
+                timer.finished.set()
+                timer.function()
+
+
+def test_flush_by_count_and_close():
+    client = FakeClient()
+    with BlockWriter(client, PARENT, max_delay=None) as writer:
+        for i in range(150):
+            writer.write(block.Paragraph(common.Text(str(i))))
+        writer.write(compact.Paragraph(compact.Text("last")))
+        assert [len(body["children"]) for body in client.bodies] == [100]
+    assert [len(body["children"]) for body in client.bodies] == [100, 51]
+    contents = [b["paragraph"]["text"][0]["text"]["content"] for body in client.bodies for b in body["children"]]
+    assert contents == [str(i) for i in range(150)] + ["last"]
+
+
+def test_flush_by_bytes_and_time(monkeypatch):
+    timers = FakeTimers()
+    monkeypatch.setattr(threading, "Timer", timers)
+    client = FakeClient()
+    writer = BlockWriter(client, PARENT, max_bytes=1000, max_delay=0.05)
+    for i in range(5):
+        writer.write(block.Paragraph(common.Text("x" * 200)))
+    assert len(client.bodies) >= 1 and all(len(body["children"]) <= 3 for body in client.bodies)
+    assert writer.pending > 0 and [timer.interval for timer in timers.timers] == [0.05]
+    timers.fire()  # max_delay has passed
+    assert writer.pending == 0
+    assert sum(len(body["children"]) for body in client.bodies) == 5
+
+
+def _flush_error(writer):
+    try:
+        writer.flush()
+    except ValueError as e:
+        return str(e)
+    raise AssertionError("ValueError is not raised")
+
+
+def test_failed_batches_are_kept_or_dropped():
+    client = FakeClient(statuses=[503, 400])
+    writer = BlockWriter(client, PARENT, max_delay=None)
+    writer.write(*[block.Paragraph(common.Text(str(i))) for i in range(3)])
+    assert "503" in _flush_error(writer)
+    assert writer.pending == 3  # kept for the next flush
+    error = _flush_error(writer)
+    assert "400" in error and "3 blocks are dropped" in error
+    assert writer.pending == 0
+    writer.write(block.Paragraph(common.Text("next")))
+    writer.close()
+    assert [len(body["children"]) for body in client.bodies] == [1]
+
+
+def test_close_stops_the_writer_if_the_flush_fails(monkeypatch):
+    timers = FakeTimers()
+    monkeypatch.setattr(threading, "Timer", timers)
+    client = FakeClient(statuses=[400])
+    writer = BlockWriter(client, PARENT, max_delay=0.05)
+    writer.write(block.Paragraph(common.Text("x")))
+    try:
+        writer.close()
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("ValueError is not raised")
+    try:
+        writer.write(block.Paragraph(common.Text("y")))
+    except ValueError as e:
+        assert "closed" in str(e)
+    else:
+        raise AssertionError("ValueError is not raised")
+    assert all(timer.finished.is_set() for timer in timers.timers)  # cancelled
+    timers.fire()
+    assert client.bodies == []